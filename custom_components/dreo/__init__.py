@@ -9,7 +9,17 @@ from .const import (
     DOMAIN,
     PYDREO_MANAGER,
     DREO_PLATFORMS,
+    DREO_DISCOVERY,
+    DEVICE_LIST_REFRESH_INTERVAL,
+    SERVICE_UPDATE_DEVS,
+    DREO_STATE_WRITER,
+    DREO_CACHE_STORE,
+    CACHE_STORAGE_KEY,
+    CACHE_STORAGE_VERSION,
+    SESSION_STORAGE_KEY,
+    SESSION_STORAGE_VERSION,
     CONF_AUTO_RECONNECT,
+    CONF_COMMAND_COALESCE_WINDOW,
     DEBUG_TEST_MODE,
     DEBUG_TEST_MODE_DIRECTORY_NAME,
     DEBUG_TEST_MODE_DEVICES_FILE_NAME
@@ -30,10 +40,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         _LOGGER.debug("auto_reconnect is None.  Default to True")
         auto_reconnect = True
 
+    # Window is configured in milliseconds; 0 disables command coalescing.
+    command_coalesce_window = config_entry.options.get(CONF_COMMAND_COALESCE_WINDOW, 0)
+
     region = "us"
 
     from .pydreo import PyDreo  # pylint: disable=C0415
-    from .pydreo.constant import DreoDeviceType # pylint: disable=C0415
+    from .dreobasedevice import DreoStateWriter # pylint: disable=C0415
 
     if DEBUG_TEST_MODE:
         _LOGGER.error("DEBUG_TEST_MODE is True!")
@@ -48,82 +61,106 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                              debug_test_mode=True, 
                              debug_test_mode_payload=debug__test_mode_payload)
     else:
-        pydreo_manager = PyDreo(username, password, region)
+        pydreo_manager = PyDreo(username,
+                                password,
+                                region,
+                                client_session=async_get_clientsession(hass))
         pydreo_manager.auto_reconnect = auto_reconnect
+        pydreo_manager.command_coalesce_window = command_coalesce_window / 1000
 
-    login = await hass.async_add_executor_job(pydreo_manager.login)
+    # Reuse the access token from the last start while it is valid.  PyDreo logs in again
+    # if the token is rejected, and the new session is saved.
+    session_store = Store(hass, SESSION_STORAGE_VERSION, SESSION_STORAGE_KEY.format(config_entry.entry_id),
+                          private=True)
+    restored_session = False
+    if not DEBUG_TEST_MODE:
+        restored_session = pydreo_manager.restore_session(await session_store.async_load())
 
-    if not login:
-        _LOGGER.error("Unable to login to the dreo server")
-        return False
+        @callback
+        def _save_session(session: dict) -> None:
+            session_store.async_delay_save(lambda: session, 0)
 
-    load_devices = await hass.async_add_executor_job(pydreo_manager.load_devices)
+        pydreo_manager.session_update_callback = (
+            lambda session: hass.loop.call_soon_threadsafe(_save_session, session))
 
-    if not load_devices:
-        _LOGGER.error("Unable to load devices from the dreo server")
-        return False
+    if not restored_session:
+        login = await pydreo_manager.async_login()
+
+        if not login:
+            _LOGGER.error("Unable to login to the dreo server")
+            return False
+
+    # Start from the cached device list and state if there is one, and bring it up to date
+    # in the background once the entities exist.
+    # The cache holds device serial numbers and account details, so keep it private like the session.
+    cache_store = Store(hass, CACHE_STORAGE_VERSION, CACHE_STORAGE_KEY.format(config_entry.entry_id),
+                        private=True)
+    loaded_from_cache = False
+    if not DEBUG_TEST_MODE:
+        cache = await cache_store.async_load()
+        if cache is not None:
+            loaded_from_cache = await hass.async_add_executor_job(pydreo_manager.load_devices_from_cache, cache)
+            if not loaded_from_cache:
+                _LOGGER.debug("Device cache could not be used; loading devices from the dreo server")
+
+    if not loaded_from_cache:
+        load_devices = await pydreo_manager.async_load_devices()
+
+        if not load_devices:
+            _LOGGER.error("Unable to load devices from the dreo server")
+            return False
 
-    _LOGGER.debug("Checking for supported installed device types")
-    device_types = set()
-    for device in pydreo_manager.devices:
-        device_types.add(device.type)   
-    _LOGGER.debug("Device types found are: %s", device_types)
     _LOGGER.info("%d Dreo devices found", len(pydreo_manager.devices))
 
     platforms = set()
-    if (DreoDeviceType.TOWER_FAN in device_types or 
-        DreoDeviceType.AIR_CIRCULATOR in device_types or
-        DreoDeviceType.AIR_PURIFIER in device_types or
-        DreoDeviceType.CEILING_FAN in device_types):
-        platforms.add(Platform.FAN)
-        platforms.add(Platform.SENSOR)
-        platforms.add(Platform.SWITCH)
-        platforms.add(Platform.NUMBER)
-
-    if (DreoDeviceType.CEILING_FAN in device_types):
-        platforms.add(Platform.LIGHT)
-
-    if (DreoDeviceType.HEATER in device_types or 
-        DreoDeviceType.AIR_CONDITIONER in device_types):
-        platforms.add(Platform.CLIMATE)
-        platforms.add(Platform.SENSOR)
-        platforms.add(Platform.SWITCH)
-        platforms.add(Platform.NUMBER)
-
-    if (DreoDeviceType.HUMIDIFIER in device_types):
-        platforms.add(Platform.HUMIDIFIER)
-        platforms.add(Platform.SENSOR)
-        platforms.add(Platform.SWITCH)
-        platforms.add(Platform.NUMBER)
-
-    if (DreoDeviceType.DEHUMIDIFIER in device_types):
-        platforms.add(Platform.HUMIDIFIER)
-        platforms.add(Platform.FAN)
-        platforms.add(Platform.SENSOR)
-        platforms.add(Platform.SWITCH)
-        platforms.add(Platform.NUMBER)
-
-    if (DreoDeviceType.CHEF_MAKER in device_types):
-        platforms.add(Platform.SENSOR)
-        platforms.add(Platform.SWITCH)
-        platforms.add(Platform.NUMBER)
-
-    if (DreoDeviceType.EVAPORATIVE_COOLER in device_types):
-        platforms.add(Platform.FAN)
-        platforms.add(Platform.SENSOR)
-        platforms.add(Platform.SWITCH)
-        platforms.add(Platform.NUMBER)
+    for device in pydreo_manager.devices:
+        platforms.update(_device_platforms(device))
 
     pydreo_manager.start_transport()
 
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][PYDREO_MANAGER] = pydreo_manager
     hass.data[DOMAIN][DREO_PLATFORMS] = platforms
+    hass.data[DOMAIN][DREO_STATE_WRITER] = DreoStateWriter(hass.loop)
+    hass.data[DOMAIN][DREO_CACHE_STORE] = cache_store
 
     _LOGGER.debug("Platforms are: %s", platforms)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
 
+    if loaded_from_cache:
+        async def _async_refresh_devices():
+            """Bring the cached devices up to date; entities update as their state changes."""
+            changed = await pydreo_manager.async_refresh_devices()
+            _LOGGER.debug("Refreshed cached devices; %d changed", len(changed))
+            await cache_store.async_save(pydreo_manager.export_cache())
+
+        config_entry.async_create_background_task(hass, _async_refresh_devices(), "dreo_refresh_devices")
+    elif not DEBUG_TEST_MODE:
+        await cache_store.async_save(pydreo_manager.export_cache())
+
+    if not DEBUG_TEST_MODE:
+        # Add devices that join the account and remove devices that leave it without
+        # reloading the entry.  The device list is checked periodically and on request.
+        @callback
+        def _devices_changed(added: list, removed: list) -> None:
+            config_entry.async_create_background_task(
+                hass, _async_update_devices(hass, config_entry, added, removed), "dreo_update_devices")
+
+        pydreo_manager.device_list_callback = (
+            lambda added, removed: hass.loop.call_soon_threadsafe(_devices_changed, added, removed))
+
+        async def _async_refresh_device_list(_now=None) -> None:
+            await pydreo_manager.async_refresh_device_list()
+
+        async def _async_handle_update_devices(_call: ServiceCall) -> None:
+            await _async_refresh_device_list()
+
+        hass.services.async_register(DOMAIN, SERVICE_UPDATE_DEVS, _async_handle_update_devices)
+        config_entry.async_on_unload(lambda: hass.services.async_remove(DOMAIN, SERVICE_UPDATE_DEVS))
+        config_entry.async_on_unload(
+            async_track_time_interval(hass, _async_refresh_device_list, DEVICE_LIST_REFRESH_INTERVAL))
+
     async def _update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
         """Handle options update."""
         await hass.config_entries.async_reload(config_entry.entry_id)
@@ -133,14 +170,59 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     return True
 
+def _device_platforms(device) -> set[Platform]:
+    """Return the platforms with entities for a device, from its capabilities."""
+    return {Platform(platform) for platform in device.capabilities.platforms}
+
+async def _async_update_devices(hass: HomeAssistant, config_entry: ConfigEntry, added: list, removed: list) -> None:
+    """Add the entities of devices added to the account and remove the devices removed from it."""
+    if DOMAIN not in hass.data:
+        return
+
+    platforms: set = hass.data[DOMAIN][DREO_PLATFORMS]
+    added_by_platform: dict = {}
+    for device in added:
+        for platform in _device_platforms(device):
+            added_by_platform.setdefault(platform, []).append(device)
+
+    # Platforms that are already set up add the new devices' entities; platforms that are
+    # not yet set up add them when they are.
+    for platform, devices in added_by_platform.items():
+        if platform in platforms:
+            async_dispatcher_send(hass, DREO_DISCOVERY.format(platform), devices)
+    new_platforms = set(added_by_platform) - platforms
+    if new_platforms:
+        # Set up platforms only under the entry's setup lock and while it is loaded, so this
+        # cannot race an unload or reload.  Otherwise the next setup adds the devices.
+        async with config_entry.setup_lock:
+            if config_entry.state is ConfigEntryState.LOADED:
+                platforms.update(new_platforms)
+                await hass.config_entries.async_forward_entry_setups(config_entry, new_platforms)
+            else:
+                _LOGGER.debug("Config entry is %s; not setting up platforms %s", config_entry.state, new_platforms)
+
+    # Removing a device from the registry also removes its entities.
+    device_registry = dr.async_get(hass)
+    for device in removed:
+        device_entry = device_registry.async_get_device(identifiers={(DOMAIN, device.serial_number)})
+        if device_entry is not None:
+            device_registry.async_update_device(device_entry.id, remove_config_entry_id=config_entry.entry_id)
+
+    _LOGGER.info("Dreo devices updated: %d added, %d removed", len(added), len(removed))
+    await hass.data[DOMAIN][DREO_CACHE_STORE].async_save(hass.data[DOMAIN][PYDREO_MANAGER].export_cache())
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     pydreo_manager = hass.data[DOMAIN][PYDREO_MANAGER]
+    if not DEBUG_TEST_MODE:
+        # Save the latest state so the next start begins from it.
+        await hass.data[DOMAIN][DREO_CACHE_STORE].async_save(pydreo_manager.export_cache())
+
     if unload_ok := await hass.config_entries.async_unload_platforms(
         config_entry,
         hass.data[DOMAIN][DREO_PLATFORMS],
     ):
         hass.data.pop(DOMAIN)
 
-    pydreo_manager.stop_transport()
+    await pydreo_manager.async_stop_transport()
     return unload_ok
@@ -11,6 +11,7 @@ from .pydreo import PyDreo, PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 from .dreoairconditioner import DreoAirConditionerHA
 from .dreoheater import DreoHeaterHA
+from .dreobasedevice import async_add_discovered_entities
 
 from .const import (
     LOGGER,
@@ -61,3 +62,5 @@ async def async_setup_entry(
         len(climate_entities_ha),
     )
     async_add_entities(climate_entities_ha)
+
+    async_add_discovered_entities(hass, config_entry, Platform.CLIMATE, get_entries, async_add_entities)
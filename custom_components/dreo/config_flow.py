@@ -7,7 +7,8 @@ import voluptuous as vol
 from .haimports import * # pylint: disable=W0401,W0614
 from .const import (
     DOMAIN,
-    CONF_AUTO_RECONNECT
+    CONF_AUTO_RECONNECT,
+    CONF_COMMAND_COALESCE_WINDOW
 )
 from .pydreo import PyDreo
 
@@ -49,8 +50,11 @@ class DreoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._username = user_input[CONF_USERNAME]
         self._password = user_input[CONF_PASSWORD]
 
-        pydreo_manager = PyDreo(self._username, self._password, "us")
-        login = await self.hass.async_add_executor_job(pydreo_manager.login)
+        pydreo_manager = PyDreo(self._username,
+                                self._password,
+                                "us",
+                                client_session=async_get_clientsession(self.hass))
+        login = await pydreo_manager.async_login()
         if not login:
             return self._show_form(errors={"base": "invalid_auth"})
 
@@ -85,9 +89,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             _LOGGER.debug("auto_reconnect not set, setting it to True")
             auto_reconnect = True
 
+        command_coalesce_window = self.config_entry.options.get(CONF_COMMAND_COALESCE_WINDOW, 0)
+
         options_schema = vol.Schema(
             {
-                vol.Required(CONF_AUTO_RECONNECT, default=auto_reconnect): bool
+                vol.Required(CONF_AUTO_RECONNECT, default=auto_reconnect): bool,
+                vol.Required(CONF_COMMAND_COALESCE_WINDOW, default=command_coalesce_window):
+                    vol.All(vol.Coerce(int), vol.Range(min=0, max=2000))
             }
         )
         return self.async_show_form(
@@ -1,4 +1,5 @@
 """Constants for Dreo Integration for HomeAssistant."""
+from datetime import timedelta
 
 LOGGER = "dreo"
 DOMAIN = "dreo"
@@ -6,8 +7,24 @@ DREO_DISCOVERY = "dreo_discovery_{}"
 SERVICE_UPDATE_DEVS = "update_devices"
 PYDREO_MANAGER = "pydreo_manager"
 DREO_PLATFORMS = "platforms"
+DREO_STATE_WRITER = "state_writer"
+DREO_CACHE_STORE = "cache_store"
+
+# Device list and last-known device state, so HA can start without waiting for the cloud.
+# {} is the config entry ID.
+CACHE_STORAGE_KEY = "dreo.{}.cache"
+CACHE_STORAGE_VERSION = 1
+
+# Access token, auth region and token expiry, so HA can start without logging in.
+# {} is the config entry ID.
+SESSION_STORAGE_KEY = "dreo.{}.session"
+SESSION_STORAGE_VERSION = 1
+
+# How often the device list is checked for devices added to or removed from the account.
+DEVICE_LIST_REFRESH_INTERVAL = timedelta(hours=1)
 
 CONF_AUTO_RECONNECT = "auto_reconnect"
+CONF_COMMAND_COALESCE_WINDOW = "command_coalesce_window"
 
 DEBUG_TEST_MODE : bool = False
 # Uncomment to enable test mode.
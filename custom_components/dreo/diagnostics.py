@@ -47,8 +47,13 @@ def _get_diagnostics(pydreo_manager: PyDreo) -> dict[str, Any]:
         DOMAIN: {
             "device_count": len(pydreo_manager.devices),
             "raw_devicelist": _redact_values(pydreo_manager.raw_response),
+            "command_acks": pydreo_manager.command_ack_stats,
+            "transport": pydreo_manager.transport_stats,
+            "message_dispatch": pydreo_manager.message_dispatch_stats,
+            "settings_cache": pydreo_manager.settings_cache_stats,
         },
-        "devices": [_redact_values(device.__dict__) for device in pydreo_manager.devices],
+        "devices": [dict(_redact_values(device.__dict__), _capabilities=device.capabilities.as_dict())
+                    for device in pydreo_manager.devices],
     }
 
     return data
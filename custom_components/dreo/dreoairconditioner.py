@@ -12,7 +12,6 @@ from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
 
 from .pydreo import (
-    PyDreoAC,
     ANGLE_OSCANGLE_MAP,
     OSCANGLE_ANGLE_MAP,
     TEMP_RANGE,
@@ -23,6 +22,7 @@ from .pydreo import (
 )
 
 from .pydreo.pydreoairconditioner import (
+    PyDreoAC,
     DREO_AC_MODE_COOL,
     DREO_AC_MODE_DRY,
 )
@@ -171,19 +171,20 @@ class DreoAirConditionerHA(DreoBaseDeviceHA, ClimateEntity):
     @property
     def preset_mode(self) -> str | None:
         """Get the current preset mode."""
-        return self.device.preset_mode
+        return self.device.state_snapshot.get("preset_mode")
 
     def set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the device."""
         _LOGGER.debug("DreoAirConditionerHA:set_preset_mode(%s) --> %s", self.device.name, preset_mode)
-        if preset_mode == PRESET_ECO:
-            self.device.mode = DREO_AC_MODE_COOL
-            self.device.preset_mode = preset_mode
-        elif preset_mode == PRESET_SLEEP:
-            self.device.mode = DREO_AC_MODE_COOL
-            self.device.preset_mode = preset_mode
-        else:
-            self.device.preset_mode = PRESET_NONE
+        with self.device.command_batch():
+            if preset_mode == PRESET_ECO:
+                self.device.mode = DREO_AC_MODE_COOL
+                self.device.preset_mode = preset_mode
+            elif preset_mode == PRESET_SLEEP:
+                self.device.mode = DREO_AC_MODE_COOL
+                self.device.preset_mode = preset_mode
+            else:
+                self.device.preset_mode = PRESET_NONE
 
         self._attr_preset_mode = preset_mode
 
@@ -220,8 +221,9 @@ class DreoAirConditionerHA(DreoBaseDeviceHA, ClimateEntity):
     def turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
         _LOGGER.debug("DreoAirConditionerHA:turn_on(%s)", self.device.name)
-        self.device.poweron = True
-        self.device.mode = HVAC_AC_MODE_MAP[self._last_hvac_mode]
+        with self.device.command_batch():
+            self.device.poweron = True
+            self.device.mode = HVAC_AC_MODE_MAP[self._last_hvac_mode]
         self.device._attr_hvac_mode = self._last_hvac_mode
 
     def turn_off(self, **kwargs: Any) -> None:
@@ -324,12 +326,15 @@ class DreoAirConditionerHA(DreoBaseDeviceHA, ClimateEntity):
 
     @property
     def hvac_mode(self):
-        # ensure hvac_mode is actually in sync with the device's mode
-        self._attr_hvac_mode = AC_MODE_MAP[self.device.mode] if self.device.poweron else HVACMode.OFF
+        # ensure hvac_mode is actually in sync with the device's mode.  Read the mode and
+        # power state from one snapshot so a report being decoded cannot be seen half applied.
+        snapshot = self.device.state_snapshot
+        mode = snapshot.get("mode")
+        self._attr_hvac_mode = AC_MODE_MAP[mode] if snapshot.get("is_on") else HVACMode.OFF
         _LOGGER.debug("DreoAirConditionerHA:hvac_mode(%s): %s (device.mode: %s)", 
                       self.device.name, 
                       self._attr_hvac_mode,
-                      self.device.mode)
+                      mode)
         return self._attr_hvac_mode
 
     @property
@@ -346,8 +351,9 @@ class DreoAirConditionerHA(DreoBaseDeviceHA, ClimateEntity):
             self.device.poweron = False
             self._attr_hvac_mode = HVACMode.OFF
         else:
-            self.device.mode = HVAC_AC_MODE_MAP[hvac_mode]
-            self.device.poweron = True
+            with self.device.command_batch():
+                self.device.mode = HVAC_AC_MODE_MAP[hvac_mode]
+                self.device.poweron = True
             self._attr_hvac_mode = hvac_mode
 
         self.schedule_update_ha_state()
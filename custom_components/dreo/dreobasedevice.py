@@ -1,12 +1,77 @@
 """BaseDevice utilities for Dreo Component."""
 
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .haimports import * # pylint: disable=W0401,W0614
 
 from .const import (
-    DOMAIN
+    LOGGER,
+    DOMAIN,
+    DREO_DISCOVERY,
+    DREO_STATE_WRITER
 )
 
+_LOGGER = logging.getLogger(LOGGER)
+
+
+@callback
+def async_add_discovered_entities(hass: HomeAssistant,
+                                  config_entry: ConfigEntry,
+                                  platform: Platform,
+                                  get_entries: Callable[[list[PyDreoBaseDevice]], list[Entity]],
+                                  async_add_entities: AddEntitiesCallback) -> None:
+    """Add this platform's entities for devices added to the account after setup."""
+
+    @callback
+    def _async_add_devices(devices: list[PyDreoBaseDevice]) -> None:
+        _LOGGER.debug("Adding %s entities for %s new devices", platform, len(devices))
+        async_add_entities(get_entries(devices))
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, DREO_DISCOVERY.format(platform), _async_add_devices))
+
+
+class DreoStateWriter:
+    """Writes entity state to HA for device updates that arrive on PyDreo's threads.
+
+    Updates are marshalled onto the event loop with one call_soon_threadsafe per
+    burst, and all updates for an entity that arrive before the loop runs are
+    written with a single async_write_ha_state."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._lock = threading.Lock()
+        # Dict rather than set so entities are written in the order they changed.
+        self._pending: dict[Entity, None] = {}
+
+    def schedule_write(self, entity: Entity) -> None:
+        """Write the entity's state on the next loop iteration.  Safe to call from any thread."""
+        with self._lock:
+            scheduled = bool(self._pending)
+            self._pending[entity] = None
+        if scheduled:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._write_pending)
+        except RuntimeError:
+            # The loop has been closed during shutdown; there is nothing left to update.
+            _LOGGER.debug("DreoStateWriter: event loop closed, dropping state writes")
+
+    @callback
+    def _write_pending(self) -> None:
+        with self._lock:
+            entities, self._pending = self._pending, {}
+        for entity in entities:
+            # An entity removed after its update was scheduled has nothing to write to.
+            if entity.hass is None:
+                continue
+            entity.async_write_ha_state()
+
+
 class DreoBaseDeviceHA(Entity):
     """Base class for Dreo Entity Representations."""
 
@@ -40,15 +105,30 @@ class DreoBaseDeviceHA(Entity):
     def should_poll(self):
         return False
 
+    @property
+    def pydreo_attr_names(self) -> tuple[str, ...] | None:
+        """Names of the PyDreo device attributes this entity shows, or None if it shows the whole device."""
+        return None
+
     async def async_added_to_hass(self):
         """Register callbacks."""
 
         # Create a callback to update state in HA and add it a callback in
-        # the PyDreo device. This will cause all handle_server_update responses
-        # to update the state in HA.
-        @callback
+        # the PyDreo device. This will cause handle_server_update responses
+        # that change the attributes this entity shows to update the state in HA.
+        # The callback runs on PyDreo's dispatch thread, so the write is handed to
+        # the loop, and the entity's properties read the PyDreo device directly
+        # so no refresh is needed before writing.
+        state_writer: DreoStateWriter = self.hass.data[DOMAIN][DREO_STATE_WRITER]
+
         def update_state():
-            # Tell HA we're ready to update
-            self.schedule_update_ha_state(True)
+            state_writer.schedule_write(self)
+
+        attr_names = self.pydreo_attr_names
+        if attr_names is None:
+            remove_callback = self.pydreo_device.add_attr_callback(update_state)
+        else:
+            remove_callback = self.pydreo_device.subscribe(attr_names, update_state)
 
-        self.pydreo_device.add_attr_callback(update_state)
+        # Unregister on removal so that reloading the integration does not leak callbacks.
+        self.async_on_remove(remove_callback)
@@ -112,18 +112,19 @@ class DreoFanHA(DreoBaseDeviceHA, FanEntity):
             self.device.is_on = False
             return
 
-        if not self.device.is_on:
-            self.device.is_on = True
-
-        if self.device.type is DreoDeviceType.DEHUMIDIFIER:
-            if percentage <= 33:
-                self.device.set_preset_mode("Low")
-            elif percentage <= 67:
-                self.device.set_preset_mode("Medium")
+        with self.device.command_batch():
+            if not self.device.is_on:
+                self.device.is_on = True
+
+            if self.device.type is DreoDeviceType.DEHUMIDIFIER:
+                if percentage <= 33:
+                    self.device.set_preset_mode("Low")
+                elif percentage <= 67:
+                    self.device.set_preset_mode("Medium")
+                else:
+                    self.device.set_preset_mode("High")
             else:
-                self.device.set_preset_mode("High")
-        else:
-            self.device.fan_speed = math.ceil(percentage_to_ranged_value(self.device.speed_range, percentage))
+                self.device.fan_speed = math.ceil(percentage_to_ranged_value(self.device.speed_range, percentage))
         
         self.schedule_update_ha_state()
 
@@ -135,13 +136,14 @@ class DreoFanHA(DreoBaseDeviceHA, FanEntity):
                 f"{self.preset_modes}"
             )
 
-        if not self.device.is_on:
-            self.device.is_on = True
+        with self.device.command_batch():
+            if not self.device.is_on:
+                self.device.is_on = True
 
-        if self.device.type is DreoDeviceType.DEHUMIDIFIER:
-            self.device.set_preset_mode(preset_mode)
-        else:
-            self.device.preset_mode = preset_mode
+            if self.device.type is DreoDeviceType.DEHUMIDIFIER:
+                self.device.set_preset_mode(preset_mode)
+            else:
+                self.device.preset_mode = preset_mode
 
         self.schedule_update_ha_state()
 
@@ -10,8 +10,8 @@ import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
+from .pydreo.pydreoheater import PyDreoHeater
 from .pydreo import (
-    PyDreoHeater,
     HEATER_MODE_OFF,
     HEATER_MODE_COOLAIR,
     HEATER_MODE_HOTAIR,
@@ -178,8 +178,9 @@ class DreoHeaterHA(DreoBaseDeviceHA, ClimateEntity):
     def turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
         _LOGGER.debug("DreoHeaterHA:turn_on(%s)", self.device.name)
-        self.device.poweron = True
-        self.device.mode = HVAC_MODE_MAP[self._last_hvac_mode]
+        with self.device.command_batch():
+            self.device.poweron = True
+            self.device.mode = HVAC_MODE_MAP[self._last_hvac_mode]
         self.device._attr_hvac_mode = self._last_hvac_mode
 
     def turn_off(self, **kwargs: Any) -> None:
@@ -194,17 +195,18 @@ class DreoHeaterHA(DreoBaseDeviceHA, ClimateEntity):
             "DreoHeaterHA:set_preset_mode(%s) --> %s", self.device.name, preset_mode
         )
         self._last_hvac_mode = self._attr_hvac_mode
-        if not self.device.poweron:
-            self.device.poweron = True
+        with self.device.command_batch():
+            if not self.device.poweron:
+                self.device.poweron = True
 
-        if preset_mode not in self.preset_modes:
-            raise ValueError(
-                f"{preset_mode} is not one of the valid preset modes: {self.preset_modes}"
-            )
+            if preset_mode not in self.preset_modes:
+                raise ValueError(
+                    f"{preset_mode} is not one of the valid preset modes: {self.preset_modes}"
+                )
 
-        self.device.preset_mode = preset_mode
-        self.device.htalevel = MODE_LEVEL_MAP[preset_mode]
-        self.device.mode = HEATER_MODE_HOTAIR
+            self.device.preset_mode = preset_mode
+            self.device.htalevel = MODE_LEVEL_MAP[preset_mode]
+            self.device.mode = HEATER_MODE_HOTAIR
 
     @oscon.setter
     def oscon(self, oscon: bool) -> None:
@@ -293,12 +295,13 @@ class DreoHeaterHA(DreoBaseDeviceHA, ClimateEntity):
             HVAC_MODE_MAP[hvac_mode],
         )
         self._last_hvac_mode = self._attr_hvac_mode
-        self.device.mode = HVAC_MODE_MAP[hvac_mode]
+        with self.device.command_batch():
+            self.device.mode = HVAC_MODE_MAP[hvac_mode]
 
-        if hvac_mode != HVACMode.OFF:
-            self.device.poweron = True
-        else:
-            self.device.poweron = False
+            if hvac_mode != HVACMode.OFF:
+                self.device.poweron = True
+            else:
+                self.device.poweron = False
 
     @property
     def swing_modes(self) -> list[str] | None:
@@ -6,6 +6,7 @@ from .haimports import * # pylint: disable=W0401,W0614
 from .pydreo import PyDreo, PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 from .dreofan import DreoFanHA 
+from .dreobasedevice import async_add_discovered_entities
 
 from .const import (
     LOGGER,
@@ -47,3 +48,5 @@ async def async_setup_entry(
 
     _LOGGER.debug("Fan:async_setup_entry: Adding Fans (%s)", len(fan_entities_ha))
     async_add_entities(fan_entities_ha)
+
+    async_add_discovered_entities(hass, config_entry, Platform.FAN, get_entries, async_add_entities)
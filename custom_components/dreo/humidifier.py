@@ -9,9 +9,11 @@ from homeassistant.components.humidifier import (
 )
 
 from .haimports import * # pylint: disable=W0401,W0614
-from .pydreo import PyDreo, PyDreoBaseDevice, PyDreoHumidifier, PyDreoDehumidifier
+from .pydreo import PyDreo, PyDreoBaseDevice
+from .pydreo.pydreohumidifier import PyDreoHumidifier
+from .pydreo.pydreodehumidifier import PyDreoDehumidifier
 from .pydreo.constant import DreoDeviceType
-from .dreobasedevice import DreoBaseDeviceHA
+from .dreobasedevice import DreoBaseDeviceHA, async_add_discovered_entities
 
 from .const import (
     LOGGER,
@@ -52,6 +54,8 @@ async def async_setup_entry(
     _LOGGER.debug("Humidifier:async_setup_entry: Adding Humidifiers (%s)", len(humidifier_entities_ha))
     async_add_entities(humidifier_entities_ha)
 
+    async_add_discovered_entities(hass, config_entry, Platform.HUMIDIFIER, get_entries, async_add_entities)
+
 # Implementation of the Humidifier
 class DreoHumidifierHA(DreoBaseDeviceHA, HumidifierEntity):
     """Representation of a Dreo Humidifier entity."""
@@ -131,15 +135,16 @@ class DreoHumidifierHA(DreoBaseDeviceHA, HumidifierEntity):
             "DreoHumidiferHA:set_mode(%s) --> %s", self.device.name, mode
         )
         
-        if not self.device.is_on:
-            self.device.is_on = True
+        with self.device.command_batch():
+            if not self.device.is_on:
+                self.device.is_on = True
 
-        if mode not in self.available_modes:
-            raise ValueError(
-                f"{mode} is not one of the valid preset modes: {self.available_modes}"
-            )
+            if mode not in self.available_modes:
+                raise ValueError(
+                    f"{mode} is not one of the valid preset modes: {self.available_modes}"
+                )
 
-        self.device.mode = mode
+            self.device.mode = mode
 
     def set_humidity(self, humidity: float) -> None:
         """Set the humidity level."""
@@ -249,15 +254,16 @@ class DreoDehumidifierHA(DreoBaseDeviceHA, HumidifierEntity):
             "DreoDehumidifierHA:set_mode(%s) --> %s", self.device.name, mode
         )
         
-        if not self.device.is_on:
-            self.device.is_on = True
+        with self.device.command_batch():
+            if not self.device.is_on:
+                self.device.is_on = True
 
-        if mode not in self.available_modes:
-            raise ValueError(
-                f"{mode} is not one of the valid preset modes: {self.available_modes}"
-            )
+            if mode not in self.available_modes:
+                raise ValueError(
+                    f"{mode} is not one of the valid preset modes: {self.available_modes}"
+                )
 
-        self.device.mode = mode
+            self.device.mode = mode
 
     def set_humidity(self, humidity: float) -> None:
         """Set the target humidity level."""
@@ -13,7 +13,7 @@ from .haimports import * # pylint: disable=W0401,W0614
 from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType # pylint: disable=C0415
-from .dreobasedevice import DreoBaseDeviceHA
+from .dreobasedevice import DreoBaseDeviceHA, async_add_discovered_entities
 
 from .const import (
     LOGGER,
@@ -48,6 +48,8 @@ async def async_setup_entry(
 
     async_add_entities(get_entries(pydreo_manager.devices))
 
+    async_add_discovered_entities(hass, config_entry, Platform.LIGHT, get_entries, async_add_entities)
+
 
 class DreoLightHA(DreoBaseDeviceHA, LightEntity): # pylint: disable=abstract-method
     """Representation of a Dreo Light entity."""
@@ -101,17 +103,18 @@ class DreoLightHA(DreoBaseDeviceHA, LightEntity): # pylint: disable=abstract-met
     ) -> None:
         """Turn the device on."""
         _LOGGER.debug("Turning on %s", self.pydreo_device.name)
-        setattr(self.pydreo_device, "light_on", True)
+        with self.pydreo_device.command_batch():
+            setattr(self.pydreo_device, "light_on", True)
         
-        if (ATTR_BRIGHTNESS in kwargs):
-            brightness = kwargs[ATTR_BRIGHTNESS]
-            _LOGGER.debug("Setting brightness to %s", brightness)
-            setattr(self.pydreo_device, "brightness", math.ceil(brightness_to_value((1,100), brightness)))
-
-        if (ATTR_COLOR_TEMP_KELVIN in kwargs):
-            color_temp = kwargs[ATTR_COLOR_TEMP_KELVIN]
-            _LOGGER.debug("Setting color temperature to %s", color_temp)
-            setattr(self.pydreo_device, "color_temperature", math.ceil(ranged_value_to_percentage((self.min_color_temp_kelvin,self.max_color_temp_kelvin), color_temp)))
+            if (ATTR_BRIGHTNESS in kwargs):
+                brightness = kwargs[ATTR_BRIGHTNESS]
+                _LOGGER.debug("Setting brightness to %s", brightness)
+                setattr(self.pydreo_device, "brightness", math.ceil(brightness_to_value((1,100), brightness)))
+
+            if (ATTR_COLOR_TEMP_KELVIN in kwargs):
+                color_temp = kwargs[ATTR_COLOR_TEMP_KELVIN]
+                _LOGGER.debug("Setting color temperature to %s", color_temp)
+                setattr(self.pydreo_device, "color_temperature", math.ceil(ranged_value_to_percentage((self.min_color_temp_kelvin,self.max_color_temp_kelvin), color_temp)))
 
 
     def turn_off(self, **kwargs: Any) -> None:
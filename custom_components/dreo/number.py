@@ -11,7 +11,7 @@ import logging
 from .haimports import * # pylint: disable=W0401,W0614
 from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
-from .dreobasedevice import DreoBaseDeviceHA
+from .dreobasedevice import DreoBaseDeviceHA, async_add_discovered_entities
 
 from .const import (
     LOGGER,
@@ -120,8 +120,6 @@ def get_entries(pydreo_devices : list[PyDreoBaseDevice]) -> list[DreoNumberHA]:
         number_keys : list[str] = []
         
         for number_definition in NUMBERS:
-            _LOGGER.debug("Number:get_entries: checking attribute: %s on %s", number_definition.attr_name, pydreo_device.name)
-
             if pydreo_device.is_feature_supported(number_definition.attr_name):
                 if (number_definition.key in number_keys):
                     _LOGGER.error("Number:get_entries: Duplicate number key %s", number_definition.key)
@@ -177,6 +175,8 @@ async def async_setup_entry(
 
     async_add_entities(get_entries(pydreo_manager.devices))
 
+    async_add_discovered_entities(hass, config_entry, Platform.NUMBER, get_entries, async_add_entities)
+
 
 class DreoNumberHA(DreoBaseDeviceHA, NumberEntity): # pylint: disable=abstract-method
     """Representation of a Number describing a read-only property of a Dreo device."""
@@ -204,6 +204,10 @@ class DreoNumberHA(DreoBaseDeviceHA, NumberEntity): # pylint: disable=abstract-m
             self._attr_name,
             self._attr_unique_id)
 
+    @property
+    def pydreo_attr_names(self) -> tuple[str, ...]:
+        return (self.entity_description.attr_name,)
+
     @property
     def native_value(self) -> float:
         """Return the state of the number."""
@@ -2,47 +2,104 @@
 
 # flake8: noqa
 # from .pydreo import PyDreo
+import asyncio
+import importlib
 import logging
 import threading
 import sys
+import time
 
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import chain
-from typing import Optional, Tuple
+from collections.abc import Awaitable, Callable
+from typing import Optional, Tuple, TYPE_CHECKING
 from asyncio.exceptions import CancelledError
 
 from .constant import *
 from .helpers import Helpers
 from .models import *
-from .commandtransport import CommandTransport
+from .commandtransport import CommandTransport, DEFAULT_STOP_TIMEOUT
+from .reconnectpolicy import ReconnectPolicy, ExponentialBackoffPolicy
+from .commandcoalescer import CommandCoalescer
+from .commandtracker import CommandTracker, CommandTimeoutError, DEFAULT_ACK_TIMEOUT
+from .messagedispatcher import MessageDispatcher, DEFAULT_MAX_PENDING_MESSAGES
+from .settingscache import SettingsCache, DEFAULT_SETTINGS_TTL
+from .httpsession import HttpSession, DEFAULT_POOL_SIZE, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
 from .pydreobasedevice import PyDreoBaseDevice, UnknownModelError, UnknownProductError
 from .pydreounknowndevice import PyDreoUnknownDevice
-from .pydreotowerfan import PyDreoTowerFan
-from .pydreoaircirculator import PyDreoAirCirculator
-from .pydreoceilingfan import PyDreoCeilingFan
-from .pydreoairpurifier import PyDreoAirPurifier
-from .pydreoheater import PyDreoHeater
-from .pydreoairconditioner import PyDreoAC
-from .pydreochefmaker import PyDreoChefMaker
-from .pydreohumidifier import PyDreoHumidifier
-from .pydreodehumidifier import PyDreoDehumidifier
-from .pydreoevaporativecooler import PyDreoEvaporativeCooler
+
+if TYPE_CHECKING:
+    import aiohttp
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Maximum number of devices whose state is loaded from the REST API at the same time.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Version of the format returned by export_cache().  Caches of another version are ignored.
+CACHE_VERSION = 1
+
+# A restored access token is not used if it expires within this many seconds.
+TOKEN_EXPIRY_MARGIN = 300
+
+# HTTP status with which the REST API rejects an expired or revoked access token.
+HTTP_STATUS_UNAUTHORIZED = 401
+
+# Module and class name of the device class for each device type.  A module is imported
+# the first time a device of its type is created (or its class is imported from this
+# package), so only the device types an account has are loaded.
 _DREO_DEVICE_TYPE_TO_CLASS = {
-    DreoDeviceType.TOWER_FAN: PyDreoTowerFan,
-    DreoDeviceType.AIR_CIRCULATOR: PyDreoAirCirculator,
-    DreoDeviceType.AIR_PURIFIER: PyDreoAirPurifier,
-    DreoDeviceType.CEILING_FAN: PyDreoCeilingFan,
-    DreoDeviceType.HEATER: PyDreoHeater,
-    DreoDeviceType.AIR_CONDITIONER: PyDreoAC,
-    DreoDeviceType.CHEF_MAKER: PyDreoChefMaker,
-    DreoDeviceType.HUMIDIFIER: PyDreoHumidifier,
-    DreoDeviceType.DEHUMIDIFIER: PyDreoDehumidifier,
-    DreoDeviceType.EVAPORATIVE_COOLER: PyDreoEvaporativeCooler
+    DreoDeviceType.TOWER_FAN: (".pydreotowerfan", "PyDreoTowerFan"),
+    DreoDeviceType.AIR_CIRCULATOR: (".pydreoaircirculator", "PyDreoAirCirculator"),
+    DreoDeviceType.AIR_PURIFIER: (".pydreoairpurifier", "PyDreoAirPurifier"),
+    DreoDeviceType.CEILING_FAN: (".pydreoceilingfan", "PyDreoCeilingFan"),
+    DreoDeviceType.HEATER: (".pydreoheater", "PyDreoHeater"),
+    DreoDeviceType.AIR_CONDITIONER: (".pydreoairconditioner", "PyDreoAC"),
+    DreoDeviceType.CHEF_MAKER: (".pydreochefmaker", "PyDreoChefMaker"),
+    DreoDeviceType.HUMIDIFIER: (".pydreohumidifier", "PyDreoHumidifier"),
+    DreoDeviceType.DEHUMIDIFIER: (".pydreodehumidifier", "PyDreoDehumidifier"),
+    DreoDeviceType.EVAPORATIVE_COOLER: (".pydreoevaporativecooler", "PyDreoEvaporativeCooler")
 }
 
+_DEVICE_CLASS_MODULES = {class_name: module for module, class_name in _DREO_DEVICE_TYPE_TO_CLASS.values()}
+
+# Makes a Dreo API call for the async implementation of a method: async_call_dreo_api()
+# for the async API, or call_dreo_api() on a worker thread for the sync API.
+_ApiCall = Callable[..., Awaitable[tuple]]
+
+
+def _get_device_class(device_type: DreoDeviceType) -> type | None:
+    """Return the device class for a device type, importing its module if needed."""
+    entry = _DREO_DEVICE_TYPE_TO_CLASS.get(device_type)
+    if entry is None:
+        return None
+    module, class_name = entry
+    return getattr(importlib.import_module(module, __name__), class_name)
+
+
+def _import_device_modules(device_list: list) -> None:
+    """Import the modules of the device classes for device list entries.  Importing reads
+    files, so devices are created on the event loop only after this has run in the executor."""
+    for dev in device_list:
+        model = dev.get("model", None)
+        device_details = resolve_model(model) if model is not None else None
+        if device_details is None:
+            continue
+        try:
+            _get_device_class(device_details.device_type)
+        except ImportError:
+            # Reported as a load error of the device when it is created.
+            _LOGGER.debug("Unable to import the device class for %s", model)
+
+
+def __getattr__(name: str):
+    """Import device classes (e.g. PyDreoTowerFan) on first access."""
+    module = _DEVICE_CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 class PyDreo:  # pylint: disable=function-redefined
     """Dreo API functions."""
 
@@ -51,8 +108,25 @@ class PyDreo:  # pylint: disable=function-redefined
                  password, 
                  redact=True, 
                  debug_test_mode=False,
-                 debug_test_mode_payload=None) -> None:
-        self._transport = CommandTransport(self._transport_consume_message)
+                 debug_test_mode_payload=None,
+                 http_pool_size=DEFAULT_POOL_SIZE,
+                 http_connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 http_read_timeout=DEFAULT_READ_TIMEOUT,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 client_session: "aiohttp.ClientSession" = None,
+                 command_coalesce_window: float = 0,
+                 command_ack_timeout: float = DEFAULT_ACK_TIMEOUT,
+                 reconnect_policy: ReconnectPolicy = None,
+                 max_pending_messages: int = DEFAULT_MAX_PENDING_MESSAGES,
+                 settings_ttl: float = DEFAULT_SETTINGS_TTL) -> None:
+        self._message_dispatcher = MessageDispatcher(self._transport_consume_message, max_pending_messages)
+        self._transport = CommandTransport(self._message_dispatcher.submit,
+                                           token_refresh_callback=self._refresh_transport_token,
+                                           reconnect_policy=reconnect_policy,
+                                           reconnect_callback=self.resync_device_states)
+        self._http_session = HttpSession(pool_size=http_pool_size,
+                                         connect_timeout=http_connect_timeout,
+                                         read_timeout=http_read_timeout)
 
         """Initialize Dreo class with username, password and time zone."""
         self.auth_region = DREO_AUTH_REGION_NA  # Will get the region from the auth call
@@ -64,13 +138,30 @@ class PyDreo:  # pylint: disable=function-redefined
         self.username : str = username
         self.password : str  = password
         self.token = None
+        self.token_expires_at : float = None
         self.account_id = None
+        # Called with session_data after each successful login, so the session can be persisted.
+        self.session_update_callback : Callable[[dict], None] = None
+        self._login_lock = threading.Lock()
+        self._async_login_lock = asyncio.Lock()
         self.devices = None
         self.enabled = False
         self.in_process = False
         self._dev_list = {}
         self._device_list_by_sn = {}
         self.devices: list[PyDreoBaseDevice] = []
+        self.max_concurrency : int = max_concurrency
+        self.client_session : "aiohttp.ClientSession" = client_session
+        self._owns_client_session = False
+        self._command_coalescer : CommandCoalescer = None
+        self.command_coalesce_window = command_coalesce_window
+        self._command_tracker = CommandTracker(command_ack_timeout)
+        self._settings_cache = SettingsCache(settings_ttl)
+        self.device_load_errors : dict[str, str] = {}
+        self.loaded_from_cache : bool = False
+        # Called with the added and the removed devices when refreshing the device list
+        # changes the devices.  May be called on any thread.
+        self.device_list_callback : Callable[[list[PyDreoBaseDevice], list[PyDreoBaseDevice]], None] = None
         
         self.debug_test_mode : bool = debug_test_mode
         self.debug_test_mode_payload : dict = debug_test_mode_payload
@@ -90,6 +181,72 @@ class PyDreo:  # pylint: disable=function-redefined
         else:
             _LOGGER.error("Invalid Auth Region: %s", self.auth_region)
 
+    @property
+    def connection_stats(self) -> dict:
+        """Return REST connection counters (requests, connections opened and reused)."""
+        return self._http_session.stats.as_dict()
+
+    @property
+    def command_coalesce_window(self) -> float:
+        """Seconds during which commands to the same device are merged.  0 disables coalescing."""
+        if self._command_coalescer is None:
+            return 0
+        return self._command_coalescer.window
+
+    @command_coalesce_window.setter
+    def command_coalesce_window(self, value: float) -> None:
+        """Set the command coalescing window in seconds.  0 disables coalescing."""
+        _LOGGER.debug("Setting command_coalesce_window to %s", value)
+        if not value:
+            if self._command_coalescer is not None:
+                self._command_coalescer.flush_all()
+            self._command_coalescer = None
+        elif self._command_coalescer is None:
+            self._command_coalescer = CommandCoalescer(value, self._send_command_now)
+        else:
+            self._command_coalescer.window = value
+
+    @property
+    def command_coalescing_stats(self) -> dict:
+        """Return counters for commands submitted, merged and sent by the coalescer."""
+        if self._command_coalescer is None:
+            return None
+        return self._command_coalescer.stats
+
+    @property
+    def command_ack_stats(self) -> dict:
+        """Return command acknowledgement counters and command-to-report latency per device type."""
+        return self._command_tracker.stats
+
+    def command_latency_histograms(self) -> dict:
+        """Return the rolling command-to-report LatencyHistogram of each device type."""
+        return self._command_tracker.latency_histograms()
+
+    @property
+    def message_dispatch_stats(self) -> dict:
+        """Return counters for WebSocket messages dispatched, merged and dropped, queue depth and lag."""
+        return self._message_dispatcher.stats
+
+    @property
+    def settings_cache_stats(self) -> dict:
+        """Return device settings cache hits and misses."""
+        return self._settings_cache.stats
+
+    @property
+    def transport_stats(self) -> dict:
+        """Return WebSocket connection counters (connects, reconnects, failures) and downtime."""
+        return self._transport.stats.as_dict()
+
+    @property
+    def reconnect_policy(self) -> ReconnectPolicy:
+        """Return the policy deciding when the WebSocket reconnects."""
+        return self._transport.reconnect_policy
+
+    @reconnect_policy.setter
+    def reconnect_policy(self, value: ReconnectPolicy) -> None:
+        """Set the policy deciding when the WebSocket reconnects."""
+        self._transport.reconnect_policy = value
+
     @property
     def auto_reconnect(self) -> bool:
         """Return auto_reconnect option."""
@@ -137,10 +294,9 @@ class PyDreo:  # pylint: disable=function-redefined
                 devices = [i for j, i in enumerate(devices) if j not in dev_rem]
         return devices
 
-    def _process_devices(self, dev_list: list) -> bool:
-        """Instantiate Device Objects."""
+    def _prepare_device_list(self, dev_list: list) -> list:
+        """Clean up the device list returned by the API before creating devices."""
         devices = self.set_dev_id(dev_list)
-        _LOGGER.debug("pydreo._process_devices")
         num_devices = 0
         for _, v in self._dev_list.items():
             if isinstance(v, list):
@@ -150,143 +306,423 @@ class PyDreo:  # pylint: disable=function-redefined
 
         if not devices:
             _LOGGER.warning("No devices found in api return")
-            return False
+            return devices
         if num_devices == 0:
             _LOGGER.debug("New device list initialized")
         # else:
         #    self.remove_old_devices(devices)
 
         # devices[:] = [x for x in devices if self.add_dev_test(x)]
+        return devices
 
-        # detail_keys = ['deviceType', 'deviceName', 'deviceStatus']
-        for dev in devices:
-            # Get the state of the device...separate API call...boo
-            try:
-                model = dev.get("model", None)
-                
-                _LOGGER.debug("Found device with model %s", model)
-
-                if model is not None: 
-                    # Get the prefix of the model number to match against the supported devices.
-                    # Not all models will have known prefixes.
-                    model_prefix = None
-                    for prefix in SUPPORTED_MODEL_PREFIXES:
-                        if model[:len(prefix):] == prefix:
-                            model_prefix = prefix
-                            _LOGGER.debug("Prefix %s assigned from model %s", model_prefix, model)
-                            break
-                    
-                    device_details = None
-                    if model in SUPPORTED_DEVICES:
-                        _LOGGER.debug("Device %s found!", model)
-                        device_details = SUPPORTED_DEVICES[model]
-                    elif model_prefix is not None and model_prefix in SUPPORTED_DEVICES:
-                        _LOGGER.debug("Device %s found! via prefix %s", model, model_prefix)
-                        device_details = SUPPORTED_DEVICES[model_prefix]
-
-                # If device_details is None at this point, we have an unknown device model.
-                # Unsupported/Unknown Device.  Load the state, but store it in an "unsupported objects"
-                # list for later use in diagnostics.
-                device_class = None
-                
-                if device_details is not None:
-                    device_class = _DREO_DEVICE_TYPE_TO_CLASS.get(device_details.device_type, None)
-                else:
-                    device_details = DreoDeviceDetails(device_type = DreoDeviceType.UNKNOWN)
+    def _add_loaded_devices(self, results: list) -> None:
+        """Add successfully loaded devices, in API order."""
+        for device in results:
+            if device is None:
+                continue
+            self.devices.append(device)
+            self._device_list_by_sn[device.serial_number] = device
+
+    async def _async_add_devices(self, devices: list, call_api: _ApiCall) -> list[PyDreoBaseDevice]:
+        """Create the devices for device list entries and load their state and settings.
+        Returns the devices that were added."""
+        results = await self._async_create_devices(devices, call_api)
+        self._add_loaded_devices(results)
+        return [device for device in results if device is not None]
+
+    async def _async_create_devices(self, devices: list, call_api: _ApiCall) -> list[PyDreoBaseDevice | None]:
+        """Create the devices for device list entries and load their state and settings, without
+        adding them.  Returns the devices in the order of the entries, with None for those that
+        failed to load."""
+        await asyncio.get_running_loop().run_in_executor(None, _import_device_modules, devices)
+        # Each device needs its own state call (and maybe settings calls), so run them
+        # concurrently.  Results are collected in the order of the API response so the
+        # devices list stays deterministic.
+        results = await self._gather_limited(self._async_load_device(dev, call_api) for dev in devices)
+        await self._async_prefetch_settings([device for device in results if device is not None], call_api)
+        return results
+
+    def _remove_devices(self, devices: list[PyDreoBaseDevice]) -> None:
+        """Remove devices that are no longer in the device list.  Reports for them are ignored."""
+        for device in devices:
+            _LOGGER.info("Removing device %s, which is no longer in the device list", device.name)
+            self.devices.remove(device)
+            self._device_list_by_sn.pop(device.serial_number, None)
+            self._settings_cache.invalidate(device.serial_number)
+
+    def _diff_device_list(self, device_list: list) -> tuple[list, list[PyDreoBaseDevice]]:
+        """Return the device list entries without a device, and the devices without an entry."""
+        listed = {dev.get("sn") for dev in device_list}
+        new_entries = [dev for dev in device_list if dev.get("sn") not in self._device_list_by_sn]
+        removed = [device for device in self.devices if device.serial_number not in listed]
+        return new_entries, removed
+
+    def _device_list_changed(self, added: list[PyDreoBaseDevice], removed: list[PyDreoBaseDevice]) -> None:
+        if not added and not removed:
+            return
+        _LOGGER.info("Device list changed: %s devices added, %s removed", len(added), len(removed))
+        if self.device_list_callback is not None:
+            self.device_list_callback(added, removed)
+
+    def refresh_device_list(self) -> tuple[list[PyDreoBaseDevice], list[PyDreoBaseDevice]]:
+        """Reload the device list and apply the changes to it, without reloading the other devices.
+
+        Devices that are new to the list are created and their state loaded, and devices that are
+        no longer in it are removed.  Returns the added and the removed devices, which are also
+        passed to device_list_callback."""
+        return self._run_sync(self._async_refresh_device_list)
+
+    async def async_refresh_device_list(self) -> tuple[list[PyDreoBaseDevice], list[PyDreoBaseDevice]]:
+        """Async version of refresh_device_list()."""
+        return await self._async_refresh_device_list(self.async_call_dreo_api)
+
+    async def _async_refresh_device_list(self, call_api: _ApiCall) -> tuple[list[PyDreoBaseDevice],
+                                                                            list[PyDreoBaseDevice]]:
+        if not self.enabled or self.debug_test_mode:
+            return [], []
+        cached_response = self.raw_response
+        device_list = await self._async_get_device_list(call_api)
+        if device_list is None:
+            self.raw_response = cached_response
+            return [], []
+        new_entries, removed = self._diff_device_list(device_list)
+        self._remove_devices(removed)
+        added = await self._async_add_devices(new_entries, call_api) if new_entries else []
+        self._device_list_changed(added, removed)
+        return added, removed
+
+    def _create_device(self, dev: dict) -> PyDreoBaseDevice:
+        """Create the device object for a device list entry."""
+        model = dev.get("model", None)
+
+        _LOGGER.debug("Found device with model %s", model)
+
+        device_details = resolve_model(model) if model is not None else None
+        if device_details is not None:
+            _LOGGER.debug("Device %s found!", model)
+
+        # If device_details is None at this point, we have an unknown device model.
+        # Unsupported/Unknown Device.  Load the state, but store it in an "unsupported objects"
+        # list for later use in diagnostics.
+        device_class = None
+
+        if device_details is not None:
+            device_class = _get_device_class(device_details.device_type)
+        else:
+            device_details = DreoDeviceDetails(device_type = DreoDeviceType.UNKNOWN)
+
+        if device_class is None:
+            device_class = PyDreoUnknownDevice
+
+        return device_class(device_details, dev, self)
+
+    async def _async_load_device(self, dev: dict, call_api: _ApiCall) -> PyDreoBaseDevice | None:
+        """Create a device object and load its state.  Failures are logged and recorded in
+        device_load_errors rather than raised so one bad device doesn't stop the others."""
+        # Get the state of the device...separate API call...boo
+        try:
+            device = self._create_device(dev)
+            if not await self._async_load_device_state(device, call_api):
+                self.device_load_errors[device.serial_number] = "Unable to load device state"
+            return device
+        except UnknownModelError as ume:
+            _LOGGER.warning("Unknown device model: %s", ume)
+            _LOGGER.debug(dev)
+        except Exception as ex: # pylint: disable=broad-except
+            _LOGGER.exception("Error loading device %s (%s)", dev.get("deviceName"), dev.get("model"))
+            self.device_load_errors[dev.get("sn")] = str(ex)
+        return None
+
+    def _get_device_list_from_response(self, response: dict) -> list | None:
+        """Extract the device list from a devicelist response."""
+        # Stash the raw response for use by the diagnostics system, so we don't have to pull
+        # logs
+        self.raw_response = response
+        return self._device_list_from_response(response)
 
-                if device_class is None:
-                    device_class = PyDreoUnknownDevice
-                
-                device : PyDreoBaseDevice = device_class(device_details, dev, self)
+    @staticmethod
+    def _device_list_from_response(response: dict) -> list | None:
+        if response and Helpers.code_check(response):
+            if DATA_KEY in response and LIST_KEY in response[DATA_KEY]:
+                return response[DATA_KEY][LIST_KEY]
+            _LOGGER.error("Device list in response not found")
+        else:
+            _LOGGER.warning("Error retrieving device list")
+        return None
+
+    def _add_device_list_page(self, page_no: int, response: dict) -> list | None:
+        """Extract the device list from a later page of the device list, and add it to the
+        stashed first page so diagnostics and export_cache() see every device."""
+        device_list = self._device_list_from_response(response)
+        if device_list is None:
+            _LOGGER.warning("Unable to load page %s of the device list", page_no)
+            return None
+        self.raw_response[DATA_KEY][LIST_KEY] = self.raw_response[DATA_KEY][LIST_KEY] + device_list
+        return device_list
 
-                self.load_device_state(device)
+    def _remaining_page_numbers(self) -> range:
+        """Return the page numbers of the device list after the first, which has been loaded."""
+        if self.debug_test_mode:
+            return range(0)
+        try:
+            total_pages = int(self.raw_response[DATA_KEY].get(TOTAL_PAGE_KEY) or 1)
+        except (TypeError, ValueError):
+            total_pages = 1
+        return range(2, total_pages + 1)
+
+    def _add_device_list_pages(self, page_numbers: range, responses: list) -> list | None:
+        """Return the devices on the later pages of the device list, in page order, or None if
+        a page failed to load: a partial list would look like the missing devices were removed."""
+        device_list = []
+        for page_no, response in zip(page_numbers, responses):
+            page = self._add_device_list_page(page_no, response)
+            if page is None:
+                return None
+            device_list.extend(page)
+        return device_list
+
+    async def _async_get_device_list(self, call_api: _ApiCall) -> list | None:
+        """Load every page of the device list.  The pages after the first are requested concurrently."""
+        if self.debug_test_mode:
+            response = self._debug_test_mode_response("get_devices")
+        else:
+            response, _ = await call_api(DREO_API_DEVICELIST)
+        device_list = self._get_device_list_from_response(response)
+        page_numbers = self._remaining_page_numbers() if device_list is not None else range(0)
+        if not page_numbers:
+            return device_list
+        _LOGGER.debug("Loading %s more pages of the device list", len(page_numbers))
+
+        async def get_page(page_no: int) -> dict:
+            response, _ = await call_api(DREO_API_DEVICELIST, {PAGE_NO_KEY: str(page_no)})
+            return response
+
+        responses = await self._gather_limited(get_page(page_no) for page_no in page_numbers)
+        later_pages = self._add_device_list_pages(page_numbers, responses)
+        if later_pages is None:
+            return None
+        return device_list + later_pages
 
-                self.devices.append(device)
+    def load_devices(self) -> bool:
+        """Load devices from API. This is called once upon initialization.
 
-                self._device_list_by_sn[device.serial_number] = device
-            except UnknownModelError as ume:
-                _LOGGER.warning("Unknown device model: %s", ume)
-                _LOGGER.debug(dev)
+        The devices on each page of the device list are created and their state loaded
+        while later pages are still loading.  If a page fails to load, no devices are added."""
+        return self._run_sync(self._async_load_devices)
 
-        return True
+    async def async_load_devices(self) -> bool:
+        """Load devices from API on the running event loop."""
+        return await self._async_load_devices(self.async_call_dreo_api)
 
-    def load_devices(self) -> bool:
-        """Load devices from API. This is called once upon initialization."""
+    async def _async_load_devices(self, call_api: _ApiCall) -> bool:
         if not self.enabled:
             return False
 
         self.in_process = True
-        proc_return = False
 
-        response = None
+        proc_return = await self._async_load_device_pages(call_api)
 
+        self.in_process = False
+
+        return proc_return
+
+    async def _async_load_device_pages(self, call_api: _ApiCall) -> bool:
+        """Load every page of the device list, creating the devices on each page as it arrives.
+
+        The devices are added in page order once every page has loaded."""
+        _LOGGER.debug("pydreo._async_load_device_pages")
+        # Pages and the devices on them load at the same time, so limit the calls themselves.
+        call_api = self._limit_concurrency(call_api)
         if self.debug_test_mode:
-            _LOGGER.debug("Debug Test Mode is enabled.  Using test payload.")
-            response = self.debug_test_mode_payload.get("get_devices", None)    
+            response = self._debug_test_mode_response("get_devices")
         else:
-            response, _ = self.call_dreo_api(DREO_API_DEVICELIST)
+            response, _ = await call_api(DREO_API_DEVICELIST)
+        device_list = self._get_device_list_from_response(response)
+        if device_list is None:
+            return False
+        page_numbers = self._remaining_page_numbers()
+        if page_numbers:
+            _LOGGER.debug("Loading %s more pages of the device list", len(page_numbers))
+
+        async def load_page(page_no: int) -> tuple[dict, list]:
+            response, _ = await call_api(DREO_API_DEVICELIST, {PAGE_NO_KEY: str(page_no)})
+            page = self._device_list_from_response(response)
+            if not page:
+                return response, []
+            return response, await self._async_create_devices(self.set_dev_id(page), call_api)
+
+        first_page, *later_pages = await asyncio.gather(
+            self._async_create_devices(self._prepare_device_list(device_list), call_api),
+            *(load_page(page_no) for page_no in page_numbers))
+        if self._add_device_list_pages(page_numbers, [response for response, _ in later_pages]) is None:
+            return False
+        devices = list(chain(first_page, *(page for _, page in later_pages)))
+        self._add_loaded_devices(devices)
+        return bool(devices)
+
+    def export_cache(self) -> dict:
+        """Return the device list and the last-known state of each device, for
+        load_devices_from_cache() on the next start.  The result is JSON serializable."""
+        return {
+            "version": CACHE_VERSION,
+            "devicelist": self.raw_response,
+            "states": {device.serial_number: device.last_known_state for device in self.devices},
+            "settings": self._settings_cache.export(),
+        }
 
-        # Stash the raw response for use by the diagnostics system, so we don't have to pull
-        # logs
-        self.raw_response = response
+    def load_devices_from_cache(self, cache: dict) -> bool:
+        """Create the devices from a cache made by export_cache(), without loading the device
+        list or device state from the cloud.  Returns False if the cache can't be used.
+
+        The cached state may be out of date; call refresh_devices() (or
+        async_refresh_devices()) afterwards to bring it up to date."""
+        if not self.enabled or not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+            return False
+
+        device_list = self._get_device_list_from_response(cache.get("devicelist"))
+        devices = self._prepare_device_list(device_list) if device_list is not None else None
+        if not devices:
+            return False
+
+        states: dict = cache.get("states") or {}
+        results = [self._load_cached_device(dev, states.get(dev.get("sn"))) for dev in devices]
+        self._add_loaded_devices(results)
+
+        # Use the cached settings until refresh_devices() reads them again.
+        for serial_number, settings in (cache.get("settings") or {}).items():
+            for setting, value in settings.items():
+                self._settings_cache.seed(serial_number, setting, value)
+        for device in results:
+            if device is not None:
+                device.apply_settings({setting: self._settings_cache.get(device.serial_number, setting)
+                                       for setting in device.required_settings})
+        self.loaded_from_cache = True
+        _LOGGER.info("Loaded %s devices from cache", len(self.devices))
+        return True
+
+    def _load_cached_device(self, dev: dict, state: dict) -> PyDreoBaseDevice | None:
+        try:
+            device = self._create_device(dev)
+            if state:
+                device.load_state(state)
+            return device
+        except UnknownModelError as ume:
+            _LOGGER.warning("Unknown device model: %s", ume)
+        except Exception as ex: # pylint: disable=broad-except
+            _LOGGER.exception("Error loading cached device %s (%s)", dev.get("deviceName"), dev.get("model"))
+            self.device_load_errors[dev.get("sn")] = str(ex)
+        return None
+
+    def refresh_devices(self) -> list[PyDreoBaseDevice]:
+        """Reload the device list and the state of all devices from the cloud, e.g. after
+        loading them from a cache.  Callbacks run for the devices whose state changed;
+        those are returned.  Devices added to or removed from the list are passed to
+        device_list_callback, as by refresh_device_list()."""
+        return self._run_sync(self._async_refresh_devices)
+
+    async def async_refresh_devices(self) -> list[PyDreoBaseDevice]:
+        """Async version of refresh_devices()."""
+        return await self._async_refresh_devices(self.async_call_dreo_api)
+
+    async def _async_refresh_devices(self, call_api: _ApiCall) -> list[PyDreoBaseDevice]:
+        cached_response = self.raw_response
+        device_list = await self._async_get_device_list(call_api)
+        new_entries, removed = [], []
+        if device_list is None:
+            # Keep the cached device list for export_cache().
+            self.raw_response = cached_response
+        else:
+            new_entries, removed = self._diff_device_list(device_list)
+            self._remove_devices(removed)
+        changed = await self._async_resync_device_states(call_api)
+        changed += [device for device in await self._async_prefetch_settings(self.devices, call_api)
+                    if device not in changed]
+        added = await self._async_add_devices(new_entries, call_api) if new_entries else []
+        self._device_list_changed(added, removed)
+        return changed
+
+    def _apply_device_state_response(self, device: PyDreoBaseDevice, response: dict) -> bool:
+        """Update a device from a devicestate response."""
+        # stash the raw return value from the devicestate api call
+        device.raw_state = response
 
         if response and Helpers.code_check(response):
-            if DATA_KEY in response and LIST_KEY in response[DATA_KEY]:
-                device_list = response[DATA_KEY][LIST_KEY]
-                proc_return = self._process_devices(device_list)
-            else:
-                _LOGGER.error("Device list in response not found")
+            if DATA_KEY in response and MIXED_KEY in response[DATA_KEY]:
+                device_state = response[DATA_KEY][MIXED_KEY]
+                device.load_state(device_state)
+                return True
+            _LOGGER.error("Mixed state in response not found")
         else:
-            _LOGGER.warning("Error retrieving device list")
+            _LOGGER.error("Error retrieving device state")
+        return False
 
-        self.in_process = False
+    def resync_device_states(self) -> list[PyDreoBaseDevice]:
+        """Reload the state of all devices, e.g. after reports were missed while the WebSocket
+        was down.  Callbacks run only for devices whose state changed; those are returned."""
+        return self._run_sync(self._async_resync_device_states)
 
-        return proc_return
+    async def _async_resync_device_states(self, call_api: _ApiCall) -> list[PyDreoBaseDevice]:
+        devices = list(self.devices)
+        if not devices:
+            return []
+
+        changed = await self._gather_limited(self._async_resync_device_state(device, call_api)
+                                             for device in devices)
+
+        changed_devices = [device for device, device_changed in zip(devices, changed) if device_changed]
+        _LOGGER.info("Resynced state of %s devices; %s changed", len(devices), len(changed_devices))
+        return changed_devices
+
+    async def _async_resync_device_state(self, device: PyDreoBaseDevice, call_api: _ApiCall) -> bool:
+        """Reload the state of one device and run its callbacks if the state changed."""
+        before = device.state_snapshot
+        try:
+            if not await self._async_load_device_state(device, call_api):
+                return False
+        except Exception: # pylint: disable=broad-except
+            _LOGGER.exception("Error resyncing state of %s", device.name)
+            return False
+
+        changed = device.state_snapshot.changed_since(before)
+        if not changed:
+            return False
+        _LOGGER.debug("State of %s changed while disconnected: %s", device.name, changed)
+        device._do_callbacks(changed) # pylint: disable=protected-access
+        return True
 
     def load_device_state(self, device: PyDreoBaseDevice) -> bool:
         """Load device state from API. This is called once upon initialization for each supported device."""
+        return self._run_sync(self._async_load_device_state, device)
+
+    async def async_load_device_state(self, device: PyDreoBaseDevice) -> bool:
+        """Load device state from API on the running event loop."""
+        return await self._async_load_device_state(device, self.async_call_dreo_api)
+
+    async def _async_load_device_state(self, device: PyDreoBaseDevice, call_api: _ApiCall) -> bool:
         _LOGGER.debug("load_device_state: %s, enabled: %s", device.name, self.enabled)
         if not self.enabled:
             return False
 
         self.in_process = True
-        proc_return = False
-
-        response = None
 
         if self.debug_test_mode:
-            _LOGGER.debug("Debug Test Mode is enabled.  Using test payload.")
-            response = self.debug_test_mode_payload.get(device.serial_number, None)    
+            response = self._debug_test_mode_response(device.serial_number)
         else:
-            response, _ = self.call_dreo_api(
-                DREO_API_DEVICESTATE, {DEVICESN_KEY: device.serial_number}
-            )
-
-        # stash the raw return value from the devicestate api call
-        device.raw_state = response
+            response, _ = await call_api(DREO_API_DEVICESTATE, {DEVICESN_KEY: device.serial_number})
 
-        if response and Helpers.code_check(response):
-            if DATA_KEY in response and MIXED_KEY in response[DATA_KEY]:
-                device_state = response[DATA_KEY][MIXED_KEY]
-                device.update_state(device_state)
-                proc_return = True
-            else:
-                _LOGGER.error("Mixed state in response not found")
-        else:
-            _LOGGER.error("Error retrieving device state")
+        proc_return = self._apply_device_state_response(device, response)
 
         self.in_process = False
 
         return proc_return
 
-    def login(self) -> bool:
-        """Return True if log in request succeeds."""
-
-        if self.debug_test_mode:
-            self.enabled = True
-            _LOGGER.debug("Debug Test Mode is enabled.  Skipping login.")  
-            return True
+    def _debug_test_mode_response(self, key: str) -> dict | None:
+        """Return the response for a device list ("get_devices") or a device's state from the test payload."""
+        _LOGGER.debug("Debug Test Mode is enabled.  Using test payload.")
+        return self.debug_test_mode_payload.get(key, None)
 
+    def _check_credentials(self) -> bool:
+        """Return True if the username and password look usable."""
         user_check = isinstance(self.username, str) and len(self.username) > 0
         pass_check = isinstance(self.password, str) and len(self.password) > 0
         if user_check is False:
@@ -295,8 +731,11 @@ class PyDreo:  # pylint: disable=function-redefined
         if pass_check is False:
             _LOGGER.error("Password invalid")
             return False
-        response, _ = self.call_dreo_api(DREO_API_LOGIN)
+        return True
 
+    def _handle_login_response(self, response: dict) -> bool | None:
+        """Process a login response.  Returns None if login must be retried against
+        the region the server reported."""
         if Helpers.code_check(response) and DATA_KEY in response:
             # get the region code from auth
             auth_region = response[DATA_KEY][REGION_KEY]
@@ -306,17 +745,110 @@ class PyDreo:  # pylint: disable=function-redefined
                     "Dreo Auth reports different region than current; retrying."
                 )
                 self.auth_region = auth_region
-                return self.login()
-            else:
-                self.token = response[DATA_KEY][ACCESS_TOKEN_KEY]
-                self.enabled = True
-                _LOGGER.debug("Login successful")
-                return True
+                return None
+
+            self.token = response[DATA_KEY][ACCESS_TOKEN_KEY]
+            expires_in = response[DATA_KEY].get(EXPIRES_IN_KEY)
+            self.token_expires_at = time.time() + expires_in if isinstance(expires_in, (int, float)) else None
+            self.enabled = True
+            _LOGGER.debug("Login successful")
+            if self.session_update_callback is not None:
+                self.session_update_callback(self.session_data)
+            return True
         _LOGGER.error("Error logging in with username and password")
         return False
 
+    @property
+    def session_data(self) -> dict:
+        """Return the access token, auth region and token expiry (epoch seconds or None),
+        for restore_session() on the next start."""
+        return {
+            "username": self.username,
+            "token": self.token,
+            "region": self.auth_region,
+            "expires_at": self.token_expires_at,
+        }
+
+    def restore_session(self, session: dict) -> bool:
+        """Use the token from an earlier login (see session_data) instead of logging in.
+
+        Returns False, leaving the manager logged out, if the session is for another user or
+        its token has expired.  A token that is rejected later is replaced by logging in again."""
+        if not isinstance(session, dict) or not session.get("token") or session.get("username") != self.username:
+            return False
+        expires_at = session.get("expires_at")
+        if expires_at is not None and expires_at - TOKEN_EXPIRY_MARGIN < time.time():
+            _LOGGER.debug("Saved access token has expired")
+            return False
+
+        self.token = session["token"]
+        self.token_expires_at = expires_at
+        self.auth_region = session.get("region", self.auth_region)
+        self.enabled = True
+        _LOGGER.debug("Restored access token; skipping login")
+        return True
+
+    def _reauthenticate(self, rejected_token: str) -> bool:
+        """Log in again after the API rejected a token.  Returns True if there is a new token.
+
+        Concurrent calls that were rejected with the same token share one login."""
+        if not self._can_reauthenticate():
+            return False
+        with self._login_lock:
+            if self.token != rejected_token:
+                return True
+            _LOGGER.info("Access token rejected; logging in again")
+            return self.login()
+
+    def _can_reauthenticate(self) -> bool:
+        """Return True if a rejected token can be replaced by logging in again."""
+        return not self.debug_test_mode and self._check_credentials()
+
+    def _skip_login(self) -> bool | None:
+        """Return the result of a login that needs no request, or None if one is needed."""
+        if self.debug_test_mode:
+            self.enabled = True
+            _LOGGER.debug("Debug Test Mode is enabled.  Skipping login.")
+            return True
+        if not self._check_credentials():
+            return False
+        return None
+
+    def login(self) -> bool:
+        """Return True if log in request succeeds."""
+        return self._run_sync(self._async_login)
+
+    def _refresh_transport_token(self) -> str:
+        """Log in again after the WebSocket rejected the token.  Returns the new token."""
+        _LOGGER.info("Refreshing access token")
+        if not self.login():
+            raise RuntimeError("Login failed")
+        return self.token
+
+    async def async_login(self) -> bool:
+        """Return True if log in request succeeds.  Runs on the caller's event loop."""
+        return await self._async_login(self.async_call_dreo_api)
+
+    async def _async_login(self, call_api: _ApiCall) -> bool:
+        result = self._skip_login()
+        while result is None:
+            response, _ = await call_api(DREO_API_LOGIN)
+            result = self._handle_login_response(response)
+        return result
+
     def get_device_setting(self, device: PyDreoBaseDevice, setting : DreoDeviceSetting) -> bool | int:
-        """Get a device setting from the API."""
+        """Get a device setting, from the settings cache if it is fresh and otherwise from the API."""
+        setting_value = self._settings_cache.get_fresh(device.serial_number, setting)
+        if setting_value is not None:
+            return setting_value
+        return self._fetch_device_setting(device, setting)
+
+    def _fetch_device_setting(self, device: PyDreoBaseDevice, setting : DreoDeviceSetting) -> bool | int:
+        """Get a device setting from the API and cache it."""
+        return self._run_sync(self._async_fetch_device_setting, device, setting)
+
+    async def _async_fetch_device_setting(self, device: PyDreoBaseDevice, setting : DreoDeviceSetting,
+                                          call_api: _ApiCall) -> bool | int:
         _LOGGER.debug("get_device_setting: %s(%s), enabled: %s", 
                     device.name, 
                     setting,
@@ -325,14 +857,20 @@ class PyDreo:  # pylint: disable=function-redefined
             return None
 
         self.in_process = True
-        setting_value = None
-        response, _ = self.call_dreo_api(
+        response, _ = await call_api(
             DREO_API_SETTING_GET, 
             {   DEVICESN_KEY: device.serial_number,
                 DREO_API_SETTING_DATA_KEY: setting
             }
         )
+        setting_value = self._handle_setting_response(device, setting, response)
+        self.in_process = False
 
+        return setting_value
+
+    def _handle_setting_response(self, device: PyDreoBaseDevice, setting : DreoDeviceSetting, response: dict) -> bool | int:
+        """Return the value in a setting response, caching it."""
+        setting_value = None
         if response and Helpers.code_check(response):
             if DATA_KEY in response:
                 data_node = response[DATA_KEY]
@@ -345,10 +883,45 @@ class PyDreo:  # pylint: disable=function-redefined
         else:
             _LOGGER.error("Error retrieving device setting.")
 
-        self.in_process = False
-
+        if setting_value is not None:
+            self._settings_cache.put(device.serial_number, setting, setting_value)
         return setting_value
-    
+
+    def _settings_to_fetch(self, devices: list[PyDreoBaseDevice]) -> list[tuple[PyDreoBaseDevice, DreoDeviceSetting]]:
+        return [(device, setting)
+                for device in devices
+                for setting in device.required_settings
+                if not self._settings_cache.is_fresh(device.serial_number, setting)]
+
+    def _apply_cached_settings(self, devices: list[PyDreoBaseDevice]) -> list[PyDreoBaseDevice]:
+        """Give devices their cached settings.  Returns the devices that changed, after running their callbacks."""
+        changed_devices = []
+        for device in devices:
+            settings = device.required_settings
+            if not settings:
+                continue
+            changed = device.apply_settings({setting: self._settings_cache.get(device.serial_number, setting)
+                                             for setting in settings})
+            if changed:
+                device._do_callbacks(changed) # pylint: disable=protected-access
+                changed_devices.append(device)
+        return changed_devices
+
+    def prefetch_settings(self, devices: list[PyDreoBaseDevice]) -> list[PyDreoBaseDevice]:
+        """Read the settings the devices use that aren't freshly cached, in parallel, and give
+        the devices their values.  Returns the devices whose settings changed."""
+        return self._run_sync(self._async_prefetch_settings, devices)
+
+    async def async_prefetch_settings(self, devices: list[PyDreoBaseDevice]) -> list[PyDreoBaseDevice]:
+        """Async version of prefetch_settings()."""
+        return await self._async_prefetch_settings(devices, self.async_call_dreo_api)
+
+    async def _async_prefetch_settings(self, devices: list[PyDreoBaseDevice],
+                                       call_api: _ApiCall) -> list[PyDreoBaseDevice]:
+        await self._gather_limited(self._async_fetch_device_setting(device, setting, call_api)
+                                   for device, setting in self._settings_to_fetch(devices))
+        return self._apply_cached_settings(devices)
+
     def set_device_setting(self, device: PyDreoBaseDevice, setting : DreoDeviceSetting, value : bool | int) -> None:
         """Get a device setting from the API."""
         _LOGGER.debug("set_device_setting: %s(%s=%s), enabled: %s", 
@@ -373,9 +946,12 @@ class PyDreo:  # pylint: disable=function-redefined
         device.raw_state = response
 
         if response and Helpers.code_check(response):
+            # Write the new value through to the settings cache.
+            self._settings_cache.put(device.serial_number, setting, value)
+            self._apply_cached_settings([device])
             if DATA_KEY in response and MIXED_KEY in response[DATA_KEY]:
                 device_state = response[DATA_KEY][MIXED_KEY]
-                device.update_state(device_state)
+                device.load_state(device_state)
                 proc_return = True
             else:
                 _LOGGER.error("Mixed state in response not found")
@@ -388,32 +964,129 @@ class PyDreo:  # pylint: disable=function-redefined
     
     def call_dreo_api(self, api: str, json_object: Optional[dict] = None) -> tuple:
         """Call the Dreo API. This is used for login and the initial device list and states as well
-           as device settings."""
+           as device settings.  A call rejected for the token is retried once after logging in again."""
+        token = self.token
+        response, status_code = self._call_dreo_api(api, json_object)
+        if status_code == HTTP_STATUS_UNAUTHORIZED and api != DREO_API_LOGIN and self._reauthenticate(token):
+            response, status_code = self._call_dreo_api(api, json_object)
+        return response, status_code
+
+    def _api_request(self, api: str, json_object: Optional[dict]) -> tuple:
+        """Return the URL, path, method, body and headers of a call to an API."""
         _LOGGER.debug("Calling Dreo API: {%s}", api)
-        api_url = DREO_API_URL_FORMAT.format(self.api_server_region)
-
-        if json_object is None:
-            json_object = {}
-
-        json_object_full = {**Helpers.req_body(self, api), **json_object}
-
-        return Helpers.call_api(
-            api_url,
-            DREO_APIS[api][DREO_API_PATH],
-            DREO_APIS[api][DREO_API_METHOD],
-            json_object_full,
-            Helpers.req_headers(self),
-        )
+        return (DREO_API_URL_FORMAT.format(self.api_server_region),
+                DREO_APIS[api][DREO_API_PATH],
+                DREO_APIS[api][DREO_API_METHOD],
+                {**Helpers.req_body(self, api), **(json_object or {})},
+                Helpers.req_headers(self))
+
+    def _call_dreo_api(self, api: str, json_object: Optional[dict] = None) -> tuple:
+        return Helpers.call_api(*self._api_request(api, json_object), self._http_session)
+
+    def _run_sync(self, method: Callable[..., Awaitable], *args):
+        """Run the async implementation of a sync method on a private event loop.  Its API
+        calls are made with call_dreo_api() on up to max_concurrency worker threads.
+
+        Must not be called on a running event loop; use the async API there."""
+        async def run():
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=max(1, self.max_concurrency), thread_name_prefix="DreoApiCall"))
+            return await method(*args, self._call_dreo_api_in_thread)
+
+        return asyncio.run(run())
+
+    async def _call_dreo_api_in_thread(self, api: str, json_object: Optional[dict] = None) -> tuple:
+        return await asyncio.get_running_loop().run_in_executor(None, self.call_dreo_api, api, json_object)
+
+    def _limit_concurrency(self, call_api: _ApiCall) -> _ApiCall:
+        """Return call_api limited to max_concurrency calls at a time."""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def limited_call(*args) -> tuple:
+            async with semaphore:
+                return await call_api(*args)
+
+        return limited_call
+
+    async def _gather_limited(self, calls) -> list:
+        """Await the calls concurrently, at most max_concurrency at a time.  Returns their results in order."""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def limited(call):
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(limited(call) for call in calls))
+
+    async def async_call_dreo_api(self, api: str, json_object: Optional[dict] = None) -> tuple:
+        """Call the Dreo API on the running event loop using the aiohttp client session.
+           A call rejected for the token is retried once after logging in again."""
+        token = self.token
+        response, status_code = await self._async_call_dreo_api(api, json_object)
+        if (status_code == HTTP_STATUS_UNAUTHORIZED and api != DREO_API_LOGIN
+                and await self._async_reauthenticate(token)):
+            response, status_code = await self._async_call_dreo_api(api, json_object)
+        return response, status_code
+
+    async def _async_reauthenticate(self, rejected_token: str) -> bool:
+        """Async version of _reauthenticate()."""
+        if not self._can_reauthenticate():
+            return False
+        async with self._async_login_lock:
+            if self.token != rejected_token:
+                return True
+            _LOGGER.info("Access token rejected; logging in again")
+            return await self.async_login()
+
+    async def _async_call_dreo_api(self, api: str, json_object: Optional[dict] = None) -> tuple:
+        return await Helpers.async_call_api(*self._api_request(api, json_object), self._get_client_session())
+
+    def _get_client_session(self) -> "aiohttp.ClientSession":
+        """Return the aiohttp session used by the async API, creating one if none was given."""
+        if self.client_session is None or self.client_session.closed:
+            import aiohttp # pylint: disable=import-outside-toplevel
+            self.client_session = aiohttp.ClientSession()
+            self._owns_client_session = True
+        return self.client_session
+
+    async def async_close(self) -> None:
+        """Close the aiohttp session if it was created by this object."""
+        if self._owns_client_session and self.client_session is not None:
+            await self.client_session.close()
+            self.client_session = None
+            self._owns_client_session = False
 
     def start_transport(self) -> None:
         """Initialize the websocket and start transport"""
         if not self.debug_test_mode:
+            self._message_dispatcher.start()
             self._transport.start_transport(self.api_server_region, self.token)
 
-    def stop_transport(self) -> None:
-        """Close down the transport socket"""
+    def stop_transport(self, timeout: float | None = DEFAULT_STOP_TIMEOUT) -> bool:
+        """Close down the transport socket, waiting up to timeout seconds for its thread to exit.
+
+        Returns True if the transport has stopped."""
+        if self._command_coalescer is not None:
+            self._command_coalescer.flush_all()
+        stopped = True
+        if not self.debug_test_mode:
+            stopped = self._transport.stop_transport(timeout)
+            stopped = self._message_dispatcher.stop(timeout) and stopped
+        self._command_tracker.cancel_all()
+        self._http_session.close()
+        return stopped
+
+    async def async_stop_transport(self, timeout: float | None = DEFAULT_STOP_TIMEOUT) -> bool:
+        """Close down the transport socket, awaiting up to timeout seconds for its thread to exit."""
+        if self._command_coalescer is not None:
+            self._command_coalescer.flush_all()
+        stopped = True
         if not self.debug_test_mode:
-            self._transport.stop_transport()
+            stopped = await self._transport.async_stop_transport(timeout)
+            stopped = await self._message_dispatcher.async_stop(timeout) and stopped
+        self._command_tracker.cancel_all()
+        self._http_session.close()
+        return stopped
 
     def testonly_interrupt_transport(self) -> None:
         """Close down the transport socket"""
@@ -427,6 +1100,9 @@ class PyDreo:  # pylint: disable=function-redefined
         if message_device_sn in self._device_list_by_sn:
             device = self._device_list_by_sn[message_device_sn]
             device.handle_server_update_base(message)
+            reported = message.get(REPORTED_KEY)
+            if message.get(DREO_API_METHOD) == "report" and isinstance(reported, dict):
+                self._command_tracker.resolve(message_device_sn, reported)
         else:
             # Message is to an unknown device, log it out just in case...
             _LOGGER.debug(
@@ -435,8 +1111,8 @@ class PyDreo:  # pylint: disable=function-redefined
             )
             _LOGGER.debug("Message: %s", message)
 
-    def send_command(self, device: PyDreoBaseDevice, params) -> None:
-        """Send a command to Dreo servers via the WebSocket."""
+    def _build_command(self, device: PyDreoBaseDevice, params) -> str:
+        """Build the JSON control message for a device."""
         full_params = {
             "devicesn": device.serial_number,
             "method": "control",
@@ -445,12 +1121,62 @@ class PyDreo:  # pylint: disable=function-redefined
         }
         content = json.dumps(full_params)
         _LOGGER.debug(content)
+        return content
+
+    def _debug_test_mode_report(self, device: PyDreoBaseDevice, params) -> None:
+        """Pretend the device reported back the parameters we sent."""
+        _LOGGER.debug("Debug Test Mode is enabled.  Pretending we received the message...")
+        self._transport_consume_message({"devicesn": device.serial_number,
+                                         "method": "report",
+                                         "reported": params})
+
+    def send_command(self, device: PyDreoBaseDevice, params, wait_for_ack: bool = False) -> Future:
+        """Send a command to Dreo servers via the WebSocket.
+
+        If command coalescing is enabled, the params are merged with other commands for
+        the same device sent within the window.  Returns a future that completes once the
+        command has been written to the socket or, with wait_for_ack, once the device has
+        reported all the keys sent (failing with CommandTimeoutError if it does not)."""
+        ack = self._command_tracker.track(device, params)
+        try:
+            if self._command_coalescer is not None:
+                sent = self._command_coalescer.submit(device, params)
+            else:
+                sent = self._send_command_now(device, params)
+        except BaseException as ex:
+            self._command_tracker.fail(device.serial_number, ack, ex)
+            raise
+
+        def on_sent(sent_future: Future) -> None:
+            if sent_future.cancelled():
+                self._command_tracker.fail(device.serial_number, ack)
+            elif sent_future.exception() is not None:
+                self._command_tracker.fail(device.serial_number, ack, sent_future.exception())
+
+        sent.add_done_callback(on_sent)
+        return ack if wait_for_ack else sent
+
+    def _send_command_now(self, device: PyDreoBaseDevice, params) -> Future:
+        """Send a command without coalescing."""
+        content = self._build_command(device, params)
 
         if self.debug_test_mode:
-            _LOGGER.debug("Debug Test Mode is enabled.  Pretending we received the message...")
-            self._transport_consume_message({"devicesn": device.serial_number, 
-                                             "method": "report", 
-                                             "reported": params})
-        else:
-            # Send the message to the transport, which will then send it to the Dreo servers
-            self._transport.send_message(content)
+            self._debug_test_mode_report(device, params)
+            future = Future()
+            future.set_result(None)
+            return future
+
+        # Send the message to the transport, which will then send it to the Dreo servers
+        return self._transport.send_message(content)
+
+    async def async_send_command(self, device: PyDreoBaseDevice, params, wait_for_ack: bool = False) -> dict:
+        """Send a command to Dreo servers via the WebSocket, awaiting until it has been sent.
+
+        Commands are coalesced as by send_command().  With wait_for_ack, also wait until
+        the device has reported the keys sent and return the reported values."""
+        result = await asyncio.wrap_future(self.send_command(device, params, wait_for_ack))
+        return result if wait_for_ack else None
+
+
+# Star imports leave out the device classes so they do not import every device module.
+__all__ = [name for name in dict(globals()) if not name.startswith("_")]
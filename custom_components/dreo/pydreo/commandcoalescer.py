@@ -0,0 +1,108 @@
+"""Coalescing of rapid-fire commands to the same device."""
+
+import logging
+import threading
+from concurrent.futures import Future
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .constant import LOGGER_NAME
+from .scheduler import DEFAULT_SCHEDULER, ScheduledCall, Scheduler
+
+if TYPE_CHECKING:
+    from .pydreobasedevice import PyDreoBaseDevice
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+class _PendingCommand:
+    """Parameters collected for one device during a coalescing window."""
+
+    def __init__(self, device: "PyDreoBaseDevice"):
+        self.device = device
+        self.params: dict = {}
+        self.future = Future()
+        self.timer: ScheduledCall = None
+
+
+class CommandCoalescer:
+    """Merges commands sent to the same device within a time window into one message.
+
+    The first command for a device opens a window; commands that arrive before it
+    closes are merged into the same params dict (last write wins per key) and a
+    single control message is sent when the window closes."""
+
+    def __init__(self,
+                 window: float,
+                 send: Callable[["PyDreoBaseDevice", dict], Future],
+                 scheduler: Scheduler = DEFAULT_SCHEDULER):
+        self.window = window
+        self._send = send
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._pending: dict[str, _PendingCommand] = {}
+
+        self.commands_submitted = 0
+        self.commands_merged = 0
+        self.messages_sent = 0
+
+    def submit(self, device: "PyDreoBaseDevice", params: dict) -> Future:
+        """Queue params for a device.  The returned future completes when the merged
+        message has been sent."""
+        with self._lock:
+            self.commands_submitted += 1
+            pending = self._pending.get(device.serial_number)
+            if pending is None:
+                pending = _PendingCommand(device)
+                pending.timer = self._scheduler.call_later(self.window, self._flush, device.serial_number)
+                self._pending[device.serial_number] = pending
+            else:
+                self.commands_merged += 1
+                _LOGGER.debug("CommandCoalescer: merging %s into pending command for %s", params, device)
+            pending.params.update(params)
+            return pending.future
+
+    def _flush(self, serial_number: str) -> None:
+        """Send the merged command for a device."""
+        with self._lock:
+            pending = self._pending.pop(serial_number, None)
+            if pending is None:
+                return
+            pending.timer.cancel()
+            self.messages_sent += 1
+
+        try:
+            sent = self._send(pending.device, pending.params)
+        except Exception as ex: # pylint: disable=broad-except
+            pending.future.set_exception(ex)
+            return
+
+        if sent is None:
+            pending.future.set_result(None)
+            return
+
+        def copy_result(sent_future: Future) -> None:
+            if sent_future.cancelled():
+                pending.future.cancel()
+            elif sent_future.exception() is not None:
+                pending.future.set_exception(sent_future.exception())
+            else:
+                pending.future.set_result(sent_future.result())
+
+        sent.add_done_callback(copy_result)
+
+    def flush_all(self) -> None:
+        """Send all pending commands now."""
+        with self._lock:
+            serial_numbers = list(self._pending)
+        for serial_number in serial_numbers:
+            self._flush(serial_number)
+
+    @property
+    def stats(self) -> dict:
+        """Return coalescing counters."""
+        return {
+            "commands_submitted": self.commands_submitted,
+            "commands_merged": self.commands_merged,
+            "messages_sent": self.messages_sent,
+        }
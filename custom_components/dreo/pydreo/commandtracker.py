@@ -0,0 +1,242 @@
+"""Tracking of command acknowledgements and command-to-report latency."""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from .constant import LOGGER_NAME
+from .scheduler import DEFAULT_SCHEDULER, ScheduledCall, Scheduler
+
+if TYPE_CHECKING:
+    from .pydreobasedevice import PyDreoBaseDevice
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+# Seconds to wait for a device to report the keys of a command before giving up.
+DEFAULT_ACK_TIMEOUT = 10
+
+# Number of latency samples kept per device type.
+DEFAULT_LATENCY_WINDOW = 200
+
+# Upper bounds (seconds) of the latency histogram buckets.  Slower samples go in an overflow bucket.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10)
+
+
+class CommandTimeoutError(Exception):
+    """Exception set on a command future when the device did not report the change in time."""
+
+
+class LatencyHistogram:
+    """Rolling window of latency samples with bucketed counts and summary statistics."""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW, buckets: tuple = LATENCY_BUCKETS):
+        self._samples = deque(maxlen=window)
+        self._buckets = buckets
+        self._lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        """Record a latency sample in seconds."""
+        with self._lock:
+            self._samples.append(latency)
+
+    @property
+    def samples(self) -> list[float]:
+        """Samples currently in the window, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def buckets(self) -> dict[str, int]:
+        """Return the number of samples per bucket, keyed by bucket upper bound."""
+        counts = {f"<={bound}s": 0 for bound in self._buckets}
+        overflow = f">{self._buckets[-1]}s"
+        counts[overflow] = 0
+        for sample in self.samples:
+            for bound in self._buckets:
+                if sample <= bound:
+                    counts[f"<={bound}s"] += 1
+                    break
+            else:
+                counts[overflow] += 1
+        return counts
+
+    def percentile(self, percent: float) -> float:
+        """Return the given percentile (0-100) of the samples, or None if there are none."""
+        samples = sorted(self.samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(percent / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def as_dict(self) -> dict:
+        """Return the summary statistics and buckets as a dictionary."""
+        samples = self.samples
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "min": min(samples),
+            "max": max(samples),
+            "mean": sum(samples) / len(samples),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "buckets": self.buckets(),
+        }
+
+
+class _TrackedCommand:
+    """A command waiting for the device to report its keys."""
+
+    def __init__(self, device_type: str, params: dict):
+        self.device_type = device_type
+        self.outstanding = set(params)
+        self.reported: dict = {}
+        self.sent_at = time.monotonic()
+        self.future = Future()
+        self.timer: ScheduledCall = None
+
+
+class CommandTracker:
+    """Matches commands sent to devices with the reports that confirm them.
+
+    Pending commands are keyed by device serial number and param key.  A command's
+    future completes with the reported values once every key it sent has been
+    reported, or fails with CommandTimeoutError after the timeout."""
+
+    def __init__(self,
+                 timeout: float = DEFAULT_ACK_TIMEOUT,
+                 latency_window: int = DEFAULT_LATENCY_WINDOW,
+                 scheduler: Scheduler = DEFAULT_SCHEDULER):
+        self.timeout = timeout
+        self._scheduler = scheduler
+        self._latency_window = latency_window
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], list[_TrackedCommand]] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+        self.commands_tracked = 0
+        self.commands_acknowledged = 0
+        self.commands_timed_out = 0
+
+    def track(self, device: "PyDreoBaseDevice", params: dict) -> Future:
+        """Start tracking a command.  Returns a future for the acknowledgement."""
+        command = _TrackedCommand(str(device.type), params)
+        if not params:
+            command.future.set_result({})
+            return command.future
+
+        serial_number = device.serial_number
+        with self._lock:
+            self.commands_tracked += 1
+            for key in params:
+                self._pending.setdefault((serial_number, key), []).append(command)
+            command.timer = self._scheduler.call_later(self.timeout, self._expire, serial_number, command)
+        return command.future
+
+    def resolve(self, serial_number: str, reported: dict) -> None:
+        """Match the keys reported by a device against pending commands."""
+        completed: list[_TrackedCommand] = []
+        with self._lock:
+            for key, value in reported.items():
+                commands = self._pending.pop((serial_number, key), None)
+                if commands is None:
+                    continue
+                for command in commands:
+                    command.outstanding.discard(key)
+                    command.reported[key] = value
+                    if not command.outstanding:
+                        completed.append(command)
+
+        now = time.monotonic()
+        for command in completed:
+            command.timer.cancel()
+            latency = now - command.sent_at
+            self._histogram(command.device_type).add(latency)
+            with self._lock:
+                self.commands_acknowledged += 1
+            _LOGGER.debug("CommandTracker: %s acknowledged %s in %.3fs", serial_number, command.reported, latency)
+            if not command.future.done():
+                command.future.set_result(command.reported)
+
+    def fail(self, serial_number: str, future: Future, ex: BaseException = None) -> None:
+        """Stop tracking the command behind future because sending it failed.
+
+        The future fails with ex, or is cancelled if ex is None."""
+        with self._lock:
+            command = self._remove(serial_number, lambda c: c.future is future)
+        if command is not None:
+            command.timer.cancel()
+            if ex is None:
+                command.future.cancel()
+            elif not command.future.done():
+                command.future.set_exception(ex)
+
+    def cancel_all(self) -> None:
+        """Stop tracking all pending commands and cancel their futures."""
+        with self._lock:
+            commands = {id(c): c for cs in self._pending.values() for c in cs}.values()
+            self._pending.clear()
+        for command in commands:
+            command.timer.cancel()
+            command.future.cancel()
+
+    def _expire(self, serial_number: str, command: _TrackedCommand) -> None:
+        """Time out a command that the device did not confirm."""
+        with self._lock:
+            if self._remove(serial_number, lambda c: c is command) is None:
+                return
+            self.commands_timed_out += 1
+        _LOGGER.debug("CommandTracker: %s did not report %s within %ss",
+                      serial_number, command.outstanding, self.timeout)
+        if not command.future.done():
+            command.future.set_exception(
+                CommandTimeoutError(f"Device {serial_number} did not report {sorted(command.outstanding)}"))
+
+    def _remove(self, serial_number: str, match) -> _TrackedCommand:
+        """Remove the pending command matching from every key of a device.  Caller holds the lock."""
+        found = None
+        for (sn, key) in list(self._pending):
+            if sn != serial_number:
+                continue
+            commands = self._pending[(sn, key)]
+            for command in commands:
+                if match(command):
+                    found = command
+                    commands.remove(command)
+                    break
+            if not commands:
+                del self._pending[(sn, key)]
+        return found
+
+    def _histogram(self, device_type: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(device_type)
+            if histogram is None:
+                histogram = LatencyHistogram(self._latency_window)
+                self._histograms[device_type] = histogram
+            return histogram
+
+    @property
+    def pending_count(self) -> int:
+        """Number of commands waiting for acknowledgement."""
+        with self._lock:
+            return len({id(c) for cs in self._pending.values() for c in cs})
+
+    def latency_histograms(self) -> dict[str, LatencyHistogram]:
+        """Return the latency histogram of each device type."""
+        with self._lock:
+            return dict(self._histograms)
+
+    @property
+    def stats(self) -> dict:
+        """Return acknowledgement counters and per device type latency statistics."""
+        return {
+            "commands_tracked": self.commands_tracked,
+            "commands_acknowledged": self.commands_acknowledged,
+            "commands_timed_out": self.commands_timed_out,
+            "commands_pending": self.pending_count,
+            "latency": {device_type: histogram.as_dict()
+                        for device_type, histogram in self.latency_histograms().items()},
+        }
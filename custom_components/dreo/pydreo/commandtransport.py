@@ -4,37 +4,121 @@
 # from .pydreo import PyDreo
 import logging
 import threading
+import time
 
 import asyncio
+import concurrent.futures
+import functools
 import json
 from asyncio.exceptions import CancelledError
 from collections.abc import Callable
 
-import websockets
-
 from .constant import * # pylint: disable=W0401,W0614
 from .helpers import Helpers
 from .models import * # pylint: disable=W0401,W0614
+from .reconnectpolicy import ReconnectPolicy, ExponentialBackoffPolicy
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+MAX_SEND_ATTEMPTS = 3
+SEND_RETRY_DELAY = 5
+
+# Seconds stop_transport waits for the WebSocket thread to exit.
+DEFAULT_STOP_TIMEOUT = 5
+# Seconds allowed for the closing handshake before the connection is abandoned.
+CLOSE_TIMEOUT = 2
+# Seconds a connection must stay open before the reconnect backoff starts over.
+STABLE_CONNECTION_TIME = 60
+
+@functools.cache
+def _websockets():
+    """Return the websockets module.  It is imported when the first connection is made."""
+    import websockets # pylint: disable=import-outside-toplevel
+    return websockets
+
+class _OutboundMessage:
+    """A message waiting in the send queue, with the future handed back to the caller."""
+
+    def __init__(self, content: str, future: concurrent.futures.Future | None):
+        self.content = content
+        self.future = future
+        self.attempts = 0
+
+# HTTP status codes with which the server rejects the WebSocket handshake for a bad token.
+AUTH_FAILURE_STATUS_CODES = (401, 403)
+
+class TransportStats:
+    """Connection counters and downtime of a CommandTransport."""
+
+    def __init__(self):
+        self.connects = 0
+        self.reconnects = 0
+        self.connect_failures = 0
+        self.auth_failures = 0
+        self.token_refreshes = 0
+        self.total_downtime = 0.0
+        self._disconnected_at : float = None
+
+    def connected(self) -> None:
+        """Record an established connection, ending any downtime."""
+        if self.connects > 0:
+            self.reconnects += 1
+        self.connects += 1
+        if self._disconnected_at is not None:
+            self.total_downtime += time.monotonic() - self._disconnected_at
+            self._disconnected_at = None
+
+    def disconnected(self) -> None:
+        """Record the loss of an established connection."""
+        self._disconnected_at = time.monotonic()
+
+    @property
+    def current_downtime(self) -> float:
+        """Seconds since the connection was lost, or 0 if connected."""
+        if self._disconnected_at is None:
+            return 0.0
+        return time.monotonic() - self._disconnected_at
+
+    def as_dict(self) -> dict:
+        """Return the counters as a dictionary."""
+        return {
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "connect_failures": self.connect_failures,
+            "auth_failures": self.auth_failures,
+            "token_refreshes": self.token_refreshes,
+            "total_downtime": self.total_downtime + self.current_downtime,
+            "current_downtime": self.current_downtime,
+        }
+
 class CommandTransport: 
     """Command transport class for Dreo API."""
 
     def __init__(self, 
-                 recv_callback: Callable[[dict], None] ):
+                 recv_callback: Callable[[dict], None],
+                 token_refresh_callback: Callable[[], str] = None,
+                 reconnect_policy: ReconnectPolicy = None,
+                 reconnect_callback: Callable[[], None] = None):
 
         self._event_thread = None
+        self._loop : asyncio.AbstractEventLoop = None
+        self._close_event : asyncio.Event = None
+        self._main_task : asyncio.Task = None
+        self._stopped : concurrent.futures.Future = None
+        self._send_queue : asyncio.Queue = None
+        self._inflight_message : _OutboundMessage = None
         self._ws = None
-        self._ws_send_lock = threading.Lock()
         self._transport_enabled = False
         self._signal_close = False
-        self._testonly_signal_interrupt = False
         self._auto_reconnect = True
 
         self._api_server_region = None
         self._token = None
         self._recv_callback = recv_callback
+        self._token_refresh_callback = token_refresh_callback
+        self._reconnect_callback = reconnect_callback
+        self.reconnect_policy : ReconnectPolicy = reconnect_policy or ExponentialBackoffPolicy()
+        self.stats = TransportStats()
    
     @property
     def auto_reconnect(self) -> bool:
@@ -62,8 +146,29 @@ class CommandTransport:
         self._transport_enabled = True
         self._signal_close = False
 
+        # The loop and send queue are created up front so commands can be queued
+        # as soon as this method returns; they are sent once the socket is open.
+        self._loop = asyncio.new_event_loop()
+        self._send_queue = asyncio.Queue()
+        self._close_event = asyncio.Event()
+        self._stopped = concurrent.futures.Future()
+        self._inflight_message = None
+        loop = self._loop
+        stopped = self._stopped
+
         def start_ws_wrapper():
-            asyncio.run(self._start_websocket())
+            asyncio.set_event_loop(loop)
+            try:
+                self._main_task = loop.create_task(self._start_websocket())
+                try:
+                    loop.run_until_complete(self._main_task)
+                except CancelledError:
+                    _LOGGER.debug("CommandTransport::start_ws_wrapper - WebSocket task cancelled")
+                    self._fail_pending_messages()
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+                stopped.set_result(None)
 
         self._event_thread = threading.Thread(
             name="DreoWebSocketStream", target=start_ws_wrapper, args=()
@@ -71,49 +176,172 @@ class CommandTransport:
         self._event_thread.daemon = True
         self._event_thread.start()
 
-    def stop_transport(self) -> None:
-        '''Close down the monitoring socket'''
-        _LOGGER.info("Stopping Transport - May take up to 15s")
+    def _signal_stop(self) -> bool:
+        """Ask the WebSocket thread to close the socket and exit.  Returns False if it is not running."""
         self._signal_close = True
         self._transport_enabled = False
+        if self._loop is None or self._event_thread is None:
+            return False
+        try:
+            self._loop.call_soon_threadsafe(self._request_close)
+        except RuntimeError:
+            # Loop already closed; the thread is exiting.
+            pass
+        return True
+
+    def _request_close(self) -> None:
+        """Runs on the transport loop: close the open socket, or stop connecting."""
+        self._close_event.set()
+        if self._ws is None and self._main_task is not None:
+            # Not connected (connecting or waiting to reconnect); nothing to close gracefully.
+            self._main_task.cancel()
+
+    def stop_transport(self, timeout: float | None = DEFAULT_STOP_TIMEOUT) -> bool:
+        '''Close down the monitoring socket and wait up to timeout seconds for the thread to exit.
+
+        Returns True if the thread has exited.  With timeout=0 this only signals the thread.'''
+        _LOGGER.info("Stopping Transport")
+        if not self._signal_stop():
+            return True
+        thread = self._event_thread
+        if timeout == 0 or thread is threading.current_thread():
+            return not thread.is_alive()
+        thread.join(timeout)
+        if thread.is_alive():
+            _LOGGER.warning("WebSocket thread did not stop within %s seconds", timeout)
+            return False
+        return True
+
+    async def async_stop_transport(self, timeout: float | None = DEFAULT_STOP_TIMEOUT) -> bool:
+        '''Close down the monitoring socket and await up to timeout seconds for the thread to exit.'''
+        _LOGGER.info("Stopping Transport")
+        if not self._signal_stop():
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self._stopped)), timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("WebSocket thread did not stop within %s seconds", timeout)
+            return False
+        return True
 
     def testonly_interrupt_transport(self) -> None:
         '''Close down the monitoring socket'''
-        _LOGGER.info("Interrupting Transport - May take up to 15s")
-        self._testonly_signal_interrupt = True
+        _LOGGER.info("Interrupting Transport")
+        self._loop.call_soon_threadsafe(self._interrupt)
+
+    def _interrupt(self) -> None:
+        """Runs on the transport loop: drop the current connection so it reconnects."""
+        if self._ws is not None:
+            self._loop.create_task(self._ws.close())
+
+    def _build_url(self) -> str:
+        """Build the WebSocket URL.  The timestamp makes it unique to each connection attempt."""
+        return DREO_WSS_URL_FORMAT.format(self._api_server_region, self._token, Helpers.api_timestamp())
+
+    @staticmethod
+    def _is_auth_failure(ex: Exception) -> bool:
+        """Return True if the server rejected the handshake because of the token."""
+        response = getattr(ex, "response", None)
+        status_code = getattr(response, "status_code", None) or getattr(ex, "status_code", None)
+        return status_code in AUTH_FAILURE_STATUS_CODES
+
+    async def _refresh_token(self) -> None:
+        """Get a new token from the token refresh callback (a blocking call)."""
+        if self._token_refresh_callback is None:
+            _LOGGER.error("WebSocket token rejected and no way to refresh it.")
+            return
+        try:
+            token = await asyncio.get_running_loop().run_in_executor(None, self._token_refresh_callback)
+        except Exception as ex: # pylint: disable=broad-except
+            _LOGGER.error("Error refreshing WebSocket token: %s", ex)
+            return
+        if token:
+            self._token = token
+            self.stats.token_refreshes += 1
+            _LOGGER.info("WebSocket token refreshed")
+
+    def _run_reconnect_callback(self) -> None:
+        """Run the reconnect callback, logging rather than raising errors."""
+        try:
+            self._reconnect_callback()
+        except Exception: # pylint: disable=broad-except
+            _LOGGER.exception("Error in WebSocket reconnect callback")
 
     async def _start_websocket(self) -> None:
         """Start the websocket connection to monitor for device changes and send commands.
         This function exits when monitoring is stopped."""
+        websockets = _websockets()
         _LOGGER.info("Starting WebSocket for incoming changes and commands.")
-        # open websocket
-        url = f"wss://wsb-{self._api_server_region}.dreo-tech.com/websocket?accessToken={self._token}&timestamp={Helpers.api_timestamp()}"
-        async for ws in websockets.connect(url):
-            
+        self.reconnect_policy.reset()
+        while not self._signal_close:
+            try:
+                ws = await websockets.connect(self._build_url())
+            except Exception as ex: # pylint: disable=broad-except
+                self.stats.connect_failures += 1
+                if self._is_auth_failure(ex):
+                    self.stats.auth_failures += 1
+                    _LOGGER.warning("WebSocket token rejected; logging in again.")
+                    await self._refresh_token()
+                else:
+                    _LOGGER.warning("Error connecting WebSocket: %s", ex)
+
+                if not await self._wait_to_reconnect():
+                    _LOGGER.error("WebSocket could not connect.  Not Reconnecting.  Restart HA to reconnect.")
+                    break
+                continue
+
+            connected_at = time.monotonic()
+            self.stats.connected()
+            if self.stats.reconnects > 0 and self._reconnect_callback is not None:
+                # Reports sent while we were disconnected are lost; let the owner catch up
+                # without holding up the socket.
+                self._loop.run_in_executor(None, self._run_reconnect_callback)
+            async with ws:
+                try:
+                    self._ws = ws
+                    _LOGGER.info("WebSocket successfully opened")
+                    await self._ws_handler(ws)
+                except websockets.exceptions.ConnectionClosed:
+                    pass
+                finally:
+                    self._ws = None
+
             if self._signal_close:
                 _LOGGER.info("Transport has been stopped")
-                break # This break causes us not to connect
-            
-            try:
-                self._ws = ws
-                _LOGGER.info("WebSocket successfully opened")
-                await self._ws_handler(ws)
-            except websockets.exceptions.ConnectionClosed:
-                pass
+                break
 
+            self.stats.disconnected()
             if not self._auto_reconnect:
                 _LOGGER.error("WebSocket appears closed.  Not Reconnecting.  Restart HA to reconnect.")
                 break # This break causes us not to connect
-            else:
-                continue
 
+            # Only a connection that stayed up starts the backoff over, so a server that
+            # accepts and immediately drops connections is not hammered.
+            if time.monotonic() - connected_at >= STABLE_CONNECTION_TIME:
+                self.reconnect_policy.reset()
+            if not await self._wait_to_reconnect():
+                _LOGGER.error("WebSocket keeps closing.  Not Reconnecting.  Restart HA to reconnect.")
+                break
+
+        self._fail_pending_messages()
         _LOGGER.info("Transport has been stopped and thread done")  
 
+    async def _wait_to_reconnect(self) -> bool:
+        """Sleep for the reconnect policy's next delay.  Returns False if it gives up."""
+        delay = self.reconnect_policy.next_delay()
+        if delay is None:
+            return False
+        _LOGGER.info("Reconnecting WebSocket in %.1f seconds", delay)
+        await asyncio.sleep(delay)
+        return True
+
     async def _ws_handler(self, ws):
         consumer_task = asyncio.create_task(self._ws_consumer_handler(ws))
         ping_task = asyncio.create_task(self._ws_ping_handler(ws))
+        sender_task = asyncio.create_task(self._ws_sender_handler(ws))
+        close_task = asyncio.create_task(self._close_event.wait())
         done, pending = await asyncio.wait(
-            [consumer_task, ping_task],
+            [consumer_task, ping_task, sender_task, close_task],
             return_when=asyncio.FIRST_COMPLETED
         )
         _LOGGER.debug("CommandTransport::_ws_handler - WebSocket appears closed.")
@@ -125,6 +353,13 @@ class CommandTransport:
                 pass
         for task in done:
             task.exception()
+
+        if close_task in done:
+            _LOGGER.debug("CommandTransport::_ws_handler - Closing WebSocket")
+            try:
+                await asyncio.wait_for(ws.close(), CLOSE_TIMEOUT)
+            except (asyncio.TimeoutError, _websockets().exceptions.WebSocketException):
+                pass
         
     async def _ws_consumer_handler(self, ws):
         _LOGGER.debug("CommandTransport::_ws_consumer_handler")
@@ -132,60 +367,94 @@ class CommandTransport:
             async for message in ws:
                 _LOGGER.debug("CommandTransport::_ws_consumer_handler - got message")
                 self._ws_consume_message(json.loads(message))
-        except websockets.exceptions.ConnectionClosedError:
+        except _websockets().exceptions.ConnectionClosedError:
             _LOGGER.debug("CommandTransport::_ws_consumer_handler - WebSocket appears closed.")
         
     async def _ws_ping_handler(self, ws):
         _LOGGER.debug("_ws_ping_handler")
         while True:
             try:
-                # Were we told to kill the connection?
-                if (self._signal_close):
-                    _LOGGER.debug("CommandTransport::_ws_ping_handler - Closing WebSocket")
-                    await ws.close()
-
-                if self._testonly_signal_interrupt:
-                    _LOGGER.debug("CommandTransport::_ws_ping_handler - Closing WebSocket")
-                    self._testonly_signal_interrupt = False
-                    try:
-                        await ws.close()
-                    except CancelledError:
-                        pass
-                with self._ws_send_lock:
-                    await ws.send('2')
+                self._send_queue.put_nowait(_OutboundMessage('2', None))
                 await asyncio.sleep(15)
                
-            except websockets.exceptions.ConnectionClosedError:
+            except _websockets().exceptions.ConnectionClosedError:
                 _LOGGER.info('Dreo WebSocket Closed - Unless intended, will reconnect')
                 break
             except CancelledError:
                 _LOGGER.info('Dreo WebSocket Cancelled - Unless intended, will reconnect')
                 break
 
+    async def _ws_sender_handler(self, ws):
+        """Send queued messages one at a time.  This is the only task that writes to the
+        socket, so sends are serialized without a lock."""
+        _LOGGER.debug("CommandTransport::_ws_sender_handler")
+        while True:
+            message = self._inflight_message
+            if message is None:
+                message = await self._send_queue.get()
+                if message.future is not None and not message.future.set_running_or_notify_cancel():
+                    continue
+                self._inflight_message = message
+
+            try:
+                message.attempts += 1
+                await ws.send(message.content)
+            except _websockets().exceptions.ConnectionClosed:
+                # Keep the message in flight; it is sent again once we reconnect.
+                _LOGGER.debug("CommandTransport::_ws_sender_handler - WebSocket closed while sending.")
+                if message.attempts >= MAX_SEND_ATTEMPTS:
+                    self._complete_message(message, RuntimeError("WebSocket closed while sending command."))
+                break
+            except Exception as ex: # pylint: disable=broad-except
+                if message.attempts >= MAX_SEND_ATTEMPTS:
+                    _LOGGER.error("Error sending command. Giving up after %s attempts.", message.attempts)
+                    self._complete_message(message, ex)
+                    continue
+                _LOGGER.error("Error sending command. Retrying in %s seconds. Retry count: %s",
+                              SEND_RETRY_DELAY,
+                              message.attempts)
+                await asyncio.sleep(SEND_RETRY_DELAY)
+                continue
+
+            self._complete_message(message)
+
+    def _complete_message(self, message: _OutboundMessage, exception: Exception = None) -> None:
+        """Resolve the caller's future for a message and clear it from flight."""
+        if self._inflight_message is message:
+            self._inflight_message = None
+        if message.future is None or message.future.done():
+            return
+        if exception is None:
+            message.future.set_result(None)
+        else:
+            message.future.set_exception(exception)
+
+    def _fail_pending_messages(self) -> None:
+        """Fail any messages that will never be sent because the transport stopped."""
+        # The in-flight message's future is already running; only queued ones still need starting.
+        if self._inflight_message is not None:
+            self._complete_message(self._inflight_message, RuntimeError("Command transport stopped."))
+        while not self._send_queue.empty():
+            message = self._send_queue.get_nowait()
+            if message.future is not None and message.future.set_running_or_notify_cancel():
+                self._complete_message(message, RuntimeError("Command transport stopped."))
+
     def _ws_consume_message(self, message):
         self._recv_callback(message)
 
-    def send_message(self, content: dict):
-        """Send a command to Dreo servers via the WebSocket."""
-        if not self._transport_enabled:
+    def send_message(self, content: str) -> concurrent.futures.Future:
+        """Queue a command to be sent to Dreo servers via the WebSocket.
+
+        Safe to call from any thread.  Returns a future that completes once the
+        message has been written to the socket."""
+        if not self._transport_enabled or self._loop is None or self._loop.is_closed():
             _LOGGER.error("Command transport disabled. Run start_transport first.")
             raise RuntimeError("Command transport disabled. Run start_transport first.")
-        
-        async def send_internal() -> None:
-            MAX_RETRY_COUNT = 3
-            RETRY_DELAY = 5
-            retry_count = 0
-            while retry_count < MAX_RETRY_COUNT:
-                try:
-                    with self._ws_send_lock: 
-                        await self._ws.send(content)
-                    break
-                except: # pylint: disable=bare-except
-                    retry_count += 1
-                    _LOGGER.error("Error sending command. Retrying in %s seconds. Retry count: %s", 
-                                  RETRY_DELAY, 
-                                  retry_count)
-                    await asyncio.sleep(RETRY_DELAY)
-
-        asyncio.run(send_internal())
-        
+
+        future = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self._send_queue.put_nowait, _OutboundMessage(content, future))
+        return future
+
+    async def async_send_message(self, content: str) -> None:
+        """Send a command to Dreo servers via the WebSocket, awaitable from any event loop."""
+        await asyncio.wrap_future(self.send_message(content))
@@ -5,14 +5,19 @@ LOGGER_NAME = "pydreo"
 
 # Various keys read from server JSON responses.
 ACCESS_TOKEN_KEY = "access_token"
+EXPIRES_IN_KEY = "expires_in"
 REGION_KEY = "region"
 DATA_KEY = "data"
 LIST_KEY = "list"
 MIXED_KEY = "mixed"
+TOTAL_PAGE_KEY = "totalPage"
+PAGE_NO_KEY = "pageNo"
+PAGE_SIZE_KEY = "pageSize"
 DEVICEID_KEY = "deviceid"
 DEVICESN_KEY = "deviceSn"
 REPORTED_KEY = "reported"
 STATE_KEY = "state"
+TIMESTAMP_KEY = "timestamp"
 POWERON_KEY = "poweron"
 WINDTYPE_KEY = "windtype"
 WINDLEVEL_KEY = "windlevel"
@@ -66,6 +71,9 @@ DREO_API_URL_FORMAT = (
     "https://app-api-{0}.dreo-tech.com"  # {0} is the 2 letter region code
 )
 
+# {0} is the 2 letter region code, {1} the access token and {2} the timestamp
+DREO_WSS_URL_FORMAT = "wss://wsb-{0}.dreo-tech.com/websocket?accessToken={1}&timestamp={2}"
+
 DREO_API_PATH = "path"
 DREO_API_METHOD = "method"
 
@@ -75,6 +83,9 @@ DREO_API_DEVICESTATE = "devicestate"
 DREO_API_SETTING_GET = "setting_get"
 DREO_API_SETTING_PUT = "setting_put"
 
+# Number of devices requested per page of the device list.
+DEVICE_LIST_PAGE_SIZE = 100
+
 DREO_API_SETTING_DATA_KEY = "dataKey"
 DREO_API_SETTING_DATA_VALUE = "dataValue"
 
@@ -135,6 +146,31 @@ HEATER_MODES = [
     HEATER_MODE_OFF
 ]
 
+# Kinds of entity a device can have, named like the Home Assistant platforms that provide them.
+PLATFORM_FAN = "fan"
+PLATFORM_CLIMATE = "climate"
+PLATFORM_HUMIDIFIER = "humidifier"
+PLATFORM_LIGHT = "light"
+PLATFORM_SENSOR = "sensor"
+PLATFORM_SWITCH = "switch"
+PLATFORM_NUMBER = "number"
+
+# Air conditioner work time and target temperature status
+WORK_TIME = "worktime"
+TEMP_TARGET_REACHED = "reachtarget"
+
+# Status for water level indicator (humidifiers and evaporative coolers)
+WATER_LEVEL_STATUS_KEY = "wrong"
+WATER_LEVEL_OK = "Ok"
+WATER_LEVEL_EMPTY = "Empty"
+
+# Humidifier light states and modes
+LIGHT_ON = "Enable"
+LIGHT_OFF = "Disabled"
+MODE_MANUAL = "manual"
+MODE_AUTO = "auto"
+MODE_SLEEP = "sleep"
+
 AC_ECO_LEVEL_MAP = {
     1 : "10%",
     2 : "20%",
@@ -1,14 +1,18 @@
 """Helper functions for PyDreo library."""
 
+import asyncio
 import hashlib
 import logging
 import time
 import json
-from typing import Optional, Union
+from typing import Optional, Union, TYPE_CHECKING
 import re
-import requests
 
-from .constant import LOGGER_NAME
+from .constant import LOGGER_NAME, PAGE_NO_KEY, PAGE_SIZE_KEY, DEVICE_LIST_PAGE_SIZE
+
+if TYPE_CHECKING:
+    import aiohttp
+    from .httpsession import HttpSession
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
@@ -60,8 +64,8 @@ class Helpers:
         elif type_ == "devicelist":
             body = {**cls.req_body_base()}
             body["method"] = "devices"
-            body["pageNo"] = "1"
-            body["pageSize"] = "100"
+            body[PAGE_NO_KEY] = "1"
+            body[PAGE_SIZE_KEY] = str(DEVICE_LIST_PAGE_SIZE)
 
         return body
 
@@ -105,6 +109,52 @@ class Helpers:
             )
         return stringvalue
 
+    @staticmethod
+    def _request_kwargs(url: str, api: str, method: str, json_object: dict, headers: dict) -> dict | None:
+        """Log an API call and return the request arguments for its method, or None if the
+        method is not supported."""
+        _LOGGER.debug("=======call_api=============================")
+        _LOGGER.debug("[%s] calling '%s' api", method, api)
+        _LOGGER.debug("API call URL: \n  %s%s", url, api)
+        _LOGGER.debug(
+            "API call headers: \n  %s", Helpers.redactor(
+                json.dumps(headers))
+        )
+        _LOGGER.debug(
+            "API call json: \n  %s", Helpers.redactor(
+                json.dumps(json_object))
+        )
+        if method.lower() == "get":
+            return {
+                "headers": headers,
+                "params": {**json_object, "timestamp": Helpers.api_timestamp()},
+            }
+        if method.lower() == "post":
+            return {
+                "json": json_object,
+                "headers": headers,
+                "params": {"timestamp": Helpers.api_timestamp()},
+            }
+        if method.lower() == "put":
+            return {"json": json_object, "headers": headers}
+        _LOGGER.error("Unsupported API method: %s", method)
+        return None
+
+    @staticmethod
+    def _parse_response(url: str, api: str, status_code: int, content: bytes) -> tuple:
+        """Return the (response, status_code) tuple for an HTTP response."""
+        if status_code != 200:
+            _LOGGER.debug("Unable to fetch %s%s (HTTP %s)", url, api, status_code)
+            return None, status_code
+        response = None
+        if content:
+            response = json.loads(content)
+            _LOGGER.debug(
+                "API response: \n\n  %s \n ",
+                Helpers.redactor(json.dumps(response)),
+            )
+        return response, status_code
+
     @staticmethod
     def call_api(
         url: str,
@@ -112,56 +162,57 @@ class Helpers:
         method: str,
         json_object: Optional[dict] = None,
         headers: Optional[dict] = None,
+        session: Optional["HttpSession"] = None,
     ) -> tuple:
-        """Make API calls by passing endpoint, header and body."""
-        response = None
-        status_code = None
-        r = None # Response object
+        """Make API calls by passing endpoint, header and body.
+
+        If a session is given, the call goes through its connection pool,
+        otherwise a new connection is opened for the call."""
+        import requests # pylint: disable=import-outside-toplevel
+
+        request_kwargs = Helpers._request_kwargs(url, api, method, json_object, headers)
+        if request_kwargs is None:
+            return None, None
         try:
-            _LOGGER.debug("=======call_api=============================")
-            _LOGGER.debug("[%s] calling '%s' api", method, api)
-            _LOGGER.debug("API call URL: \n  %s%s", url, api)
-            _LOGGER.debug(
-                "API call headers: \n  %s", Helpers.redactor(
-                    json.dumps(headers))
-            )
-            _LOGGER.debug(
-                "API call json: \n  %s", Helpers.redactor(
-                    json.dumps(json_object))
-            )
-            if method.lower() == "get":
-                r = requests.get(
-                    url + api,
-                    headers=headers,
-                    params={**json_object, "timestamp": Helpers.api_timestamp()},
-                    timeout=API_TIMEOUT,
-                )
-            elif method.lower() == "post":
-                r = requests.post(
-                    url + api,
-                    json=json_object,
-                    headers=headers,
-                    params={"timestamp": Helpers.api_timestamp()},
-                    timeout=API_TIMEOUT,
-                )
-            elif method.lower() == "put":
-                r = requests.put(
-                    url + api, json=json_object, headers=headers, timeout=API_TIMEOUT
-                )
+            if session is not None:
+                r = session.request(method.upper(), url + api, **request_kwargs)
+            else:
+                r = requests.request(method.upper(), url + api, timeout=API_TIMEOUT, **request_kwargs)
         except requests.exceptions.RequestException as exception:
             _LOGGER.debug(exception)
-        else:
-            if r.status_code == 200:
-                status_code = 200
-                if r.content:
-                    response = r.json()
-                    _LOGGER.debug(
-                        "API response: \n\n  %s \n ",
-                        Helpers.redactor(json.dumps(response)),
-                    )
-            else:
-                _LOGGER.debug("Unable to fetch %s%s", url, api)
-        return response, status_code
+            return None, None
+        return Helpers._parse_response(url, api, r.status_code, r.content)
+
+    @staticmethod
+    async def async_call_api(
+        url: str,
+        api: str,
+        method: str,
+        json_object: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ) -> tuple:
+        """Make API calls on the running event loop using an aiohttp session.
+
+        Mirrors call_api() and returns the same (response, status_code) tuple."""
+        import aiohttp # pylint: disable=import-outside-toplevel
+
+        request_kwargs = Helpers._request_kwargs(url, api, method, json_object, headers)
+        if request_kwargs is None:
+            return None, None
+        try:
+            async with session.request(
+                method.upper(),
+                url + api,
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+                **request_kwargs,
+            ) as r:
+                content = await r.read() if r.status == 200 else None
+                status_code = r.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+            _LOGGER.debug(exception)
+            return None, None
+        return Helpers._parse_response(url, api, status_code, content)
 
     @staticmethod
     def     code_check(reponse_dict: dict) -> bool:
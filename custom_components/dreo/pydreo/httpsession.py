@@ -0,0 +1,157 @@
+"""Pooled HTTP session for the Dreo REST API."""
+
+import functools
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from .constant import LOGGER_NAME
+
+if TYPE_CHECKING:
+    import requests
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 30
+
+
+class HttpSessionStats:
+    """Thread-safe counters for connections opened and reused by an HttpSession."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+        self._connection_checkouts = 0
+        self._requests = 0
+
+    def connection_opened(self) -> None:
+        """Record that a new TCP (and TLS) connection was opened."""
+        with self._lock:
+            self._connections_opened += 1
+
+    def connection_checked_out(self) -> None:
+        """Record that a connection was taken from the pool for a request."""
+        with self._lock:
+            self._connection_checkouts += 1
+
+    def request_sent(self) -> None:
+        """Record that a request was sent."""
+        with self._lock:
+            self._requests += 1
+
+    @property
+    def connections_opened(self) -> int:
+        """Number of connections opened."""
+        return self._connections_opened
+
+    @property
+    def connections_reused(self) -> int:
+        """Number of times an already open connection was used for a request."""
+        with self._lock:
+            return max(0, self._connection_checkouts - self._connections_opened)
+
+    @property
+    def requests(self) -> int:
+        """Number of requests sent."""
+        return self._requests
+
+    def as_dict(self) -> dict:
+        """Return the counters as a dictionary."""
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+        }
+
+
+def _counting_pool_class(base_class: type, stats: HttpSessionStats) -> type:
+    """Create a urllib3 connection pool class that reports to stats."""
+
+    class CountingConnectionPool(base_class):
+        """Connection pool that counts new connections and checkouts."""
+
+        def _new_conn(self):
+            stats.connection_opened()
+            return super()._new_conn()
+
+        def _get_conn(self, timeout=None):
+            stats.connection_checked_out()
+            return super()._get_conn(timeout)
+
+    return CountingConnectionPool
+
+
+@functools.cache
+def _counting_adapter_class() -> type:
+    """Create the HTTPAdapter class.  requests is imported when the first session is created."""
+    # pylint: disable=import-outside-toplevel
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class CountingHTTPAdapter(HTTPAdapter):
+        """HTTPAdapter whose pools report connection usage to an HttpSessionStats."""
+
+        def __init__(self, stats: HttpSessionStats, **kwargs):
+            self._stats = stats
+            super().__init__(**kwargs)
+
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": _counting_pool_class(HTTPConnectionPool, self._stats),
+                "https": _counting_pool_class(HTTPSConnectionPool, self._stats),
+            }
+
+    return CountingHTTPAdapter
+
+
+class HttpSession:
+    """Keep-alive HTTP session shared by all REST calls of a PyDreo instance."""
+
+    def __init__(self,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT):
+        self.stats = HttpSessionStats()
+        self.timeout = (connect_timeout, read_timeout)
+        self._pool_size = pool_size
+        # Created by the first request.
+        self._session: "requests.Session" = None
+        self._session_lock = threading.Lock()
+
+    def _create_session(self) -> "requests.Session":
+        import requests # pylint: disable=import-outside-toplevel
+
+        session = requests.Session()
+        adapter = _counting_adapter_class()(self.stats,
+                                            pool_connections=1,
+                                            pool_maxsize=self._pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_session(self) -> "requests.Session":
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    @property
+    def pool_size(self) -> int:
+        """Maximum number of connections kept open per host."""
+        return self._pool_size
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send a request over the pooled session."""
+        kwargs.setdefault("timeout", self.timeout)
+        self.stats.request_sent()
+        return self._get_session().request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        _LOGGER.debug("HttpSession::close")
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
@@ -0,0 +1,211 @@
+"""Dispatch of WebSocket messages to devices off the socket thread."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from .constant import LOGGER_NAME, REPORTED_KEY, TIMESTAMP_KEY, DREO_API_METHOD
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+# Maximum number of messages waiting to be dispatched.  Messages that arrive while
+# the queue is full and cannot be merged into a waiting report are dropped.
+DEFAULT_MAX_PENDING_MESSAGES = 1000
+
+# Seconds stop() waits for the worker thread to exit.
+DEFAULT_STOP_TIMEOUT = 5
+
+# WebSocket messages name the device in lower case, unlike REST requests.
+_MESSAGE_DEVICESN_KEY = "devicesn"
+
+
+def _is_report(message: dict) -> bool:
+    return message.get(DREO_API_METHOD) == "report" and isinstance(message.get(REPORTED_KEY), dict)
+
+
+def _can_merge(waiting: dict, message: dict) -> bool:
+    """A report can be merged into a waiting report if the merged report's timestamp is
+    right for all of its values: both reports have the same timestamp, or the report is
+    newer and has a value for every key of the waiting report.
+
+    Other reports are queued on their own so the device can drop their stale values."""
+    if not (_is_report(waiting) and _is_report(message)):
+        return False
+    if message.get(TIMESTAMP_KEY) == waiting.get(TIMESTAMP_KEY):
+        return True
+    try:
+        newer = float(message.get(TIMESTAMP_KEY)) >= float(waiting.get(TIMESTAMP_KEY))
+    except (TypeError, ValueError):
+        return False
+    return newer and message[REPORTED_KEY].keys() >= waiting[REPORTED_KEY].keys()
+
+
+class _QueuedMessage:
+    """A message waiting to be dispatched."""
+
+    def __init__(self, message: dict):
+        self.message = message
+        self.queued_at = time.monotonic()
+
+
+class MessageDispatcher:
+    """Hands messages received on the WebSocket to a handler on a worker thread.
+
+    The socket thread only enqueues messages, so slow device callbacks do not delay
+    reading from the socket or sending pings.  Messages for the same device are
+    handled in the order they arrived.  A report for a device that already has a
+    report waiting is merged into it (later values win) when that keeps the waiting
+    report's timestamp right for each value, so a burst of reports collapses into one.
+    The queue holds at most max_pending messages."""
+
+    def __init__(self,
+                 handler: Callable[[dict], None],
+                 max_pending: int = DEFAULT_MAX_PENDING_MESSAGES):
+        self._handler = handler
+        self.max_pending = max_pending
+        self._condition = threading.Condition()
+        self._queues: dict[str, deque[_QueuedMessage]] = {}
+        self._ready: deque[str] = deque()
+        self._pending = 0
+        self._thread: threading.Thread = None
+        self._stopping = False
+        self._stopped: Future = None
+
+        self.messages_received = 0
+        self.messages_dispatched = 0
+        self.messages_merged = 0
+        self.messages_dropped = 0
+        self.max_queue_depth = 0
+        self.max_lag = 0.0
+
+    def start(self) -> None:
+        """Start the worker thread if it is not running.  A worker that is still exiting
+        because stop() timed out is not replaced until it has exited."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                if self._stopping:
+                    # Starting another worker would dispatch alongside the one still exiting.
+                    _LOGGER.warning("MessageDispatcher: previous worker thread has not exited yet")
+                return
+            self._stopping = False
+            self._stopped = Future()
+            self._thread = threading.Thread(target=self._run, name="DreoMessageDispatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = DEFAULT_STOP_TIMEOUT) -> bool:
+        """Stop the worker thread, discarding waiting messages.  Returns True if it has exited."""
+        thread = self._signal_stop()
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    async def async_stop(self, timeout: float | None = DEFAULT_STOP_TIMEOUT) -> bool:
+        """Stop the worker thread, awaiting up to timeout seconds for it to exit."""
+        if self._signal_stop() is None:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self._stopped)), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _signal_stop(self) -> threading.Thread:
+        with self._condition:
+            thread = self._thread
+            self._stopping = True
+            self._queues.clear()
+            self._ready.clear()
+            self._pending = 0
+            self._condition.notify_all()
+        return thread
+
+    def submit(self, message: dict) -> None:
+        """Queue a message received from the WebSocket.  Called on the socket thread."""
+        serial_number = message.get(_MESSAGE_DEVICESN_KEY)
+        with self._condition:
+            self.messages_received += 1
+            queue = self._queues.get(serial_number)
+            if queue and _can_merge(queue[-1].message, message):
+                waiting = queue[-1].message
+                waiting[REPORTED_KEY].update(message[REPORTED_KEY])
+                if TIMESTAMP_KEY in message:
+                    waiting[TIMESTAMP_KEY] = message[TIMESTAMP_KEY]
+                self.messages_merged += 1
+                return
+
+            if self._pending >= self.max_pending:
+                self.messages_dropped += 1
+                _LOGGER.warning("MessageDispatcher: queue full, dropping message for %s", serial_number)
+                return
+
+            if queue is None:
+                queue = self._queues[serial_number] = deque()
+            if not queue:
+                self._ready.append(serial_number)
+            # Copy the reported values, since merging updates them in place.
+            if _is_report(message):
+                message = dict(message, **{REPORTED_KEY: dict(message[REPORTED_KEY])})
+            queue.append(_QueuedMessage(message))
+            self._pending += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._pending)
+            self._condition.notify()
+
+    def _next(self) -> _QueuedMessage | None:
+        """Wait for the next message to dispatch, or None when stopping."""
+        with self._condition:
+            while not self._stopping and not self._ready:
+                self._condition.wait()
+            if self._stopping:
+                return None
+            serial_number = self._ready.popleft()
+            queue = self._queues[serial_number]
+            queued = queue.popleft()
+            self._pending -= 1
+            if queue:
+                # Let other devices go first so one busy device does not starve them.
+                self._ready.append(serial_number)
+            else:
+                del self._queues[serial_number]
+            self.max_lag = max(self.max_lag, time.monotonic() - queued.queued_at)
+            return queued
+
+    def _run(self) -> None:
+        stopped = self._stopped
+        try:
+            while True:
+                queued = self._next()
+                if queued is None:
+                    break
+                try:
+                    self._handler(queued.message)
+                except Exception: # pylint: disable=broad-except
+                    _LOGGER.exception("MessageDispatcher: error handling message %s", queued.message)
+                with self._condition:
+                    self.messages_dispatched += 1
+        finally:
+            stopped.set_result(None)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting to be dispatched."""
+        with self._condition:
+            return self._pending
+
+    @property
+    def stats(self) -> dict:
+        """Return dispatch counters, the current and maximum queue depth, and the maximum lag in seconds."""
+        with self._condition:
+            return {
+                "messages_received": self.messages_received,
+                "messages_dispatched": self.messages_dispatched,
+                "messages_merged": self.messages_merged,
+                "messages_dropped": self.messages_dropped,
+                "queue_depth": self._pending,
+                "max_queue_depth": self.max_queue_depth,
+                "max_lag": self.max_lag,
+            }
@@ -1,5 +1,6 @@
 """Supported device models for the PyDreo library."""
 
+import functools
 from dataclasses import dataclass
 
 from .constant import (
@@ -299,3 +300,23 @@ SUPPORTED_DEVICES = {
         },
     )
 }
+
+# Supported prefixes that have device details, by length, longest first.  A model
+# resolves to its own entry in SUPPORTED_DEVICES, else to its longest such prefix.
+_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in SUPPORTED_MODEL_PREFIXES if prefix in SUPPORTED_DEVICES},
+                               reverse=True))
+_PREFIX_DEVICES = {prefix: SUPPORTED_DEVICES[prefix] for prefix in SUPPORTED_MODEL_PREFIXES
+                   if prefix in SUPPORTED_DEVICES}
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_model(model: str) -> DreoDeviceDetails | None:
+    """Return the details of a device model, or None if the model is not supported."""
+    details = SUPPORTED_DEVICES.get(model)
+    if details is not None:
+        return details
+    for length in _PREFIX_LENGTHS:
+        details = _PREFIX_DEVICES.get(model[:length])
+        if details is not None:
+            return details
+    return None
@@ -20,6 +20,7 @@ from .constant import (
 )
 
 from .pydreofanbase import PyDreoFanBase
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
@@ -31,6 +32,14 @@ if TYPE_CHECKING:
 class PyDreoAirCirculator(PyDreoFanBase):
     """Base class for Dreo Fan API Calls."""
 
+    STATE_FIELDS = (
+        DreoField(HORIZONTAL_OSCILLATION_KEY, "_horizontally_oscillating", bool),
+        DreoField(VERTICAL_OSCILLATION_KEY, "_vertically_oscillating", bool),
+        DreoField(OSCMODE_KEY, "_osc_mode", int),
+        DreoField(CRUISECONF_KEY, "_cruise_conf", str),
+        DreoField(FIXEDCONF_KEY, "_fixed_conf", str),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -344,39 +353,3 @@ class PyDreoAirCirculator(PyDreoFanBase):
         if self._fixed_conf is not None:
             # Note that HA seems to send this in as a float, we need to convert to int just in case
             self._send_command(FIXEDCONF_KEY, f"{int(value)},{self._fixed_conf.split(',')[1]}")
-
-    def update_state(self, state: dict):
-        """Process the state dictionary from the REST API."""
-        _LOGGER.debug("PyDreoAirCirculator:update_state")
-        super().update_state(state)
-
-        self._horizontally_oscillating = self.get_state_update_value(state, HORIZONTAL_OSCILLATION_KEY)
-        self._vertically_oscillating = self.get_state_update_value(state, VERTICAL_OSCILLATION_KEY)
-        self._osc_mode = self.get_state_update_value(state, OSCMODE_KEY)
-        self._cruise_conf = self.get_state_update_value(state, CRUISECONF_KEY)
-        self._fixed_conf = self.get_state_update_value(state, FIXEDCONF_KEY)
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoAirCirculator:handle_server_update")
-        super().handle_server_update(message)
-
-        val_horiz_oscillation = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_KEY)
-        if isinstance(val_horiz_oscillation, bool):
-            self._horizontally_oscillating = val_horiz_oscillation
-
-        val_vert_oscillation = self.get_server_update_key_value(message, VERTICAL_OSCILLATION_KEY)
-        if isinstance(val_vert_oscillation, bool):
-            self._vertically_oscillating = val_vert_oscillation
-
-        val_osc_mode = self.get_server_update_key_value(message, OSCMODE_KEY)
-        if isinstance(val_osc_mode, int):
-            self._osc_mode = val_osc_mode
-
-        val_cruiseconf = self.get_server_update_key_value(message, CRUISECONF_KEY)
-        if isinstance(val_cruiseconf, str):
-            self._cruise_conf = val_cruiseconf
-
-        val_fixed_conf = self.get_server_update_key_value(message, FIXEDCONF_KEY)
-        if isinstance(val_fixed_conf, str):
-            self._fixed_conf = val_fixed_conf
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Dict
 
 from .constant import (
     LOGGER_NAME,
+    PLATFORM_CLIMATE,
     TEMPERATURE_KEY,
     TARGET_TEMPERATURE_KEY,
     SLEEPTEMPOFFSET_KEY,
@@ -21,6 +22,8 @@ from .constant import (
     TIMEROFF_KEY,
     CHILDLOCKON_KEY,
     TEMPOFFSET_KEY,
+    WORK_TIME,
+    TEMP_TARGET_REACHED,
     FIXEDCONF_KEY,
     TemperatureUnit,
     WINDLEVEL_KEY,
@@ -35,6 +38,7 @@ from .constant import (
     PRESET_SLEEP
 )
 from .pydreobasedevice import PyDreoBaseDevice
+from .statefields import DreoField, duration
 from .models import DreoDeviceDetails
 
 DREO_AC_MODE_COOL = 1
@@ -65,9 +69,6 @@ DREO_AC_FAN_MODE_MAP = {
 AC_OSC_ON = 2
 AC_OSC_OFF = 0
 
-WORK_TIME = "worktime"
-TEMP_TARGET_REACHED = "reachtarget"
-
 # Map: Celsius setting → Fahrenheit value to send to API
 # This is based on actual Fahrenheit values sent to the AC when using the remote control while AC is set to Celsius
 CELSIUS_TO_FAHRENHEIT_MAP = {
@@ -96,6 +97,36 @@ if TYPE_CHECKING:
 class PyDreoAC(PyDreoBaseDevice):
     """Base class for Dreo air conditioner API Calls."""
 
+    PLATFORMS = PyDreoBaseDevice.PLATFORMS | {PLATFORM_CLIMATE}
+
+    STATE_FIELDS = (
+        DreoField(TEMPERATURE_KEY, "_temperature", int),
+        DreoField(TARGET_TEMPERATURE_KEY, "_target_temperature", int),
+        DreoField(MODE_KEY, types=int, handler="_decode_mode"),
+        DreoField(WINDLEVEL_KEY, "_fan_mode", int, transform=DREO_AC_FAN_MODE_MAP.get),
+        DreoField(OSCMODE_KEY, "_osc_mode", int),
+        DreoField(MUTEON_KEY, "_mute_on", bool),
+        DreoField(DEVON_KEY, "_dev_on", bool),
+        DreoField(TIMERON_KEY, "_timer_on", (int, dict), transform=duration),
+        DreoField(COOLDOWN_KEY, "_cooldown", int),
+        DreoField(PTCON_KEY, "_ptc_on", bool),
+        DreoField(LIGHTON_KEY, "_display_auto_off", bool, transform=lambda light_on: not light_on),
+        DreoField(CTLSTATUS_KEY, "_ctlstatus", str),
+        DreoField(TIMEROFF_KEY, "_timer_off", (int, dict), transform=duration),
+        DreoField(CHILDLOCKON_KEY, "_childlockon", bool),
+        DreoField(TEMPOFFSET_KEY, "_tempoffset", int),
+        DreoField(FIXEDCONF_KEY, "_fixed_conf", str),
+        DreoField(HUMIDITY_KEY, "_humidity", int),
+        DreoField(TARGET_HUMIDITY_KEY, "_target_humidity", int),
+        DreoField(WORK_TIME, "work_time", int),
+        DreoField(TEMP_TARGET_REACHED, "temp_target_reached", int,
+                  transform=lambda reached: "Yes" if reached > 0 else "No"),
+        # TODO ecopauserate
+    )
+
+    # Set by _decode_mode.
+    STATE_ATTRIBUTES = ("_mode", "_preset_mode")
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air conditioner devices."""
         super().__init__(device_definition, details, dreo)
@@ -350,17 +381,11 @@ class PyDreoAC(PyDreoBaseDevice):
         else:
             self._send_command(MODE_KEY, DREO_AC_MODE_COOL)
         
-        self._preset_mode = mode
-
-    def update_state(self, state: dict):
-        """Process the state dictionary from the REST API."""
-        super().update_state(state)  # handles _is_on
+        with self.state_update():
+            self._preset_mode = mode
 
-        _LOGGER.debug("PyDreoAC(%s):update_state: %s", self.name, state)
-        self._temperature = self.get_state_update_value(state, TEMPERATURE_KEY)
-        self._target_temperature = self.get_state_update_value(state, TARGET_TEMPERATURE_KEY)
-        
-        mode = self.get_state_update_value(state, MODE_KEY)
+    def _decode_mode(self, mode: int) -> None:
+        # Eco and sleep are reported as modes, but are presets of cool mode.
         if mode == DREO_AC_MODE_ECO:
             mode = DREO_AC_MODE_COOL
             self._preset_mode = PRESET_ECO
@@ -370,129 +395,6 @@ class PyDreoAC(PyDreoBaseDevice):
         else:
             self._preset_mode = PRESET_NONE
         self._mode = mode
-        
-        self._fan_mode = DREO_AC_FAN_MODE_MAP[self.get_state_update_value(state, WINDLEVEL_KEY)]
-        self._osc_mode = self.get_state_update_value(state, OSCMODE_KEY)
-        self._mute_on = self.get_state_update_value(state, MUTEON_KEY)
-        self._dev_on = self.get_state_update_value(state, DEVON_KEY)
-        timeron = self.get_state_update_value(state, TIMERON_KEY)
-        self._timer_on = timeron["du"]
-        self._cooldown = self.get_state_update_value(state, COOLDOWN_KEY)
-        self._ptc_on = self.get_state_update_value(state, PTCON_KEY)
-        self._display_auto_off = not self.get_state_update_value(state, LIGHTON_KEY)
-        self._ctlstatus = self.get_state_update_value(state, CTLSTATUS_KEY)
-        timeroff = self.get_state_update_value(state, TIMEROFF_KEY)
-        self._timer_off = timeroff["du"]
-        self._childlockon = self.get_state_update_value(state, CHILDLOCKON_KEY)
-        self._tempoffset = self.get_state_update_value(state, TEMPOFFSET_KEY)
-        self._fixed_conf = self.get_state_update_value(state, FIXEDCONF_KEY)
-        self._humidity = self.get_state_update_value(state, HUMIDITY_KEY)
-        self._target_humidity = self.get_state_update_value(state, TARGET_HUMIDITY_KEY)
-        self.work_time = self.get_state_update_value(state, WORK_TIME)
-        self.temp_target_reached = "Yes" if self.get_state_update_value(state, TEMP_TARGET_REACHED) > 0 else "No"
-        # TODO ecopauserate
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoAC:handle_server_update(%s): %s", self.name, message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron  # Ensure poweron state is updated
-            _LOGGER.debug("PyDreoAC:handle_server_update - poweron is %s", self._is_on)
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, int):
-            self._temperature = val_temperature
-
-        val_target_temperature = self.get_server_update_key_value(message, TARGET_TEMPERATURE_KEY)
-        if isinstance(val_target_temperature, int):
-            _LOGGER.debug("PyDreoAC(%s):handle_server_update - target_temperature: %s --> %s", 
-                          self, 
-                          self._target_temperature, 
-                          val_target_temperature)
-            self._target_temperature = val_target_temperature
-
-        # Reported mode can be an empty string if the AC is off. Deal with that by
-        # explicitly setting that to off.
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, int):
-            target_mode = val_mode
-            if target_mode == 5:
-                target_mode = DREO_AC_MODE_COOL
-                self._preset_mode = PRESET_ECO
-            elif target_mode == 4:
-                target_mode = DREO_AC_MODE_COOL
-                self._preset_mode = PRESET_SLEEP
-            else:
-                self._preset_mode = PRESET_NONE
-            _LOGGER.debug("PyDreoAC(%s):handle_server_update - mode: %s --> %s", 
-                          self, 
-                          self._mode, 
-                          target_mode)
-            self._mode = target_mode
-
-        val_fan_mode = self.get_server_update_key_value(message, WINDLEVEL_KEY)
-        if isinstance(val_fan_mode, int):
-            val_fan_mode = DREO_AC_FAN_MODE_MAP[val_fan_mode]
-            _LOGGER.debug("PyDreoAC(%s):handle_server_update - fan_mode: %s --> %s", self, self._fan_mode, val_fan_mode)
-            self._fan_mode = val_fan_mode
-
-        val_osc_mode = self.get_server_update_key_value(message, OSCMODE_KEY)
-        if isinstance(val_osc_mode, int):
-            self._osc_mode = val_osc_mode
-
-        val_muteon = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_muteon, bool):
-            self._mute_on = val_muteon
-
-        val_devon = self.get_server_update_key_value(message, DEVON_KEY)
-        if isinstance(val_devon, bool):
-            self._dev_on = val_devon
-
-        val_timeron = self.get_server_update_key_value(message, TIMERON_KEY)
-        if isinstance(val_timeron, int):
-            self._timer_on = val_timeron
-
-        val_cooldown = self.get_server_update_key_value(message, COOLDOWN_KEY)
-        if isinstance(val_cooldown, int):
-            self._cooldown = val_cooldown
-
-        val_ptc_on = self.get_server_update_key_value(message, PTCON_KEY)
-        if isinstance(val_ptc_on, bool):
-            self._ptc_on = val_ptc_on
-
-        val_lighton = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_lighton, bool):
-            self._display_auto_off = not val_lighton
-
-        val_ctlstatus = self.get_server_update_key_value(message, CTLSTATUS_KEY)
-        if isinstance(val_ctlstatus, str):
-            self._ctlstatus = val_ctlstatus
-
-        val_timer_off = self.get_server_update_key_value(message, TIMEROFF_KEY)
-        if isinstance(val_timer_off, int):
-            self._timer_off = val_timer_off
-
-        val_childlockon = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_childlockon, bool):
-            self._childlockon = val_childlockon
-
-        val_tempoffset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)
-        if isinstance(val_tempoffset, int):
-            self._tempoffset = val_tempoffset
-
-        val_fixed_conf = self.get_server_update_key_value(message, FIXEDCONF_KEY)
-        if isinstance(val_fixed_conf, str):
-            self._fixed_conf = val_fixed_conf
-
-        val_work_time = self.get_server_update_key_value(message, WORK_TIME)
-        if isinstance(val_work_time, int):
-            self.work_time = val_work_time
-
-        val_temp_target_reached = self.get_server_update_key_value(message, TEMP_TARGET_REACHED)
-        if isinstance(val_work_time, int):
-            self.temp_target_reached = "Yes" if val_temp_target_reached > 0 else "No"
 
     def set_ha_temperature_unit_is_celsius(self, is_celsius: bool) -> None:
         """Set whether Home Assistant uses Celsius (called by HA climate entity)"""
@@ -74,4 +74,4 @@ class PyDreoAirPurifier(PyDreoFanBase):
     def handle_server_update(self, message):
         """Process a websocket update"""
         _LOGGER.debug("PyDreoAirPurifier:handle_server_update")
-        super().handle_server_update(message)
+        return super().handle_server_update(message)
@@ -1,17 +1,122 @@
 """Base class for all Dreo devices."""
+import contextlib
 import threading
 import logging
-from typing import Dict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from types import MappingProxyType
+from typing import Any, Dict
 from typing import TYPE_CHECKING
 
-from .constant import LOGGER_NAME, REPORTED_KEY, POWERON_KEY, STATE_KEY, FAN_MODE_STRINGS
+from .constant import (
+    LOGGER_NAME, REPORTED_KEY, POWERON_KEY, STATE_KEY, TIMESTAMP_KEY, FAN_MODE_STRINGS, DreoDeviceSetting,
+    PLATFORM_LIGHT, PLATFORM_NUMBER, PLATFORM_SENSOR, PLATFORM_SWITCH
+)
 from .models import DreoDeviceDetails
+from .statefields import DreoField, compile_fields, compile_state_attributes
 
 if TYPE_CHECKING:
     from pydreo import PyDreo
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
+_MISSING = object()
+
+# Timestamps above this are in milliseconds (WebSocket reports) rather than seconds (REST state).
+_MILLISECOND_TIMESTAMP_THRESHOLD = 100_000_000_000
+
+
+def _report_time(timestamp) -> float | None:
+    """Return a REST or WebSocket timestamp in seconds, or None if there is none."""
+    if isinstance(timestamp, str):
+        try:
+            timestamp = float(timestamp)
+        except ValueError:
+            return None
+    if not isinstance(timestamp, (int, float)) or isinstance(timestamp, bool):
+        return None
+    if timestamp > _MILLISECOND_TIMESTAMP_THRESHOLD:
+        return timestamp / 1000
+    return float(timestamp)
+
+
+class _Subscription:
+    """A callback waiting for some attributes of a device to change."""
+
+    def __init__(self, attr_names: tuple[str, ...], cb: Callable[[], None], values: dict):
+        self.attr_names = attr_names
+        self.cb = cb
+        self.values = values
+
+class DeviceStateSnapshot:
+    """An immutable copy of a device's state attributes.
+
+    Values are keyed by the public name of the state attribute, as in the sets of changed
+    state passed to callbacks, e.g. snapshot["mode"] for _mode.  The version increases each time the device's state changes,
+    so a consumer that remembers the version it last saw can skip unchanged state."""
+
+    __slots__ = ("version", "values")
+
+    def __init__(self, version: int, values: dict):
+        self.version = version
+        self.values = MappingProxyType(values)
+
+    def __getitem__(self, name: str):
+        return self.values[name]
+
+    def get(self, name: str, default=None):
+        """Return the value of a state attribute, or default if the device has no such attribute."""
+        return self.values.get(name, default)
+
+    def changed_since(self, other: "DeviceStateSnapshot") -> set[str]:
+        """Return the names of the state attributes that differ from an earlier snapshot."""
+        if other is None:
+            return set(self.values)
+        if other.version == self.version:
+            return set()
+        return {name for name in self.values.keys() | other.values.keys()
+                if self.values.get(name, _MISSING) != other.values.get(name, _MISSING)}
+
+    def __repr__(self):
+        return f"<DeviceStateSnapshot:v{self.version}>"
+
+class DeviceCapabilities:
+    """What a device supports, worked out once after its state is loaded.
+
+    features holds the names of the device's feature properties (e.g. "oscillating")
+    that have a value, ranges the values of its range properties (e.g. "speed_range")
+    and platforms the kinds of entity the device has (e.g. "fan")."""
+
+    __slots__ = ("device_type", "features", "ranges", "platforms")
+
+    def __init__(self, device_type, features: Iterable[str], ranges: dict, platforms: Iterable[str]):
+        self.device_type = device_type
+        self.features = frozenset(features)
+        self.ranges = MappingProxyType(dict(ranges))
+        self.platforms = frozenset(platforms)
+
+    def as_dict(self) -> dict:
+        """Return the capabilities as plain values, for diagnostics."""
+        return {
+            "device_type": self.device_type,
+            "features": sorted(self.features),
+            "ranges": dict(self.ranges),
+            "platforms": sorted(self.platforms),
+        }
+
+    def __repr__(self):
+        return f"<DeviceCapabilities:{self.device_type}:{len(self.features)} features>"
+
+def _feature_properties(cls: type) -> frozenset[str]:
+    """Return the public properties a device class declares below PyDreoBaseDevice."""
+    names = set()
+    for klass in cls.__mro__:
+        if klass is PyDreoBaseDevice:
+            break
+        names.update(name for name, value in vars(klass).items()
+                     if isinstance(value, property) and not name.startswith("_"))
+    return frozenset(names)
+
 class UnknownProductError(Exception):
     """Exception thrown when we don't recognize a product of a device."""
 
@@ -22,8 +127,29 @@ class PyDreoBaseDevice(object):
     """Base class for all Dreo devices.
 
     Has code to handle providing common attributes and comment event handling.
+
+    The state keys a device reports are declared in STATE_FIELDS.  Subclasses add
+    their own fields, and replace inherited ones by declaring the same key.  Other
+    attributes that hold state are listed in STATE_ATTRIBUTES; only these and the
+    fields' attributes are part of state snapshots.
     """
 
+    STATE_FIELDS = (
+        DreoField(POWERON_KEY, "_is_on", bool),
+    )
+
+    # Subclasses replace the poweron field with handlers that set _is_on.
+    STATE_ATTRIBUTES = ("_is_on",)
+
+    # Platforms every device of the class has entities on.  Others follow from its features.
+    PLATFORMS = frozenset({PLATFORM_SENSOR, PLATFORM_SWITCH, PLATFORM_NUMBER})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_map = compile_fields(cls)
+        cls._state_attributes = compile_state_attributes(cls, cls._field_map)
+        cls._feature_properties = _feature_properties(cls)
+
     def __init__(
         self,
         device_definition: DreoDeviceDetails,
@@ -49,10 +175,26 @@ class PyDreoBaseDevice(object):
         self._is_on = False
 
         self._feature_key_names: Dict[str, str] = {}
+        # Settings (read with the setting API rather than reported as state) this device uses,
+        # and the value to use when a setting can't be read.  PyDreo loads them after the
+        # device is created, so constructors don't make API calls.
+        self._setting_defaults: Dict[DreoDeviceSetting, Any] = {}
 
         self.raw_state = None
         self._attr_cbs = []
+        self._subscriptions: list[_Subscription] = []
         self._lock = threading.Lock()
+        self._decode_lock = threading.Lock()
+        self._state_snapshot: DeviceStateSnapshot = None
+        # Computed after each state or settings load, or on first use if neither was loaded.
+        self._capabilities: DeviceCapabilities = None
+        # Time (in seconds) of the last applied value of each state key.
+        self._key_timestamps: Dict[str, float] = {}
+        # Last reported value of each state key, in the format of the REST state.
+        self._reported_state: Dict[str, dict] = {}
+        self.stale_values_dropped = 0
+        self.duplicate_values_dropped = 0
+        self._command_batch = threading.local()
 
     def __repr__(self):
         # Representation string of object.
@@ -70,7 +212,7 @@ class PyDreoBaseDevice(object):
 
             if (reported is not None) and (key in reported):
                 value = reported[key]
-                _LOGGER.info("%s reported: %s", key, value)
+                _LOGGER.debug("%s reported: %s", key, value)
                 return value
 
         return None
@@ -91,8 +233,30 @@ class PyDreoBaseDevice(object):
         _LOGGER.debug("PyDreoBaseDevice:Preference type %s not found", preference_type)
         return False
     
+    @property
+    def required_settings(self) -> Dict[DreoDeviceSetting, Any]:
+        """Return the settings this device uses, with the value to use if a setting can't be read."""
+        return dict(self._setting_defaults)
+
+    def apply_settings(self, values: Dict[DreoDeviceSetting, Any]) -> set[str]:
+        """Store setting values read by PyDreo.  None values are replaced by the setting's default.
+
+        Returns the names of the attributes that changed."""
+        with self.state_update():
+            before = self._state_values()
+            for setting, value in values.items():
+                if value is None:
+                    value = self._setting_defaults.get(setting)
+                self._apply_setting(setting, value)
+            # Settings add features (e.g. temperature_offset) to those of the loaded state.
+            self._capabilities = self._compute_capabilities()
+            return self._changed_attributes(before)
+
+    def _apply_setting(self, setting: DreoDeviceSetting, value: Any) -> None:
+        """Store the value of a setting.  Devices that use settings override this."""
+
     def get_setting(self, dreo : "PyDreo", setting_name: str, default_value : any) -> any:
-        """Get the value of a preference."""
+        """Get the value of a preference, from PyDreo's settings cache if it is fresh."""
         _LOGGER.debug("PyDreoBaseDevice:get_setting: %s", setting_name)
         setting_val = dreo.get_device_setting(self, setting_name)
         if setting_val is None:
@@ -116,21 +280,150 @@ class PyDreoBaseDevice(object):
         _LOGGER.debug("{%s}: got {%s} message **", self.name, message)
 
         # This method exists so that we can run the polymorphic function to process updates, and then
-        # run a _do_callbacks() command safely afterwards.
-        self.handle_server_update(message)
-        self._do_callbacks()
-
-    def handle_server_update(self, message: dict):
-        """Method to process WebSocket message"""
+        # run a _do_callbacks() command safely afterwards.  Reports that change nothing (e.g. periodic
+        # reports of unchanged values) do not run the callbacks.
+        with self.state_update():
+            message = self._drop_stale_values(message)
+            changed = self.handle_server_update(message) if message is not None else set()
+            self._record_reported_state(message)
+        if not changed:
+            _LOGGER.debug("%s: message changed no attributes", self)
+            return
+        self._do_callbacks(changed)
+
+    def _drop_stale_values(self, message: dict) -> dict | None:
+        """Remove reported values that are older than, or the same report as, the values
+        already applied for their keys.  Returns None if no values are left.
+
+        Reports are ordered by their timestamp; reports without one are applied as is.
+        This keeps a report that was delayed, or delivered again after a reconnect, from
+        overwriting newer state loaded from the REST API."""
+        reported = message.get(REPORTED_KEY) if isinstance(message, dict) else None
+        report_time = _report_time(message.get(TIMESTAMP_KEY)) if isinstance(reported, dict) else None
+        if report_time is None:
+            return message
+
+        fresh = {}
+        for key, value in reported.items():
+            last_time = self._key_timestamps.get(key)
+            if last_time is not None and report_time < last_time:
+                self.stale_values_dropped += 1
+            elif last_time is not None and report_time == last_time:
+                self.duplicate_values_dropped += 1
+            else:
+                self._key_timestamps[key] = report_time
+                fresh[key] = value
+
+        if len(fresh) < len(reported):
+            _LOGGER.debug("%s: dropped stale or duplicate values %s",
+                          self, sorted(reported.keys() - fresh.keys()))
+        if not fresh:
+            return None
+        return {**message, REPORTED_KEY: fresh}
+
+    def _record_reported_state(self, message: dict) -> None:
+        reported = message.get(REPORTED_KEY) if isinstance(message, dict) else None
+        if not isinstance(reported, dict):
+            return
+        for key, value in reported.items():
+            self._reported_state[key] = {STATE_KEY: value, TIMESTAMP_KEY: self._key_timestamps.get(key)}
 
-    def _send_command(self, command_key: str, value):
+    @property
+    def last_known_state(self) -> dict:
+        """Return the last reported value of each state key, in the format update_state() takes.
+
+        Used to cache the device state, e.g. to start up without loading it from the cloud."""
+        with self._decode_lock:
+            return {key: dict(value) for key, value in self._reported_state.items()}
+
+    def handle_server_update(self, message: dict) -> set[str]:
+        """Method to process WebSocket message.  Returns the names of the attributes that changed."""
+        reported = message.get(REPORTED_KEY) if isinstance(message, dict) else None
+        if isinstance(reported, dict):
+            return self._decode_state(reported, complete=False)
+        return set()
+
+    def _decode_state(self, values: dict, complete: bool) -> set[str]:
+        """Store reported values in the attributes declared by STATE_FIELDS.
+
+        A complete state (from the REST API) decodes every field and clears the
+        attributes of missing keys.  A partial state (a WebSocket report) decodes only
+        the keys it contains and skips values that are None or of the wrong type.
+        Returns the names of the attributes whose value changed."""
+        changed: set[str] = set()
+        field_map = self._field_map
+        if complete:
+            for key, field in field_map.items():
+                self._decode_field(field, values.get(key), field.rest_transform, changed)
+            return changed
+
+        for key, value in values.items():
+            field = field_map.get(key)
+            if field is None or value is None:
+                continue
+            if field.types is not None and not isinstance(value, field.types):
+                _LOGGER.debug("%s: ignoring %s=%r, expected %s", self, key, value, field.types)
+                continue
+            self._decode_field(field, value, field.transform, changed)
+        return changed
+
+    def _decode_field(self, field: DreoField, value, transform, changed: set[str]) -> None:
+        if value is not None and transform is not None:
+            value = transform(value)
+        if field.handler is not None:
+            # Handlers may set several attributes, so compare them all.
+            before = self._state_values()
+            getattr(self, field.handler)(value)
+            changed.update(self._changed_attributes(before))
+        elif getattr(self, field.attr, _MISSING) != value:
+            setattr(self, field.attr, value)
+            changed.add(field.name)
+
+    def _send_command(self, command_key: str, value) -> Future:
         """Send a command to the Dreo servers via WebSocket."""
         _LOGGER.debug(
             "pyDreoBaseDevice(%s):send_command: %s-> %s", self, command_key, value
         )
 
         params: dict = {command_key: value}
-        self._dreo.send_command(self, params)
+        return self.send_commands(params)
+
+    def send_commands(self, params: dict) -> Future:
+        """Send several commands to the device in a single WebSocket message.
+
+        Inside a command_batch() block the params are added to the batch instead
+        and None is returned."""
+        batch: dict = getattr(self._command_batch, "params", None)
+        if batch is not None:
+            _LOGGER.debug("pyDreoBaseDevice(%s):send_commands: batching %s", self, params)
+            batch.update(params)
+            return None
+
+        return self._dreo.send_command(self, params)
+
+    @contextlib.contextmanager
+    def command_batch(self):
+        """Collect the commands sent by setters inside the block and send them as
+        one message when the block exits.  Nothing is sent if the block raises.
+
+            with device.command_batch():
+                device.poweron = True
+                device.mode = "hotair"
+        """
+        if getattr(self._command_batch, "params", None) is not None:
+            # Nested batch; the outermost block sends.
+            yield
+            return
+
+        self._command_batch.params = {}
+        try:
+            yield
+            params = self._command_batch.params
+        finally:
+            self._command_batch.params = None
+
+        if params:
+            self._dreo.send_command(self, params)
 
     def _set_setting(self, setting_key: str, value):
         """Set a setting on the device."""
@@ -158,22 +451,122 @@ class PyDreoBaseDevice(object):
     def update_state(self, state: dict):
         """Process the state dictionary from the REST API."""
         _LOGGER.debug("pyDreoBaseDevice:update_state: %s", state)
+        values = {key: value.get(STATE_KEY)
+                  for key, value in state.items()
+                  if isinstance(value, dict)}
+        for key, value in state.items():
+            if not isinstance(value, dict):
+                continue
+            key_time = _report_time(value.get(TIMESTAMP_KEY))
+            if key_time is not None:
+                self._key_timestamps[key] = max(key_time, self._key_timestamps.get(key, key_time))
+            self._reported_state[key] = {STATE_KEY: value.get(STATE_KEY), TIMESTAMP_KEY: value.get(TIMESTAMP_KEY)}
+        self._decode_state(values, complete=True)
+        self._capabilities = None
+
+    def load_state(self, state: dict) -> None:
+        """Apply a full state from the REST API or the cache and work out the device's capabilities."""
+        with self.state_update():
+            self.update_state(state)
+            self._capabilities = self._compute_capabilities()
+
+    @contextlib.contextmanager
+    def state_update(self):
+        """Decode state inside this block, then publish a new state snapshot if it changed.
+
+        Blocks on different threads (WebSocket reports, REST state loads) are run one
+        at a time, so a snapshot never mixes two updates."""
+        with self._decode_lock:
+            try:
+                yield
+            finally:
+                self._publish_state_snapshot()
+
+    def _publish_state_snapshot(self) -> DeviceStateSnapshot:
+        """Replace the state snapshot if the state attributes changed.  Call with _decode_lock held."""
+        values = self._state_values()
+        snapshot = self._state_snapshot
+        if snapshot is None or snapshot.values != values:
+            # Assigning the attribute is atomic, so readers see either the old or the new snapshot.
+            snapshot = self._state_snapshot = DeviceStateSnapshot(
+                snapshot.version + 1 if snapshot is not None else 1, values)
+        return snapshot
+
+    @property
+    def state_snapshot(self) -> DeviceStateSnapshot:
+        """Return a consistent, immutable view of the device state as of the last completed update."""
+        snapshot = self._state_snapshot
+        if snapshot is None:
+            with self._decode_lock:
+                snapshot = self._publish_state_snapshot()
+        return snapshot
+
+    @property
+    def state_version(self) -> int:
+        """Return the version of the current state snapshot."""
+        return self.state_snapshot.version
+
+    def _state_values(self) -> dict:
+        """Return a copy of the attributes that hold device state, keyed by public name."""
+        values = vars(self)
+        return {name: values[attr] for attr, name in self._state_attributes.items() if attr in values}
+
+    def _changed_attributes(self, before: dict) -> set[str]:
+        """Return the public names of the state attributes that differ from a _state_values() copy."""
+        after = self._state_values()
+        return {key for key in before.keys() | after.keys()
+                if before.get(key, _MISSING) != after.get(key, _MISSING)}
+
+    def add_attr_callback(self, cb, with_changes: bool = False) -> Callable[[], None]:
+        """Add a callback to be called by _do_callbacks.  Returns a function that removes it.
+
+        If with_changes is True, the callback is passed the public names of the state
+        attributes that changed (e.g. "fan_speed"), or None if that is not known."""
+        entry = (cb, with_changes)
+        with self._lock:
+            self._attr_cbs.append(entry)
 
-        # TODO: Inconsistent placement of POWERON between BaseDevice and Fan for State/WebSocket
-        self._is_on = self.get_state_update_value(state, POWERON_KEY)
+        def remove() -> None:
+            with self._lock:
+                if entry in self._attr_cbs:
+                    self._attr_cbs.remove(entry)
 
-    def add_attr_callback(self, cb):
-        """Add a callback to be called by _do_callbacks."""
-        self._attr_cbs.append(cb)
+        return remove
 
-    def _do_callbacks(self):
+    def subscribe(self, attr_names: Iterable[str], cb: Callable[[], None]) -> Callable[[], None]:
+        """Call cb when the value of any of the named attributes (properties) changes.
+
+        Returns a function that cancels the subscription."""
+        attr_names = tuple(attr_names)
+        subscription = _Subscription(attr_names, cb, self._read_attributes(attr_names))
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+    def _read_attributes(self, attr_names: tuple[str, ...]) -> dict:
+        return {name: getattr(self, name, None) for name in attr_names}
+
+    def _do_callbacks(self, changed: set[str] = None):
         """Run all registered callback"""
-        cbs = []
         with self._lock:
-            for cb in self._attr_cbs:
-                cbs.append(cb)
-        for cb in cbs:
-            cb()
+            cbs = list(self._attr_cbs)
+            subscriptions = list(self._subscriptions)
+        for cb, with_changes in cbs:
+            if with_changes:
+                cb(changed)
+            else:
+                cb()
+        for subscription in subscriptions:
+            values = self._read_attributes(subscription.attr_names)
+            if values != subscription.values:
+                subscription.values = values
+                subscription.cb()
 
     @property
     def device_definition(self) -> DreoDeviceDetails:
@@ -245,16 +638,41 @@ class PyDreoBaseDevice(object):
         """Returns the color of the device. Maybe use for an image at some point"""
         return self._color
 
+    @property
+    def capabilities(self) -> DeviceCapabilities:
+        """Return the features, ranges and platforms of the device as of its last state load."""
+        capabilities = self._capabilities
+        if capabilities is None:
+            capabilities = self._capabilities = self._compute_capabilities()
+        return capabilities
+
+    def _compute_capabilities(self) -> DeviceCapabilities:
+        values = {}
+        for name in self._feature_properties:
+            try:
+                value = getattr(self, name)
+            except Exception: # pylint: disable=broad-except
+                _LOGGER.debug("%s: feature %s is not available", self, name, exc_info=True)
+                continue
+            if value is not None:
+                values[name] = value
+        _LOGGER.debug("%s supports features %s", self, sorted(values))
+        platforms = set(self.PLATFORMS)
+        if "light_on" in values:
+            platforms.add(PLATFORM_LIGHT)
+        return DeviceCapabilities(self.type,
+                                  values,
+                                  {name: value for name, value in values.items() if name.endswith("_range")},
+                                  platforms)
+
     def is_feature_supported(self, feature: str) -> bool:
         """Does this device support a given feature"""
-        _LOGGER.debug("Checking if %s supports feature %s", self, feature)
-        property_name = feature
-        if hasattr(self, property_name):
-            val = getattr(self, property_name)
-            if val is not None:
-                _LOGGER.debug(
-                    "%s found attribute for %s --> %s", self, property_name, val
-                )
-                return True
+        if feature in self._feature_properties:
+            return feature in self.capabilities.features
+        return getattr(self, feature, None) is not None
 
-        return False
+
+PyDreoBaseDevice._field_map = compile_fields(PyDreoBaseDevice)  # pylint: disable=protected-access
+PyDreoBaseDevice._state_attributes = compile_state_attributes(  # pylint: disable=protected-access
+    PyDreoBaseDevice, PyDreoBaseDevice._field_map)  # pylint: disable=protected-access
+PyDreoBaseDevice._feature_properties = frozenset()  # pylint: disable=protected-access
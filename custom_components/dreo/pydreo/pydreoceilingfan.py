@@ -7,14 +7,13 @@ from .constant import (
     LOGGER_NAME,
     FANON_KEY,
     LIGHTON_KEY,
-    WINDLEVEL_KEY,
     SPEED_RANGE,
     BRIGHTNESS_KEY,
-    COLORTEMP_KEY,
-    POWERON_KEY
+    COLORTEMP_KEY
 )
 
 from .pydreofanbase import PyDreoFanBase
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
@@ -26,6 +25,12 @@ if TYPE_CHECKING:
 class PyDreoCeilingFan(PyDreoFanBase):
     """Base class for Dreo Fan API Calls."""
 
+    STATE_FIELDS = (
+        DreoField(LIGHTON_KEY, "_light_on", bool),
+        DreoField(BRIGHTNESS_KEY, "_brightness", int),
+        DreoField(COLORTEMP_KEY, "_color_temp", int),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -131,47 +136,14 @@ class PyDreoCeilingFan(PyDreoFanBase):
         _LOGGER.debug("PyDreoFan:update_state")
         super().update_state(state)
 
-        self._fan_speed = self.get_state_update_value(state, WINDLEVEL_KEY)
-        if self._fan_speed is None:
-            _LOGGER.error("Unable to get fan speed from state. Check debug logs for more information.")
-
+        # Ceiling fans report the fan motor in fanon; poweron covers the fan and the light.
         self._is_on = self.get_state_update_value(state, FANON_KEY)
-        self._light_on = self.get_state_update_value(state, LIGHTON_KEY)
-        self._brightness = self.get_state_update_value(state, BRIGHTNESS_KEY)
-        self._color_temp = self.get_state_update_value(state, COLORTEMP_KEY)
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoCeilingFan:handle_server_update")
-        super().handle_server_update(message)
-
-        val_power_on = self.get_server_update_key_value(message, FANON_KEY)
-        if isinstance(val_power_on, bool):
-            self._is_on = val_power_on
-
-        val_light_on = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light_on, bool):
-            self._light_on = val_light_on        
-
-        val_brightness = self.get_server_update_key_value(message, BRIGHTNESS_KEY)
-        if isinstance(val_brightness, int):
-            self._brightness = val_brightness   
-
-        val_color_temp = self.get_server_update_key_value(message, COLORTEMP_KEY)
-        if isinstance(val_color_temp, int):
-            self._color_temp = val_color_temp    
-
-    def _handle_power_state_update(self, message):
-        """Override power state handling for ceiling fans"""
-        # Handle poweron: False = turn off entire device (both fan and light)
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if val_poweron is False:
+
+    def _decode_poweron(self, value: bool) -> None:
+        if value is False:
             self._is_on = False
             self._light_on = False
             _LOGGER.debug("PyDreoCeilingFan: Device powered off - fan and light off")
-            
-        # Handle fanon: True/False = specific fan motor control
-        val_fan_on = self.get_server_update_key_value(message, FANON_KEY)
-        if isinstance(val_fan_on, bool):
-            self._is_on = val_fan_on
-            _LOGGER.debug("PyDreoCeilingFan: Fan state updated from fanon: %s", val_fan_on)
+
+    def _decode_fanon(self, value: bool) -> None:
+        self._is_on = value
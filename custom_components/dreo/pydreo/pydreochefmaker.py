@@ -6,6 +6,7 @@ from .constant import (
     LOGGER_NAME,
     POWERON_KEY,
 )
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 from .pydreobasedevice import PyDreoBaseDevice
@@ -26,6 +27,15 @@ _LOGGER = logging.getLogger(LOGGER_NAME)
 class PyDreoChefMaker(PyDreoBaseDevice):
     """Representation of a Dreo ChefMaker device."""
 
+    STATE_FIELDS = (
+        DreoField(POWERON_KEY, types=bool, handler="_decode_poweron"),
+        DreoField(LIGHT_KEY, "_ledpotkepton", int),
+        DreoField(MODE_KEY, "mode", str),
+    )
+
+    # The mode field sets _mode through the mode property, as does _decode_poweron.
+    STATE_ATTRIBUTES = ("_mode",)
+
     def __init__(
         self,
         device_definition: DreoDeviceDetails,
@@ -81,47 +91,12 @@ class PyDreoChefMaker(PyDreoBaseDevice):
 
     def update_state(self, state: dict) -> None:
         """Process the state dictionary from the REST API."""
-        super().update_state(state)  # handles _is_on
-
-        _LOGGER.debug("PyDreoChefMaker(%s):update_state: %s", self, state)
-
-        self._is_on = self.get_state_update_value(state, POWERON_KEY)
-        self.set_mode_from_is_on()
-        self._ledpotkepton = self.get_state_update_value(state, LIGHT_KEY)
-
-        if self.is_on:
-            self.mode = self.get_state_update_value(state, MODE_KEY)
+        super().update_state(state)
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug(
-            "PyDreoChefMaker:handle_server_update(%s): %s", self.name, message
-        )
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            _LOGGER.debug(
-                "PyDreoChefMaker:handle_server_update - poweron: %s --> %s",
-                self._is_on,
-                val_poweron,
-            )
-            self._is_on = val_poweron  # Ensure poweron state is updated
+        # The REST API keeps reporting the last mode while the device is off.
+        if not self.is_on:
             self.set_mode_from_is_on()
 
-        val_ledpotkepton = self.get_server_update_key_value(message, LIGHT_KEY)
-        if isinstance(val_ledpotkepton, int):
-            _LOGGER.debug(
-                "PyDreoChefMaker:handle_server_update - ledpotkepton: %s --> %s",
-                self._ledpotkepton,
-                val_ledpotkepton,
-            )
-            self._ledpotkepton = val_ledpotkepton
-
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, str):
-            _LOGGER.debug(
-                "PyDreoChefMaker:handle_server_update - mode: %s --> %s",
-                self.mode,
-                val_mode,
-            )
-            self.mode = val_mode
+    def _decode_poweron(self, value: bool) -> None:
+        self._is_on = value
+        self.set_mode_from_is_on()
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Dict
 
 from .constant import (
     LOGGER_NAME,
+    PLATFORM_HUMIDIFIER,
+    PLATFORM_FAN,
     MODE_KEY,
     MUTEON_KEY,
     POWERON_KEY,
@@ -17,6 +19,7 @@ from .constant import (
 )
 
 from .pydreobasedevice import PyDreoBaseDevice
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
@@ -31,6 +34,20 @@ AUTOON_KEY = "autoon"
 class PyDreoDehumidifier(PyDreoBaseDevice):
     """Base class for Dreo Dehumidifiers"""
 
+    PLATFORMS = PyDreoBaseDevice.PLATFORMS | {PLATFORM_HUMIDIFIER, PLATFORM_FAN}
+
+    STATE_FIELDS = (
+        DreoField(MODE_KEY, "_mode", int),
+        DreoField(MUTEON_KEY, "_mute_on", bool),
+        DreoField(HUMIDITY_KEY, "_humidity", int),
+        DreoField(RHAUTOLEVEL_KEY, "_target_humidity", int),
+        DreoField(WINDLEVEL_KEY, "_wind_level", int),
+        DreoField(CHILDLOCKON_KEY, "_child_lock_on", bool),
+        DreoField(LIGHTON_KEY, "_light_on", bool),
+        DreoField(AUTOON_KEY, "_auto_on", bool),
+        DreoField(TEMPERATURE_KEY, "_temperature", (int, float)),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize dehumidifier devices."""
         super().__init__(device_definition, details, dreo)
@@ -219,63 +236,3 @@ class PyDreoDehumidifier(PyDreoBaseDevice):
             self._send_command(MODE_KEY, mode_value)
         else:
             raise ValueError(f"Operating mode {value} is not in the acceptable list: {self.modes}")
-
-    def update_state(self, state: dict):
-        """Process the state dictionary from the REST API."""
-        super().update_state(state)
-
-        _LOGGER.debug("PyDreoDehumidifier(%s):update_state: %s", self.name, state)
-        self._mode = self.get_state_update_value(state, MODE_KEY)
-        self._mute_on = self.get_state_update_value(state, MUTEON_KEY)
-        self._humidity = self.get_state_update_value(state, HUMIDITY_KEY)
-        self._target_humidity = self.get_state_update_value(state, RHAUTOLEVEL_KEY)
-        self._wind_level = self.get_state_update_value(state, WINDLEVEL_KEY)
-        self._child_lock_on = self.get_state_update_value(state, CHILDLOCKON_KEY)
-        self._light_on = self.get_state_update_value(state, LIGHTON_KEY)
-        self._auto_on = self.get_state_update_value(state, AUTOON_KEY)
-        self._temperature = self.get_state_update_value(state, TEMPERATURE_KEY)
-        
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoDehumidifier:handle_server_update(%s): %s", self.name, message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron
-            _LOGGER.debug("PyDreoDehumidifier:handle_server_update - poweron is %s", self._is_on)
-
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, int):
-            self._mode = val_mode
-
-        val_humidity = self.get_server_update_key_value(message, HUMIDITY_KEY)
-        if isinstance(val_humidity, int):
-            self._humidity = val_humidity
-
-        val_target_humidity = self.get_server_update_key_value(message, RHAUTOLEVEL_KEY)
-        if isinstance(val_target_humidity, int):
-            self._target_humidity = val_target_humidity
-
-        val_wind_level = self.get_server_update_key_value(message, WINDLEVEL_KEY)
-        if isinstance(val_wind_level, int):
-            self._wind_level = val_wind_level
-
-        val_mute = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_mute, bool):
-            self._mute_on = val_mute
-
-        val_light = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light, bool):
-            self._light_on = val_light
-
-        val_child_lock = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_child_lock, bool):
-            self._child_lock_on = val_child_lock
-
-        val_auto = self.get_server_update_key_value(message, AUTOON_KEY)
-        if isinstance(val_auto, bool):
-            self._auto_on = val_auto
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, (int, float)):
-            self._temperature = val_temperature
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import logging
 from typing import TYPE_CHECKING, Dict
-from custom_components.dreo.pydreo.pydreofanbase import PyDreoFanBase
+from .pydreofanbase import PyDreoFanBase
 
 from .constant import (
     CHILDLOCKON_KEY,
@@ -10,8 +10,12 @@ from .constant import (
     HUMIDITY_KEY,
     LOGGER_NAME,
     TEMPOFFSET_KEY,
+    WATER_LEVEL_STATUS_KEY,
+    WATER_LEVEL_OK,
+    WATER_LEVEL_EMPTY,
 )
 
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
@@ -21,11 +25,6 @@ HUMIDIFY_MODE_KEY = "rhmode"
 HUMIDIFY_SUSPEND_KEY = "rhsuspend"
 HUMIDITY_TARGET_KEY = "rhtarget"
 WORKTIME_KEY = "worktime"
-WATER_LEVEL_STATUS_KEY = "wrong"
-
-# Status for water level indicator
-WATER_LEVEL_OK = "Ok"
-WATER_LEVEL_EMPTY = "Empty"
 
 # States (enabled, disabled) for humidifier
 HUMIDIFY_MODE_MAP = {
@@ -61,6 +60,14 @@ WINDMODE_MAP = {
     4: "Natural"
 }
 
+
+def _rest_wind_mode(index: int):
+    """The REST API reports the wind mode as an index into WINDMODES."""
+    if 0 <= index < len(WINDMODES):
+        return WINDMODE_MAP[WINDMODES[index]]
+    return None
+
+
 if TYPE_CHECKING:
     from pydreo import PyDreo
 
@@ -68,6 +75,20 @@ if TYPE_CHECKING:
 class PyDreoEvaporativeCooler(PyDreoFanBase):
     """Base class for Dreo evaporative cooler API Calls."""
 
+    STATE_FIELDS = (
+        DreoField(TEMPOFFSET_KEY, "_temperature_offset", int),
+        DreoField(HUMIDITY_KEY, "_humidity", int),
+        DreoField(HUMIDITY_TARGET_KEY, "_target_humidity", int),
+        DreoField(HUMIDIFY_MODE_KEY, "_humidify", int, transform=HUMIDIFY_MODE_MAP.get),
+        DreoField(HORIZONTAL_OSCILLATION_KEY, "_oscillating", bool),
+        DreoField(CHILDLOCKON_KEY, "_childlockon", bool),
+        DreoField(WIND_MODE_KEY, "_wind_mode", int,
+                  transform=WINDMODE_MAP.get,
+                  rest_transform=_rest_wind_mode),
+        DreoField(WORKTIME_KEY, "_work_time", int),
+        DreoField(WATER_LEVEL_STATUS_KEY, "_water_level", int, transform=WATER_LEVEL_STATUS_MAP.get),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize evaporative cooler devices."""
         super().__init__(device_definition, details, dreo)
@@ -180,63 +201,3 @@ class PyDreoEvaporativeCooler(PyDreoFanBase):
     def water_level(self) -> int:
        """Return the water level status"""
        return self._water_level
-   
-    def update_state(self, state: dict):
-        """Process the state dictionary from the REST API"""
-        _LOGGER.debug("PyDreoEvaporativeCooler:update_state")
-        super().update_state(state)
-        
-        self._temperature_offset = self.get_state_update_value(state, TEMPOFFSET_KEY)
-        self._humidity = self.get_state_update_value(state, HUMIDITY_KEY)
-        self._target_humidity = self.get_state_update_value(state, HUMIDITY_TARGET_KEY)
-        self._humidify = HUMIDIFY_MODE_MAP[self.get_state_update_value(state, HUMIDIFY_MODE_KEY)]
-        self._oscillating = self.get_state_update_value(state, HORIZONTAL_OSCILLATION_KEY)
-        self._childlockon = self.get_state_update_value(state, CHILDLOCKON_KEY)
-        self._wind_mode = WINDMODE_MAP[WINDMODES[self.get_state_update_value(state, WIND_MODE_KEY)]]
-        self._work_time = self.get_state_update_value(state, WORKTIME_KEY)
-        self._water_level = WATER_LEVEL_STATUS_MAP[self.get_state_update_value(state, WATER_LEVEL_STATUS_KEY)]
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoEvaporativeCooler:handle_server_update")
-        super().handle_server_update(message)
-        
-        val_temperature_offset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)
-        if isinstance(val_temperature_offset, int):
-            self._temperature_offset = val_temperature_offset
-
-        val_oscon = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_KEY)
-        if isinstance(val_oscon, bool):
-            self._oscillating = val_oscon
-
-        val_humidity = self.get_server_update_key_value(message, HUMIDITY_KEY)
-        if isinstance(val_humidity, int):
-            self._humidity = val_humidity
-
-        val_humidify = self.get_server_update_key_value(message, HUMIDIFY_MODE_KEY)
-        if isinstance(val_humidify, int):
-            val_humidify = HUMIDIFY_MODE_MAP[val_humidify]
-            self._humidify =  val_humidify
-
-        val_target_humidity = self.get_server_update_key_value(message, HUMIDITY_TARGET_KEY)
-        if isinstance(val_target_humidity, int):
-            self._target_humidity = val_target_humidity
-
-        val_childlockon = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if (isinstance(val_childlockon, bool)):
-            self._childlockon = val_childlockon
-
-        val_wind_mode = self.get_server_update_key_value(message, WIND_MODE_KEY)
-        if isinstance(val_wind_mode, int):
-            val_wind_mode = WINDMODE_MAP[val_wind_mode]
-            self._wind_mode = val_wind_mode
-            
-        val_work_time = self.get_server_update_key_value(message, WORKTIME_KEY)
-        if isinstance(val_work_time, int):
-            self._work_time = val_work_time
-            
-        val_water_level = self.get_server_update_key_value(message, WATER_LEVEL_STATUS_KEY)
-        if isinstance(val_water_level, int):
-            val_water_level = WATER_LEVEL_STATUS_MAP[val_water_level]
-            self._water_level = val_water_level
-
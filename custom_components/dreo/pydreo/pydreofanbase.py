@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Dict
 
 from .constant import (
     LOGGER_NAME,
+    PLATFORM_FAN,
     POWERON_KEY,
     FANON_KEY,
     WINDLEVEL_KEY,
@@ -22,6 +23,7 @@ from .constant import (
 )
  
 from .pydreobasedevice import PyDreoBaseDevice
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 from .helpers import Helpers
 
@@ -34,6 +36,25 @@ if TYPE_CHECKING:
 class PyDreoFanBase(PyDreoBaseDevice):
     """Base class for Dreo Fan API Calls."""
 
+    PLATFORMS = PyDreoBaseDevice.PLATFORMS | {PLATFORM_FAN}
+
+    STATE_FIELDS = (
+        DreoField(POWERON_KEY, types=bool, handler="_decode_poweron"),
+        DreoField(FANON_KEY, types=bool, handler="_decode_fanon"),
+        DreoField(WINDLEVEL_KEY, "_fan_speed", int),
+        DreoField(TEMPERATURE_KEY, "_temperature", int),
+        DreoField(LEDALWAYSON_KEY, "_led_always_on", bool),
+        DreoField(VOICEON_KEY, "_voice_on", bool),
+        DreoField(WINDTYPE_KEY, "_wind_type", int),
+        DreoField(WIND_MODE_KEY, "_wind_mode", int),
+        DreoField(LIGHTSENSORON_KEY, "_light_sensor_on", bool),
+        DreoField(MUTEON_KEY, "_mute_on", bool),
+        DreoField(PM25_KEY, "_pm25", int),
+    )
+
+    # Set from the temperature calibration setting.
+    STATE_ATTRIBUTES = ("_temperature_offset",)
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -49,10 +70,11 @@ class PyDreoFanBase(PyDreoBaseDevice):
         if (self._preset_modes is None):
             self._preset_modes = self.parse_preset_modes(details)
 
-        # Check to see if temperature calibration is supported.
+        # Check to see if temperature calibration is supported.  The offset is a setting,
+        # which PyDreo loads after the device is created.
         self._temperature_offset = None
         if self.is_preference_supported(PREFERENCE_TYPE_TEMPERATURE_CALIBRATION, details):
-            self._temperature_offset = int(self.get_setting(dreo, DreoDeviceSetting.FAN_TEMP_OFFSET, 0))
+            self._setting_defaults[DreoDeviceSetting.FAN_TEMP_OFFSET] = 0
 
         self._is_on = False
         self._power_on_key = None
@@ -205,6 +227,10 @@ class PyDreoFanBase(PyDreoBaseDevice):
 
         return TemperatureUnit.CELSIUS
 
+    def _apply_setting(self, setting: DreoDeviceSetting, value) -> None:
+        if setting == DreoDeviceSetting.FAN_TEMP_OFFSET:
+            self._temperature_offset = int(value)
+
     @property
     def temperature_offset(self) -> bool:
         """Get the temperature calibration value"""
@@ -312,6 +338,8 @@ class PyDreoFanBase(PyDreoBaseDevice):
         _LOGGER.debug("PyDreoFanBase:update_state")
         super().update_state(state)
 
+        # Fans report power as either poweron or fanon.  Remember which one so that
+        # WebSocket updates of the other key are ignored.
         power_on = self.get_state_update_value(state, POWERON_KEY)
         if power_on is not None:
             self._is_on = power_on
@@ -325,72 +353,14 @@ class PyDreoFanBase(PyDreoBaseDevice):
             else:
                 _LOGGER.error("Unable to get power on state from state. Check debug logs for more information.")
                 self._power_on_key = None
-                
-        self._fan_speed = self.get_state_update_value(state, WINDLEVEL_KEY)
+
         if self._fan_speed is None:
             _LOGGER.error("Unable to get fan speed from state. Check debug logs for more information.")
 
-        self._temperature = self.get_state_update_value(state, TEMPERATURE_KEY)
-        self._led_always_on = self.get_state_update_value(state, LEDALWAYSON_KEY)
-        self._voice_on = self.get_state_update_value(state, VOICEON_KEY)
-        self._wind_type = self.get_state_update_value(state, WINDTYPE_KEY)
-        self._wind_mode = self.get_state_update_value(state, WIND_MODE_KEY)
-        self._light_sensor_on = self.get_state_update_value(state, LIGHTSENSORON_KEY)
-        self._mute_on = self.get_state_update_value(state, MUTEON_KEY)
-        self._pm25 = self.get_state_update_value(state, PM25_KEY)
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoFanBase:handle_server_update")
-        super().handle_server_update(message)
-        
-        # Handle power state
-        self._handle_power_state_update(message)
-        
-        # Handle common fan properties
-        self._handle_fan_properties_update(message)
-
-    def _handle_power_state_update(self, message):
-        """Handle power state updates"""
-        val_poweron = self.get_server_update_key_value(message, self._power_on_key)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron
-            _LOGGER.debug("PyDreoFanBase:_handle_power_state_update - %s is %s", self._power_on_key, self._is_on)
-
-    def _handle_fan_properties_update(self, message):
-        """Handle common fan properties"""
-        val_wind_level = self.get_server_update_key_value(message, WINDLEVEL_KEY)
-        if isinstance(val_wind_level, int):
-            self._fan_speed = val_wind_level
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, int):
-            self._temperature = val_temperature
-
-        val_display_always_on = self.get_server_update_key_value(message, LEDALWAYSON_KEY)
-        if isinstance(val_display_always_on, bool):
-            self._led_always_on = val_display_always_on
-
-        val_panel_sound = self.get_server_update_key_value(message, VOICEON_KEY)
-        if isinstance(val_panel_sound, bool):
-            self._voice_on = val_panel_sound
-
-        val_wind_mode = self.get_server_update_key_value(message, WIND_MODE_KEY)
-        if isinstance(val_wind_mode, int):
-            self._wind_mode = val_wind_mode
-
-        val_wind_type = self.get_server_update_key_value(message, WINDTYPE_KEY)
-        if isinstance(val_wind_type, int):
-            self._wind_type = val_wind_type
-
-        val_light_sensor = self.get_server_update_key_value(message, LIGHTSENSORON_KEY)
-        if isinstance(val_light_sensor, bool):
-            self._light_sensor_on = val_light_sensor
-
-        val_mute = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_mute, bool):
-            self._mute_on = val_mute
-
-        val_pm25 = self.get_server_update_key_value(message, PM25_KEY)
-        if isinstance(val_pm25, int):
-            self._pm25 = val_pm25
\ No newline at end of file
+    def _decode_poweron(self, value: bool) -> None:
+        if self._power_on_key == POWERON_KEY:
+            self._is_on = value
+
+    def _decode_fanon(self, value: bool) -> None:
+        if self._power_on_key == FANON_KEY:
+            self._is_on = value
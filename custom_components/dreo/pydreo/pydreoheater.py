@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Dict
 
 from .constant import (
     LOGGER_NAME,
+    PLATFORM_CLIMATE,
     HTALEVEL_KEY,
     TEMPERATURE_KEY,
     MODE_KEY,
@@ -36,6 +37,7 @@ from .constant import (
 )
 
 from .pydreobasedevice import PyDreoBaseDevice
+from .statefields import DreoField, duration
 from .models import DreoDeviceDetails, HEAT_RANGE, ECOLEVEL_RANGE
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
@@ -46,6 +48,31 @@ if TYPE_CHECKING:
 class PyDreoHeater(PyDreoBaseDevice):
     """Base class for Dreo heater API Calls."""
 
+    PLATFORMS = PyDreoBaseDevice.PLATFORMS | {PLATFORM_CLIMATE}
+
+    STATE_FIELDS = (
+        DreoField(POWERON_KEY, types=bool, handler="_decode_poweron"),
+        DreoField(HTALEVEL_KEY, "_htalevel", int),
+        DreoField(TEMPERATURE_KEY, "_temperature", int),
+        # Reported mode can be an empty string if the heater is off. Deal with that by
+        # explicitly setting that to off.
+        DreoField(MODE_KEY, "_mode", str, transform=lambda mode: mode if mode in HEATER_MODES else HEATER_MODE_OFF),
+        DreoField(OSCON_KEY, "_oscon", bool),
+        DreoField(OSCANGLE_KEY, "_oscangle", int),
+        DreoField(MUTEON_KEY, "_mute_on", bool),
+        DreoField(DEVON_KEY, "_dev_on", bool),
+        DreoField(TIMERON_KEY, "_timer_on", (int, dict), transform=duration),
+        DreoField(COOLDOWN_KEY, "_cooldown", int),
+        DreoField(PTCON_KEY, "_ptc_on", bool),
+        DreoField(LIGHTON_KEY, "_light_on", bool),
+        DreoField(CTLSTATUS_KEY, "_ctlstatus", str),
+        DreoField(TIMEROFF_KEY, "_timer_off", (int, dict), transform=duration),
+        DreoField(ECOLEVEL_KEY, "_ecolevel", int),
+        DreoField(CHILDLOCKON_KEY, "_childlockon", bool),
+        DreoField(TEMPOFFSET_KEY, "_tempoffset", int),
+        DreoField(FIXEDCONF_KEY, "_fixed_conf", str),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize heater devices."""
         super().__init__(device_definition, details, dreo)
@@ -69,8 +96,6 @@ class PyDreoHeater(PyDreoBaseDevice):
         self._tempoffset = None
         self._fixed_conf = None
 
-        self._timeron = None
-
     @property
     def poweron(self):
         """Returns `True` if the device is on, `False` otherwise."""
@@ -121,8 +146,9 @@ class PyDreoHeater(PyDreoBaseDevice):
                             htalevel,
                             self._device_definition.device_ranges[HEAT_RANGE])
             return
-        self.mode = HEATER_MODE_HOTAIR
-        self._send_command(HTALEVEL_KEY, htalevel)
+        with self.command_batch():
+            self.mode = HEATER_MODE_HOTAIR
+            self._send_command(HTALEVEL_KEY, htalevel)
 
     @property 
     def ecolevel_range(self):
@@ -321,113 +347,14 @@ class PyDreoHeater(PyDreoBaseDevice):
             return
 
 
-    def update_state(self, state: dict) :
+    def update_state(self, state: dict):
         """Process the state dictionary from the REST API."""
-        super().update_state(state) # handles _is_on
+        super().update_state(state)
 
-        _LOGGER.debug("update_state: %s", state)
-        self._htalevel = self.get_state_update_value(state, HTALEVEL_KEY)
         if self._htalevel is None:
             _LOGGER.error("Unable to get heat level from state. Check debug logs for more information.")
 
-        self._temperature = self.get_state_update_value(state, TEMPERATURE_KEY)
-        self._mode = self.get_state_update_value(state, MODE_KEY)
-        self._oscon = self.get_state_update_value(state, OSCON_KEY)
-        self._oscangle = self.get_state_update_value(state, OSCANGLE_KEY)
-        self._mute_on = self.get_state_update_value(state, MUTEON_KEY)
-        self._dev_on = self.get_state_update_value(state, DEVON_KEY)
-        timeron = self.get_state_update_value(state, TIMERON_KEY)
-        self._timer_on = timeron["du"]
-        self._cooldown = self.get_state_update_value(state, COOLDOWN_KEY)
-        self._ptc_on = self.get_state_update_value(state, PTCON_KEY)
-        self._light_on = self.get_state_update_value(state, LIGHTON_KEY)
-        self._ctlstatus = self.get_state_update_value(state, CTLSTATUS_KEY)
-        timeroff = self.get_state_update_value(state, TIMEROFF_KEY)
-        self._timer_off = timeroff["du"]
-        self._ecolevel = self.get_state_update_value(state, ECOLEVEL_KEY)
-        self._childlockon = self.get_state_update_value(state, CHILDLOCKON_KEY)
-        self._tempoffset = self.get_state_update_value(state, TEMPOFFSET_KEY)
-        self._fixed_conf = self.get_state_update_value(state, FIXEDCONF_KEY)
-
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoHeater:handle_server_update(%s): %s", self.name, message)
-
-        val_htalevel = self.get_server_update_key_value(message, HTALEVEL_KEY)
-        if isinstance(val_htalevel, int):
-            self._htalevel = val_htalevel
-
-        # no base class method to handle _is_on
-        val_power_on = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_power_on, bool):
-            self._is_on = val_power_on
-            if not self._is_on:
-                self._mode = HEATER_MODE_OFF
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, int):
-            self._temperature = val_temperature
-
-        # Reported mode can be an empty string if the heater is off. Deal with that by
-        # explicitly setting that to off.
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, str):
-            self._mode = val_mode if val_mode in HEATER_MODES else HEATER_MODE_OFF
-
-        val_oscon = self.get_server_update_key_value(message, OSCON_KEY)
-        if isinstance(val_oscon, bool):
-            self._oscon = val_oscon
-
-        val_oscangle = self.get_server_update_key_value(message, OSCANGLE_KEY)
-        if isinstance(val_oscangle, int):
-            self._oscangle = val_oscangle
-
-        val_muteon = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_muteon, bool):
-            self._mute_on = val_muteon
-
-        val_devon = self.get_server_update_key_value(message, DEVON_KEY)
-        if isinstance(val_devon, bool):
-            self._dev_on = val_devon
-
-        # TODO: This seems wrong; unsure if we need to parse DU out of this like we do in the intial state.
-        val_timeron = self.get_server_update_key_value(message, TIMERON_KEY)
-        if isinstance(val_timeron, int):
-            self._timeron = val_timeron
-
-        val_cooldown = self.get_server_update_key_value(message, COOLDOWN_KEY)
-        if isinstance(val_cooldown, int):
-            self._cooldown = val_cooldown
-
-        val_ptc_on = self.get_server_update_key_value(message, PTCON_KEY)
-        if isinstance(val_ptc_on, bool):
-            self._ptc_on = val_ptc_on
-
-        val_light_on = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light_on, bool):
-            self._light_on = val_light_on
-
-        val_ctlstatus = self.get_server_update_key_value(message, CTLSTATUS_KEY)
-        if isinstance(val_ctlstatus, str):
-            self._ctlstatus = val_ctlstatus
-
-        val_timer_off = self.get_server_update_key_value(message, TIMEROFF_KEY)
-        if isinstance(val_timer_off, int):
-            self._timer_off = val_timer_off
-
-        val_ecolevel = self.get_server_update_key_value(message, ECOLEVEL_KEY)
-        if isinstance(val_ecolevel, int):
-            self._ecolevel = val_ecolevel
-
-        val_childlockon = self.get_server_update_key_value(message, CHILDLOCKON_KEY)  
-        if isinstance(val_childlockon, bool):
-            self._childlockon = val_childlockon
-
-        val_tempoffset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)  
-        if isinstance(val_tempoffset, int):
-            self._tempoffset = val_tempoffset
-    
-        val_fixed_conf = self.get_server_update_key_value(message, FIXEDCONF_KEY)  
-        if isinstance(val_fixed_conf, str):
-            self._fixed_conf = val_fixed_conf
+    def _decode_poweron(self, value: bool) -> None:
+        self._is_on = value
+        if value is False:
+            self._mode = HEATER_MODE_OFF
@@ -5,33 +5,35 @@ from typing import TYPE_CHECKING, Dict
 
 from .constant import (
     LOGGER_NAME,
+    PLATFORM_HUMIDIFIER,
     MODE_KEY,
     MUTEON_KEY,
     POWERON_KEY,
     HUMIDITY_KEY,
     TARGET_AUTO_HUMIDITY_KEY,
     RGB_LEVEL,
-    SCHEDULE_ENABLE     
+    SCHEDULE_ENABLE,
+    WATER_LEVEL_STATUS_KEY,
+    WATER_LEVEL_OK,
+    WATER_LEVEL_EMPTY,
+    LIGHT_ON,
+    LIGHT_OFF,
+    MODE_MANUAL,
+    MODE_AUTO,
+    MODE_SLEEP,
 )
 
 from .helpers import Helpers
 
 
 from .pydreobasedevice import PyDreoBaseDevice
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
-WATER_LEVEL_STATUS_KEY = "wrong"
 WORKTIME_KEY = "worktime"
 
-# Status for water level indicator
-WATER_LEVEL_OK = "Ok"
-WATER_LEVEL_EMPTY = "Empty"
-
-LIGHT_ON = "Enable"
-LIGHT_OFF = "Disabled"
-
 WATER_LEVEL_STATUS_MAP = {
     0: WATER_LEVEL_OK,
     1: WATER_LEVEL_EMPTY,
@@ -46,17 +48,25 @@ RGB_MAP = {
     LIGHT_ON: 2
 }
 
-# Status for mode indicator
-MODE_MANUAL = "manual"
-MODE_AUTO = "auto" 
-MODE_SLEEP = "sleep"
-
 if TYPE_CHECKING:
     from pydreo import PyDreo
 
 class PyDreoHumidifier(PyDreoBaseDevice):
     """Base class for Dreo Humidifiers"""
 
+    PLATFORMS = PyDreoBaseDevice.PLATFORMS | {PLATFORM_HUMIDIFIER}
+
+    STATE_FIELDS = (
+        DreoField(MODE_KEY, "_mode", int),
+        DreoField(MUTEON_KEY, "_mute_on", bool),
+        DreoField(HUMIDITY_KEY, "_humidity", int),
+        DreoField(TARGET_AUTO_HUMIDITY_KEY, "_target_humidity", int),
+        DreoField(WATER_LEVEL_STATUS_KEY, "_wrong", int, transform=WATER_LEVEL_STATUS_MAP.get),
+        DreoField(WORKTIME_KEY, "_worktime", int),
+        DreoField(RGB_LEVEL, "_rgblevel", int, transform=RGB_MAP.get),
+        DreoField(SCHEDULE_ENABLE, "_scheon", bool),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air conditioner devices."""
         super().__init__(device_definition, details, dreo)
@@ -182,52 +192,3 @@ class PyDreoHumidifier(PyDreoBaseDevice):
             self._send_command(MODE_KEY, numeric_value)
         else:
             raise ValueError(f"Preset mode {value} is not in the acceptable list: {self._modes}")
-
-    def update_state(self, state: dict):
-        """Process the state dictionary from the REST API."""
-        super().update_state(state)  # handles _is_on
-
-        _LOGGER.debug("PyDreoHumidifier(%s):update_state: %s", self.name, state)
-        self._mode = self.get_state_update_value(state, MODE_KEY)
-        self._mute_on = self.get_state_update_value(state, MUTEON_KEY)
-        self._humidity = self.get_state_update_value(state, HUMIDITY_KEY)
-        self._target_humidity = self.get_state_update_value(state, TARGET_AUTO_HUMIDITY_KEY)
-        self._wrong = WATER_LEVEL_STATUS_MAP[self.get_state_update_value(state, WATER_LEVEL_STATUS_KEY)]
-        self._worktime = self.get_state_update_value(state, WORKTIME_KEY)
-        self._rgblevel = RGB_MAP[self.get_state_update_value(state, RGB_LEVEL)]
-        self._scheon = self.get_state_update_value(state, SCHEDULE_ENABLE)
-        
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoHumidifier:handle_server_update(%s): %s", self.name, message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron  # Ensure poweron state is updated
-            _LOGGER.debug("PyDreoHumidifier:handle_server_update - poweron is %s", self._is_on)
-
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, int):
-            self._mode = val_mode
-            
-        val_worktime = self.get_server_update_key_value(message, WORKTIME_KEY)
-        if isinstance(val_worktime, int):
-            self._worktime = val_worktime
-
-        val_water_level = self.get_server_update_key_value(message, WATER_LEVEL_STATUS_KEY)
-        if isinstance(val_water_level, int):
-            val_water_level = WATER_LEVEL_STATUS_MAP[val_water_level]
-            self._wrong = val_water_level		
-
-        val_rgblevel = self.get_server_update_key_value(message, RGB_LEVEL)
-        if isinstance(val_rgblevel, int):
-            val_rgblevel = RGB_MAP[val_rgblevel]
-            self._rgblevel = val_rgblevel 
-
-        val_scheon = self.get_server_update_key_value(message, SCHEDULE_ENABLE)
-        if isinstance(val_scheon, bool):
-            self._scheon = val_scheon  
-
-        val_mute_on = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_mute_on, bool):
-            self._mute_on = val_mute_on      
@@ -12,6 +12,7 @@ from .constant import (
 )
 
 from .pydreofanbase import PyDreoFanBase
+from .statefields import DreoField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
@@ -23,6 +24,13 @@ if TYPE_CHECKING:
 class PyDreoTowerFan(PyDreoFanBase):
     """Base class for Dreo Fan API Calls."""
 
+    # Some tower fans use SHAKEHORIZON and some seem to use OSCON
+    STATE_FIELDS = (
+        DreoField(SHAKEHORIZON_KEY, "_shakehorizon", bool),
+        DreoField(SHAKEHORIZONANGLE_KEY, "_shakehorizonangle", int),
+        DreoField(OSCILLATION_KEY, "_oscillating", bool),
+    )
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -113,31 +121,4 @@ class PyDreoTowerFan(PyDreoFanBase):
         """Set the oscillation angle."""
         _LOGGER.debug("PyDreoFan:shakehorizonangle.setter")
         if self._shakehorizonangle is not None:
-            self._send_command(SHAKEHORIZONANGLE_KEY, int(value))           
-
-    def update_state(self, state: dict):
-        """Process the state dictionary from the REST API."""
-        _LOGGER.debug("PyDreoFan:update_state")
-        super().update_state(state)
-
-        self._shakehorizon = self.get_state_update_value(state, SHAKEHORIZON_KEY)
-        self._shakehorizonangle = self.get_state_update_value(state, SHAKEHORIZONANGLE_KEY)
-        self._oscillating = self.get_state_update_value(state, OSCILLATION_KEY)
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("PyDreoFan:handle_server_update")
-        super().handle_server_update(message)
-
-        # Some tower fans use SHAKEHORIZON and some seem to use OSCON
-        val_shakehorizon = self.get_server_update_key_value(message, SHAKEHORIZON_KEY)
-        if isinstance(val_shakehorizon, bool):
-            self._shakehorizon = val_shakehorizon
-
-        val_shakehorizonangle = self.get_server_update_key_value(message, SHAKEHORIZONANGLE_KEY)
-        if isinstance(val_shakehorizonangle, int):
-            self._shakehorizonangle = val_shakehorizonangle
-
-        val_horiz_oscillation = self.get_server_update_key_value(message, OSCILLATION_KEY)
-        if isinstance(val_horiz_oscillation, bool):
-            self._horizontally_oscillating = val_horiz_oscillation
+            self._send_command(SHAKEHORIZONANGLE_KEY, int(value))
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class PyDreoUnknownDevice(PyDreoBaseDevice):
     """Dreo Device class for unknown devices."""
 
+    PLATFORMS = frozenset()
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):  #pylint: disable=useless-super-delegation
         """Initialize the Dreo Device."""
         super().__init__(device_definition, details, dreo)
@@ -0,0 +1,52 @@
+"""Reconnect policies for the WebSocket transport."""
+
+import random
+
+
+class ReconnectPolicy:
+    """Decides how long to wait before the next connection attempt.
+
+    Subclass and override next_delay() to customize reconnect behavior."""
+
+    def reset(self) -> None:
+        """Called when a connection has stayed open long enough to count as stable."""
+
+    def next_delay(self) -> float | None:
+        """Return the seconds to wait before the next attempt, or None to stop reconnecting."""
+        raise NotImplementedError
+
+
+class ExponentialBackoffPolicy(ReconnectPolicy):
+    """Exponential backoff with jitter, capped at max_delay.
+
+    The n-th consecutive failed attempt waits initial_delay * factor^(n-1) seconds,
+    capped at max_delay, then reduced by a random amount of up to jitter (a fraction)
+    so many clients do not reconnect in lockstep."""
+
+    def __init__(self,
+                 initial_delay: float = 1,
+                 max_delay: float = 300,
+                 factor: float = 2,
+                 jitter: float = 0.5,
+                 max_attempts: int | None = None):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self._attempts = 0
+
+    @property
+    def attempts(self) -> int:
+        """Number of consecutive failed attempts since the last reset."""
+        return self._attempts
+
+    def reset(self) -> None:
+        self._attempts = 0
+
+    def next_delay(self) -> float | None:
+        if self.max_attempts is not None and self._attempts >= self.max_attempts:
+            return None
+        delay = min(self.max_delay, self.initial_delay * self.factor ** self._attempts)
+        self._attempts += 1
+        return delay * (1 - self.jitter * random.random())
@@ -0,0 +1,89 @@
+"""Timers run by one shared thread."""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from .constant import LOGGER_NAME
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+
+class ScheduledCall:
+    """A callback scheduled with Scheduler.call_later()."""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Stop the callback from running, if it has not run yet."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Runs callbacks after a delay on a single daemon thread.
+
+    Deadlines are kept in a heap, so one thread serves any number of pending calls.
+    The thread is started by the first call and exits when none are left.  Callbacks
+    run one at a time, so they should not block."""
+
+    def __init__(self, name: str = "DreoScheduler"):
+        self._name = name
+        self._heap: list[tuple[float, int, ScheduledCall]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread = None
+
+    def call_later(self, delay: float, callback: Callable, *args) -> ScheduledCall:
+        """Run callback(*args) after delay seconds.  Returns a handle that can cancel it."""
+        call = ScheduledCall(time.monotonic() + delay, callback, args)
+        with self._condition:
+            heapq.heappush(self._heap, (call.deadline, next(self._sequence), call))
+            if self._thread is None:
+                self._thread = threading.Thread(name=self._name, target=self._run, daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is call:
+                # The new call is due before the one the thread is waiting for.
+                self._condition.notify()
+        return call
+
+    def _next_call(self) -> ScheduledCall | None:
+        """Wait for the earliest call to be due and return it, or None if there are none left."""
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._thread = None
+                    return None
+                delay = self._heap[0][0] - time.monotonic()
+                if delay <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._condition.wait(delay)
+
+    def _run(self) -> None:
+        while (call := self._next_call()) is not None:
+            if call.cancelled:
+                continue
+            try:
+                call.callback(*call.args)
+            except Exception: # pylint: disable=broad-except
+                _LOGGER.exception("Error in scheduled call %s", call.callback)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of calls waiting to run, including cancelled ones not yet discarded."""
+        with self._condition:
+            return len(self._heap)
+
+
+# Shared by the command coalescer and tracker of every PyDreo instance.
+DEFAULT_SCHEDULER = Scheduler()
@@ -0,0 +1,89 @@
+"""Cache of device settings read from the Dreo REST API."""
+
+import threading
+import time
+from typing import Any
+
+# Seconds a setting read from the API is used before it is read again.
+DEFAULT_SETTINGS_TTL = 3600
+
+
+class _CachedSetting:
+    """A setting value and the monotonic time it was read, or None if it has not been read."""
+
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value, fetched_at: float | None):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class SettingsCache:
+    """Setting values per device serial number and setting key.
+
+    A value is fresh for ttl seconds after it was read from (or written to) the API.
+    Seeded values, e.g. from a startup cache, can be used but are never fresh."""
+
+    def __init__(self, ttl: float = DEFAULT_SETTINGS_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._settings: dict[tuple[str, str], _CachedSetting] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_fresh(self, serial_number: str, setting: str, default=None) -> Any:
+        """Return the cached value if it is fresh, else default.  Counts a hit or a miss."""
+        with self._lock:
+            cached = self._settings.get((serial_number, setting))
+            if cached is not None and self._is_fresh(cached):
+                self.hits += 1
+                return cached.value
+            self.misses += 1
+            return default
+
+    def is_fresh(self, serial_number: str, setting: str) -> bool:
+        """Return True if the cached value can be used without reading it again."""
+        with self._lock:
+            cached = self._settings.get((serial_number, setting))
+            return cached is not None and self._is_fresh(cached)
+
+    def get(self, serial_number: str, setting: str, default=None) -> Any:
+        """Return the cached value, fresh or not, or default if there is none."""
+        with self._lock:
+            cached = self._settings.get((serial_number, setting))
+            return cached.value if cached is not None else default
+
+    def put(self, serial_number: str, setting: str, value) -> None:
+        """Store a value just read from, or written to, the API."""
+        with self._lock:
+            self._settings[(serial_number, setting)] = _CachedSetting(value, time.monotonic())
+
+    def seed(self, serial_number: str, setting: str, value) -> None:
+        """Store a value from an earlier session.  It is used until the setting is read again."""
+        with self._lock:
+            if (serial_number, setting) not in self._settings:
+                self._settings[(serial_number, setting)] = _CachedSetting(value, None)
+
+    def invalidate(self, serial_number: str | None = None) -> None:
+        """Mark the values of one device, or of all devices, as needing to be read again."""
+        with self._lock:
+            for (cached_sn, _), cached in self._settings.items():
+                if serial_number is None or cached_sn == serial_number:
+                    cached.fetched_at = None
+
+    def export(self) -> dict[str, dict[str, Any]]:
+        """Return the cached values as {serial number: {setting: value}}."""
+        with self._lock:
+            exported: dict[str, dict[str, Any]] = {}
+            for (serial_number, setting), cached in self._settings.items():
+                exported.setdefault(serial_number, {})[str(setting)] = cached.value
+            return exported
+
+    @property
+    def stats(self) -> dict:
+        """Return cache hits and misses and the number of cached settings."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "cached_settings": len(self._settings)}
+
+    def _is_fresh(self, cached: _CachedSetting) -> bool:
+        return cached.fetched_at is not None and time.monotonic() - cached.fetched_at < self.ttl
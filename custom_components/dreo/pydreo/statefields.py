@@ -0,0 +1,72 @@
+"""Declarative descriptions of the state keys a device reports."""
+
+from collections.abc import Callable
+from typing import Any
+
+
+class DreoField:
+    """Maps one wire key of a device report to a device attribute.
+
+    key is the key in the REST state or WebSocket "reported" dict and attr the
+    attribute it is stored in.  WebSocket values that are not an instance of types
+    are ignored.  transform converts a reported value before it is stored;
+    rest_transform, if given, is used instead for REST state.  A handler, the name
+    of a device method taking the value, replaces the default assignment for keys
+    that update more than one attribute.  name is the attribute's public name, used
+    in state snapshots and sets of changed state."""
+
+    __slots__ = ("key", "attr", "name", "types", "transform", "rest_transform", "handler")
+
+    def __init__(self,
+                 key: str,
+                 attr: str = None,
+                 types: type | tuple[type, ...] = None,
+                 transform: Callable[[Any], Any] = None,
+                 rest_transform: Callable[[Any], Any] = None,
+                 handler: str = None):
+        if attr is None and handler is None:
+            raise ValueError(f"Field {key} needs an attribute or a handler")
+        self.key = key
+        self.attr = attr
+        self.name = state_name(attr) if attr is not None else None
+        self.types = types
+        self.transform = transform
+        self.rest_transform = rest_transform if rest_transform is not None else transform
+        self.handler = handler
+
+    def __repr__(self):
+        return f"<DreoField:{self.key}->{self.attr or self.handler}>"
+
+
+def compile_fields(cls: type) -> dict[str, DreoField]:
+    """Merge the STATE_FIELDS of a class and its bases into a key to field map.
+
+    Fields declared by a subclass replace fields with the same key in its bases."""
+    field_map: dict[str, DreoField] = {}
+    for klass in reversed(cls.__mro__):
+        for field in vars(klass).get("STATE_FIELDS", ()):
+            field_map[field.key] = field
+    return field_map
+
+
+def state_name(attr: str) -> str:
+    """Return the public name of a state attribute, e.g. "fan_speed" for "_fan_speed"."""
+    return attr.lstrip("_")
+
+
+def compile_state_attributes(cls: type, field_map: dict[str, DreoField]) -> dict[str, str]:
+    """Return the attributes that hold the state of a class, mapped to their public names.
+
+    These are the attributes of its fields, plus the STATE_ATTRIBUTES of the class and
+    its bases for attributes set by handlers, settings or REST state processing."""
+    attrs = [field.attr for field in field_map.values() if field.attr is not None]
+    for klass in reversed(cls.__mro__):
+        attrs.extend(vars(klass).get("STATE_ATTRIBUTES", ()))
+    return {attr: state_name(attr) for attr in attrs}
+
+
+def duration(value):
+    """Return the duration of a timer report, which is either a number or a dict with "du"."""
+    if isinstance(value, dict):
+        return value.get("du")
+    return value
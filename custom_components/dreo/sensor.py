@@ -11,7 +11,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 import logging
 
-from .dreobasedevice import DreoBaseDeviceHA
+from .dreobasedevice import DreoBaseDeviceHA, async_add_discovered_entities
 from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .pydreo.constant import (
@@ -19,13 +19,17 @@ from .pydreo.constant import (
     MODE_KEY,
     PM25_KEY,
     DreoDeviceType,
-    RGB_LEVEL
-)
-
-from .pydreo.pydreoevaporativecooler import (
-    WATER_LEVEL_EMPTY, 
-    WATER_LEVEL_OK, 
-    WATER_LEVEL_STATUS_KEY
+    RGB_LEVEL,
+    WATER_LEVEL_EMPTY,
+    WATER_LEVEL_OK,
+    WATER_LEVEL_STATUS_KEY,
+    WORK_TIME,
+    TEMP_TARGET_REACHED,
+    MODE_MANUAL,
+    MODE_AUTO,
+    MODE_SLEEP,
+    LIGHT_ON,
+    LIGHT_OFF,
 )
 
 from .haimports import *  # pylint: disable=W0401,W0614
@@ -35,26 +39,6 @@ from .const import (
     DOMAIN,
     PYDREO_MANAGER,
 )
-
-from .pydreo.pydreoairconditioner import (
-    WORK_TIME,
-    TEMP_TARGET_REACHED,
-)
-
-from .pydreo.pydreochefmaker import (
-    MODE_OFF,
-    MODE_COOKING,
-    MODE_STANDBY,
-    MODE_PAUSED,
-)
-
-from .pydreo.pydreohumidifier import (
-    MODE_MANUAL,
-    MODE_AUTO,
-    MODE_SLEEP,
-    LIGHT_ON,
-    LIGHT_OFF,
-)
 _LOGGER = logging.getLogger(LOGGER)
 
 
@@ -62,6 +46,7 @@ _LOGGER = logging.getLogger(LOGGER)
 class DreoSensorEntityDescription(SensorEntityDescription):
     """Describe Dreo sensor entity."""
 
+    attr_name: str = None
     value_fn: Callable[[DreoBaseDeviceHA], StateType] = None
     exists_fn: Callable[[DreoBaseDeviceHA], bool] = None
     native_unit_of_measurement_fn: Callable[[DreoBaseDeviceHA], str] = None
@@ -74,6 +59,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        attr_name="temperature",
         value_fn=lambda device: device.temperature,
         exists_fn=lambda device: (not device.type in { DreoDeviceType.HEATER, DreoDeviceType.AIR_CONDITIONER }) and device.is_feature_supported("temperature"),
     ),
@@ -83,6 +69,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "%",
+        attr_name="humidity",
         value_fn=lambda device: device.humidity,
         exists_fn=lambda device: device.is_feature_supported(HUMIDITY_KEY),
     ),
@@ -92,6 +79,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "h",
+        attr_name="worktime",
         value_fn=lambda device: device.worktime,
         exists_fn=lambda device: device.is_feature_supported(WORK_TIME),
     ),
@@ -100,6 +88,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         translation_key="reach_target_temp",
         device_class=SensorDeviceClass.ENUM,
         options=["Yes", "No"],
+        attr_name="temp_target_reached",
         value_fn=lambda device: device.temp_target_reached,
         exists_fn=lambda device: device.is_feature_supported(TEMP_TARGET_REACHED),
     ),
@@ -108,6 +97,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         translation_key="status",
         device_class=SensorDeviceClass.ENUM,
         options=[MODE_MANUAL, MODE_AUTO, MODE_SLEEP],
+        attr_name="mode",
         value_fn=lambda device: device.mode,
         exists_fn=lambda device: device.is_feature_supported(MODE_KEY),
     ),
@@ -117,6 +107,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PM25,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "%",
+        attr_name="pm25",
         value_fn=lambda device: device.pm25,
         exists_fn=lambda device: device.is_feature_supported(PM25_KEY),
     ),
@@ -125,6 +116,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         translation_key="water",
         device_class=SensorDeviceClass.ENUM,
         options=[WATER_LEVEL_OK, WATER_LEVEL_EMPTY],
+        attr_name="wrong",
         value_fn=lambda device: device.wrong,
         exists_fn=lambda device: device.is_feature_supported(WATER_LEVEL_STATUS_KEY),
     ),
@@ -133,6 +125,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         translation_key="light",
         device_class=SensorDeviceClass.ENUM,
         options=[LIGHT_ON, LIGHT_OFF],
+        attr_name="rgblevel",
         value_fn=lambda device: device.rgblevel,
         exists_fn=lambda device: device.is_feature_supported(RGB_LEVEL),
          )
@@ -147,8 +140,6 @@ def get_entries(pydreo_devices : list[PyDreoBaseDevice]) -> list[DreoSensorHA]:
         sensor_keys : list[str] = []
         
         for sensor_definition in SENSORS:
-            _LOGGER.debug("Sensor:get_entries: checking exists fn: %s on %s", sensor_definition.key, pydreo_device.name)
-
             if sensor_definition.exists_fn(pydreo_device):
                 if (sensor_definition.key in sensor_keys):
                     _LOGGER.error("Sensor:get_entries: Duplicate sensor key %s", sensor_definition.key)
@@ -174,6 +165,8 @@ async def async_setup_entry(
 
     async_add_entities(get_entries(pydreo_manager.devices))
 
+    async_add_discovered_entities(hass, config_entry, Platform.SENSOR, get_entries, async_add_entities)
+
 
 class DreoSensorHA(DreoBaseDeviceHA, SensorEntity):
     """Representation of a sensor describing a read-only property of a Dreo device."""
@@ -200,6 +193,12 @@ class DreoSensorHA(DreoBaseDeviceHA, SensorEntity):
             self._attr_name,
             self._attr_unique_id)
 
+    @property
+    def pydreo_attr_names(self) -> tuple[str, ...] | None:
+        if self.entity_description.attr_name is None:
+            return None
+        return (self.entity_description.attr_name,)
+
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
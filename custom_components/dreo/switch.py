@@ -11,7 +11,7 @@ from dataclasses import dataclass
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .dreobasedevice import DreoBaseDeviceHA
+from .dreobasedevice import DreoBaseDeviceHA, async_add_discovered_entities
 from .dreochefmaker import DreoChefMakerHA
 from .pydreo import PyDreo, PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
@@ -122,8 +122,6 @@ def get_entries(pydreo_devices : list[PyDreoBaseDevice]) -> list[DreoSwitchHA]:
         switch_keys : list[str] = []
 
         for switch_definition in SWITCHES:
-            _LOGGER.debug("Switch:get_entries: checking attribute: %s on %s", switch_definition.attr_name, pydreo_device.name)
-
             if pydreo_device.is_feature_supported(switch_definition.attr_name):
                 if (switch_definition.key in switch_keys):
                     _LOGGER.error("Switch:get_entries: Duplicate switch key %s", switch_definition.key)
@@ -136,6 +134,16 @@ def get_entries(pydreo_devices : list[PyDreoBaseDevice]) -> list[DreoSwitchHA]:
     return switch_ha_collection
 
 
+def _get_switch_entities(pydreo_devices : list[PyDreoBaseDevice]) -> list[SwitchEntity]:
+    """Get the Chef Maker entities and the Dreo Switches for the devices."""
+    switch_entities_ha : list[SwitchEntity] = []
+    for pydreo_device in pydreo_devices:
+        if pydreo_device.type == DreoDeviceType.CHEF_MAKER:
+            switch_entities_ha.append(DreoChefMakerHA(pydreo_device))
+    switch_entities_ha.extend(get_entries(pydreo_devices))
+    return switch_entities_ha
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -146,15 +154,9 @@ async def async_setup_entry(
 
     pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
 
-    switch_entities_ha : list[SwitchEntity] = []
-    for pydreo_device in pydreo_manager.devices:
-        if pydreo_device.type == DreoDeviceType.CHEF_MAKER:
-            switch_entities_ha.append(DreoChefMakerHA(pydreo_device))
-    switch_entities_to_add = get_entries(pydreo_manager.devices)
+    async_add_entities(_get_switch_entities(pydreo_manager.devices))
 
-    switch_entities_ha.extend(switch_entities_to_add)
-
-    async_add_entities(switch_entities_ha)
+    async_add_discovered_entities(hass, config_entry, Platform.SWITCH, _get_switch_entities, async_add_entities)
 
 class DreoSwitchHA(DreoBaseDeviceHA, SwitchEntity):
     """Representation of a Switch describing a read-write property of a Dreo device."""
@@ -178,6 +180,10 @@ class DreoSwitchHA(DreoBaseDeviceHA, SwitchEntity):
             self._attr_name,
             self._attr_unique_id)
 
+    @property
+    def pydreo_attr_names(self) -> tuple[str, ...]:
+        return (self.entity_description.attr_name,)
+
     @property
     def is_on(self) -> bool:
         """Return True if device is on."""
@@ -27,3 +27,8 @@ class TestDiagnostics(IntegrationTestBase):
         assert raw_device_list.get("list")[0].get("deviceName") == "Pilot Pro S"
         assert raw_device_list.get("list")[0].get("sn") == "**REDACTED**"
         assert raw_device_list.get("list")[0].get("productId") == "**REDACTED**"
+        assert dreo.get("command_acks").get("commands_pending") == 0
+        assert dreo.get("message_dispatch").get("messages_dropped") == 0
+        device = diag.get("devices")[0]
+        assert "oscillating" in device.get("_capabilities").get("features")
+        assert device.get("_capabilities").get("ranges").get("speed_range") == (1, 12)
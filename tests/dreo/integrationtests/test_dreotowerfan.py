@@ -1,11 +1,20 @@
 """Tests for Dreo Fans"""
 # pylint: disable=used-before-assignment
+import asyncio
 import logging
-from unittest.mock import patch
+import threading
+from unittest.mock import MagicMock, patch
 import pytest
+from custom_components.dreo import number
+from custom_components.dreo import sensor
+from custom_components.dreo import switch
 from  .imports import * # pylint: disable=W0401,W0614
+from custom_components.dreo.const import DOMAIN, DREO_STATE_WRITER
+from custom_components.dreo.dreobasedevice import DreoStateWriter
 from .integrationtestbase import IntegrationTestBase, PATCH_SEND_COMMAND
 
+PATCH_ASYNC_WRITE_HA_STATE = 'homeassistant.helpers.entity.Entity.async_write_ha_state'
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
@@ -40,3 +49,65 @@ class TestDreoTowerFan(IntegrationTestBase):
 
         with pytest.raises(ValueError):
             fan.fan_speed = 13
+
+    def test_HTF005S_subscriptions(self):  # pylint: disable=invalid-name
+        """Entities are only updated when an attribute they show changes."""
+
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        pydreo_fan = self.pydreo_manager.devices[0]
+
+        entities = (sensor.get_entries([pydreo_fan]) +
+                    switch.get_entries([pydreo_fan]) +
+                    number.get_entries([pydreo_fan]))
+        temperature_sensor = next(e for e in entities if e.entity_description.key == "temperature")
+        loop = asyncio.new_event_loop()
+        hass = MagicMock()
+        hass.data = {DOMAIN: {DREO_STATE_WRITER: DreoStateWriter(loop)}}
+        for entity in entities:
+            entity.hass = hass
+            loop.run_until_complete(entity.async_added_to_hass())
+
+        with patch(PATCH_ASYNC_WRITE_HA_STATE, autospec=True) as mock_write_ha_state:
+            pydreo_fan.handle_server_update_base({REPORTED_KEY: {TEMPERATURE_KEY: pydreo_fan.temperature + 1}})
+            loop.run_until_complete(asyncio.sleep(0))
+            assert [call.args[0] for call in mock_write_ha_state.call_args_list] == [temperature_sensor]
+        loop.close()
+
+        # Removing the entities unsubscribes them.
+        for entity in entities:
+            for remove_callback in entity._on_remove: # pylint: disable=protected-access
+                remove_callback()
+        assert not pydreo_fan._subscriptions # pylint: disable=protected-access
+
+    def test_HTF005S_state_writes_coalesced(self):  # pylint: disable=invalid-name
+        """Updates from another thread are written on the loop once per entity per burst."""
+
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        pydreo_fan = self.pydreo_manager.devices[0]
+
+        entities = sensor.get_entries([pydreo_fan]) + switch.get_entries([pydreo_fan])
+        temperature_sensor = next(e for e in entities if e.entity_description.key == "temperature")
+        loop = asyncio.new_event_loop()
+        hass = MagicMock()
+        hass.data = {DOMAIN: {DREO_STATE_WRITER: DreoStateWriter(loop)}}
+        for entity in entities:
+            entity.hass = hass
+            loop.run_until_complete(entity.async_added_to_hass())
+
+        def report_burst():
+            for offset in range(1, 4):
+                pydreo_fan.handle_server_update_base({REPORTED_KEY: {TEMPERATURE_KEY: pydreo_fan.temperature + offset}})
+
+        with patch(PATCH_ASYNC_WRITE_HA_STATE, autospec=True) as mock_write_ha_state, \
+             patch.object(loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe) as mock_call_soon:
+            thread = threading.Thread(target=report_burst)
+            thread.start()
+            thread.join()
+            mock_write_ha_state.assert_not_called()
+            assert mock_call_soon.call_count == 1
+
+            loop.run_until_complete(asyncio.sleep(0))
+            assert [call.args[0] for call in mock_write_ha_state.call_args_list] == [temperature_sensor]
+        loop.close()
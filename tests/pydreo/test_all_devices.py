@@ -5,8 +5,15 @@ All tests inherit from the TestBase class which contains the fixtures
 and methods needed to run the tests.
 """
 # import utils
+import asyncio
 import logging
-from .testbase import TestBase
+import threading
+import time
+from unittest.mock import patch
+from  .imports import * # pylint: disable=W0401,W0614
+from custom_components.dreo import pydreo
+from .testbase import TestBase, PATCH_ASYNC_CALL_DREO_API, PATCH_BASE_PATH, Defaults
+from . import call_json
 
 
 logger = logging.getLogger(__name__)
@@ -21,6 +28,66 @@ class TestGeneralAPI(TestBase):
         self.pydreo_manager.enabled = False
         assert self.pydreo_manager.login()
 
+    def test_restore_session_and_reauthenticate(self):
+        """A saved token is used without logging in, and replaced when the API rejects it."""
+        sessions = []
+        self.pydreo_manager.session_update_callback = sessions.append
+        self.pydreo_manager.enabled = False
+        self.pydreo_manager.token = None
+
+        assert not self.pydreo_manager.restore_session({"username": "OTHER", "token": "OLD", "region": "NA"})
+        assert not self.pydreo_manager.restore_session(
+            {"username": "EMAIL", "token": "OLD", "region": "NA", "expires_at": time.time() + 10})
+        assert not self.pydreo_manager.enabled
+        assert self.pydreo_manager.restore_session(
+            {"username": "EMAIL", "token": "OLD", "region": "NA", "expires_at": time.time() + 3600})
+        assert self.pydreo_manager.enabled
+        assert self.pydreo_manager.token == "OLD"
+
+        # call_dreo_api is patched by TestBase; route it through the real method so it retries.
+        real_call_dreo_api = self.mock_api_call.temp_original
+        self.mock_api.side_effect = lambda api, json_object=None: real_call_dreo_api(
+            self.pydreo_manager, api, json_object)
+        apis = []
+
+        def call_api(api, json_object=None):
+            apis.append(api)
+            if api != "login" and self.pydreo_manager.token == "OLD":
+                return None, 401
+            return self.call_dreo_api(api, json_object)
+
+        self.get_devices_file_name = "get_devices_HTF008S.json"
+        with patch(f"{PATCH_BASE_PATH}.PyDreo._call_dreo_api", side_effect=call_api):
+            assert self.pydreo_manager.load_devices()
+        assert apis[:3] == ["devicelist", "login", "devicelist"]
+        assert apis.count("login") == 1
+        assert self.pydreo_manager.token == Defaults.token
+        assert sessions == [self.pydreo_manager.session_data]
+        assert len(self.pydreo_manager.devices) == 1
+
+    def test_async_reauthenticate_shares_login(self):
+        """Concurrent async calls rejected with the same token log in again only once."""
+        self.pydreo_manager.token = "OLD"
+        self.get_devices_file_name = "get_devices_HTF008S.json"
+        apis = []
+
+        async def call_api(api, json_object=None):
+            apis.append(api)
+            if api == "login":
+                await asyncio.sleep(0.01)
+            elif self.pydreo_manager.token == "OLD":
+                return None, 401
+            return self.call_dreo_api(api, json_object)
+
+        async def run():
+            return await asyncio.gather(*(self.pydreo_manager.async_call_dreo_api("devicelist") for _ in range(3)))
+
+        with patch(f"{PATCH_BASE_PATH}.PyDreo._async_call_dreo_api", side_effect=call_api):
+            results = asyncio.run(run())
+        assert apis.count("login") == 1
+        assert all(status == 200 for _, status in results)
+        assert self.pydreo_manager.token == Defaults.token
+
     def test_load_devices(self):
         """Test get_devices() method request and API response."""
         print("Test Device List")
@@ -37,4 +104,225 @@ class TestGeneralAPI(TestBase):
         self.get_devices_file_name = "get_devices_UNKNOWN.json"
         self.pydreo_manager.load_devices()
         assert len(self.pydreo_manager.devices) == 1
-        assert self.pydreo_manager.devices[0].type == "Unknown"
\ No newline at end of file
+        assert self.pydreo_manager.devices[0].type == "Unknown"
+
+    def test_resolve_model(self):
+        """Exact models resolve to their own details, other models to their longest prefix."""
+        assert resolve_model("DR-HPF008S") is SUPPORTED_DEVICES["DR-HPF008S"]
+        assert resolve_model("DR-HPF007S") is SUPPORTED_DEVICES["DR-HPF"]
+        assert resolve_model("DR-HTF008S").device_type == DreoDeviceType.TOWER_FAN
+        assert resolve_model("DR-XYZ001S") is None
+        assert resolve_model("") is None
+
+    def test_load_devices_paginated(self):
+        """Devices on a page load while later pages are still loading, and keep the order of the pages."""
+        device_files = ["get_devices_HTF005S.json",
+                        "get_devices_HAF001S.json",
+                        "get_devices_HCF001S.json"]
+        device_list = [call_json.get_response_from_file(file_name)["data"]["list"][0]
+                       for file_name in device_files]
+        pages = []
+        events = []
+
+        def call_dreo_api(api, json_object=None):
+            if api == "devicelist":
+                page_no = int((json_object or {}).get(PAGE_NO_KEY, 1))
+                pages.append(page_no)
+                if page_no == len(device_list):
+                    time.sleep(0.2)
+                events.append(("devicelist", page_no))
+                return {"code": 0, "data": {"currentPage": page_no, "totalPage": len(device_list),
+                                            "list": [device_list[page_no - 1]]}}, 200
+            if api == "devicestate":
+                events.append(("devicestate", json_object["deviceSn"]))
+            return self.call_dreo_api(api, json_object)
+
+        self.mock_api.side_effect = call_dreo_api
+        assert self.pydreo_manager.load_devices()
+
+        assert sorted(pages) == [1, 2, 3]
+        # The devices on the first pages loaded before the last page arrived.
+        last_page = events.index(("devicelist", 3))
+        assert ("devicestate", device_list[0]["sn"]) in events[:last_page]
+        assert ("devicestate", device_list[1]["sn"]) in events[:last_page]
+        assert [device.serial_number for device in self.pydreo_manager.devices] == [d["sn"] for d in device_list]
+        assert len(self.pydreo_manager.raw_response["data"]["list"]) == 3
+        assert self.pydreo_manager.export_cache()["devicelist"]["data"]["list"] == device_list
+
+    def test_refresh_device_list(self):
+        """Refreshing the device list adds new devices and removes missing ones, leaving the others."""
+        device_files = ["get_devices_HTF005S.json",
+                        "get_devices_HAF001S.json",
+                        "get_devices_HCF001S.json"]
+        device_list = [call_json.get_response_from_file(file_name)["data"]["list"][0]
+                       for file_name in device_files]
+        listed = device_list[:2]
+        state_calls = []
+
+        def call_dreo_api(api, json_object=None):
+            if api == "devicelist":
+                return {"code": 0, "data": {"totalNum": len(listed), "list": list(listed)}}, 200
+            if api == "devicestate":
+                state_calls.append(json_object["deviceSn"])
+            return self.call_dreo_api(api, json_object)
+
+        self.mock_api.side_effect = call_dreo_api
+        assert self.pydreo_manager.load_devices()
+        kept = self.pydreo_manager.devices[0]
+        changes = []
+        self.pydreo_manager.device_list_callback = lambda added, removed: changes.append((added, removed))
+
+        assert self.pydreo_manager.refresh_device_list() == ([], [])
+        assert not changes
+
+        removed_device = self.pydreo_manager.devices[1]
+        listed = [device_list[0], device_list[2]]
+        state_calls.clear()
+        added, removed = self.pydreo_manager.refresh_device_list()
+
+        assert [device.serial_number for device in added] == [device_list[2]["sn"]]
+        assert removed == [removed_device]
+        assert changes == [(added, removed)]
+        assert state_calls == [device_list[2]["sn"]]
+        assert self.pydreo_manager.devices == [kept] + added
+
+    def test_refresh_device_list_failed_page(self):
+        """A device list with a page that failed to load does not remove the devices on that page."""
+        device_files = ["get_devices_HTF005S.json",
+                        "get_devices_HAF001S.json"]
+        device_list = [call_json.get_response_from_file(file_name)["data"]["list"][0]
+                       for file_name in device_files]
+        failing_pages = []
+
+        def call_dreo_api(api, json_object=None):
+            if api == "devicelist":
+                page_no = int((json_object or {}).get(PAGE_NO_KEY, 1))
+                if page_no in failing_pages:
+                    return {"code": 1, "msg": "Simulated failure"}, 200
+                return {"code": 0, "data": {"currentPage": page_no, "totalPage": len(device_list),
+                                            "list": [device_list[page_no - 1]]}}, 200
+            return self.call_dreo_api(api, json_object)
+
+        self.mock_api.side_effect = call_dreo_api
+        assert self.pydreo_manager.load_devices()
+        devices = list(self.pydreo_manager.devices)
+        raw_response = self.pydreo_manager.raw_response
+        changes = []
+        self.pydreo_manager.device_list_callback = lambda added, removed: changes.append((added, removed))
+
+        failing_pages.append(2)
+        assert self.pydreo_manager.refresh_device_list() == ([], [])
+        assert self.pydreo_manager.refresh_devices() == []
+        assert self.pydreo_manager.devices == devices
+        assert self.pydreo_manager.raw_response is raw_response
+        assert not changes
+
+        # Loading fails too, without adding the devices on the page that loaded.
+        manager = PyDreo('EMAIL', 'PASSWORD', redact=True)
+        manager.enabled = True
+        assert not manager.load_devices()
+        assert not manager.devices
+
+    def test_load_devices_concurrent(self):
+        """Devices load in parallel, keep API order and isolate failures."""
+        device_files = ["get_devices_HTF005S.json",
+                        "get_devices_HAF001S.json",
+                        "get_devices_HCF001S.json",
+                        "get_devices_HSH009S.json"]
+        device_list = [call_json.get_response_from_file(file_name)["data"]["list"][0]
+                       for file_name in device_files]
+        failing_sn = device_list[1]["sn"]
+
+        def call_dreo_api(api, json_object=None):
+            if api == "devicelist":
+                return {"code": 0, "data": {"totalNum": len(device_list), "list": device_list}}, 200
+            if api == "devicestate":
+                if json_object["deviceSn"] == failing_sn:
+                    raise RuntimeError("Simulated failure")
+                # Finish the first devices last so completion order differs from list order.
+                time.sleep(0.05 * (len(device_list) - [d["sn"] for d in device_list].index(json_object["deviceSn"])))
+            return self.call_dreo_api(api, json_object)
+
+        self.mock_api.side_effect = call_dreo_api
+        self.pydreo_manager.max_concurrency = 4
+        assert self.pydreo_manager.load_devices()
+
+        assert [device.serial_number for device in self.pydreo_manager.devices] == \
+            [d["sn"] for d in device_list if d["sn"] != failing_sn]
+        assert list(self.pydreo_manager.device_load_errors) == [failing_sn]
+
+    def test_resync_device_states(self):
+        """Resyncing runs callbacks only for devices whose state changed."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        callbacks = []
+        fan.add_attr_callback(lambda: callbacks.append(fan))
+        changes = []
+        fan.add_attr_callback(changes.append, with_changes=True)
+
+        # A concurrency of 0 still resyncs, one device at a time.
+        self.pydreo_manager.max_concurrency = 0
+        assert self.pydreo_manager.resync_device_states() == []
+        assert not callbacks
+
+        def call_dreo_api(api, json_object=None):
+            response, status = self.call_dreo_api(api, json_object)
+            if api == "devicestate":
+                response["data"]["mixed"][WINDLEVEL_KEY]["state"] = fan.fan_speed + 1
+            return response, status
+
+        self.mock_api.side_effect = call_dreo_api
+        assert self.pydreo_manager.resync_device_states() == [fan]
+        assert callbacks == [fan]
+        assert changes == [{"fan_speed"}]
+
+    def test_async_login_and_load_devices(self):
+        """The async API logs in and loads devices without the sync REST path."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+
+        async def async_call_dreo_api(api, json_object=None):
+            return self.call_dreo_api(api, json_object)
+
+        async def run():
+            self.pydreo_manager.enabled = False
+            assert await self.pydreo_manager.async_login()
+            assert await self.pydreo_manager.async_load_devices()
+
+        # Device modules are imported in the executor, not on the event loop.
+        import_threads = []
+        import_device_modules = pydreo._import_device_modules # pylint: disable=protected-access
+
+        def record_import(device_list):
+            import_threads.append(threading.current_thread())
+            import_device_modules(device_list)
+
+        with patch(PATCH_ASYNC_CALL_DREO_API, side_effect=async_call_dreo_api), \
+             patch(f"{PATCH_BASE_PATH}._import_device_modules", side_effect=record_import):
+            asyncio.run(run())
+
+        assert import_threads and threading.current_thread() not in import_threads
+
+        # Settings are prefetched with the async API too, so nothing goes through the sync path.
+        assert not self.mock_api.call_args_list
+        assert len(self.pydreo_manager.devices) == 1
+        assert self.pydreo_manager.devices[0].speed_range == (1, 12)
+        assert self.pydreo_manager.devices[0].temperature_offset == -2
+
+    def test_async_refresh_devices(self):
+        """Refreshing with the async API reloads state on the event loop without the sync REST path."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        assert self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        self.mock_api.reset_mock()
+
+        async def async_call_dreo_api(api, json_object=None):
+            response, status = self.call_dreo_api(api, json_object)
+            if api == "devicestate":
+                response["data"]["mixed"][WINDLEVEL_KEY]["state"] = fan.fan_speed + 1
+            return response, status
+
+        with patch(PATCH_ASYNC_CALL_DREO_API, side_effect=async_call_dreo_api):
+            assert asyncio.run(self.pydreo_manager.async_refresh_devices()) == [fan]
+
+        assert not self.mock_api.call_args_list
@@ -0,0 +1,74 @@
+"""Tests for command coalescing."""
+# pylint: disable=used-before-assignment
+import asyncio
+import logging
+from concurrent.futures import Future
+from unittest.mock import patch
+from  .imports import * # pylint: disable=W0401,W0614
+from .testbase import TestBase, PATCH_BASE_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+PATCH_SEND_COMMAND_NOW = f'{PATCH_BASE_PATH}.PyDreo._send_command_now'
+
+def _sent_future(*_args) -> Future:
+    future = Future()
+    future.set_result(None)
+    return future
+
+class TestCommandCoalescer(TestBase):
+    """Test coalescing of commands sent to the same device."""
+
+    def test_burst_is_merged(self):
+        """A burst of setter calls becomes one message with the last value per key."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        with patch(PATCH_SEND_COMMAND_NOW, side_effect=_sent_future) as mock_send_command:
+            self.pydreo_manager.command_coalesce_window = 0.05
+            futures = []
+            for speed in (2, 3, 4, 5):
+                futures.append(self.pydreo_manager.send_command(fan, {WINDLEVEL_KEY: speed}))
+            futures.append(self.pydreo_manager.send_command(fan, {POWERON_KEY: True}))
+            for future in futures:
+                future.result(timeout=2)
+
+        mock_send_command.assert_called_once_with(fan, {WINDLEVEL_KEY: 5, POWERON_KEY: True})
+        assert self.pydreo_manager.command_coalescing_stats == {
+            "commands_submitted": 5,
+            "commands_merged": 4,
+            "messages_sent": 1,
+        }
+
+    def test_async_burst_is_merged(self):
+        """Commands sent with the async API are coalesced too."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        async def send_burst():
+            await asyncio.gather(self.pydreo_manager.async_send_command(fan, {WINDLEVEL_KEY: 2}),
+                                 self.pydreo_manager.async_send_command(fan, {WINDLEVEL_KEY: 3}),
+                                 self.pydreo_manager.async_send_command(fan, {POWERON_KEY: True}))
+
+        with patch(PATCH_SEND_COMMAND_NOW, side_effect=_sent_future) as mock_send_command:
+            self.pydreo_manager.command_coalesce_window = 0.05
+            asyncio.run(send_burst())
+
+        mock_send_command.assert_called_once_with(fan, {WINDLEVEL_KEY: 3, POWERON_KEY: True})
+        assert self.pydreo_manager.command_coalescing_stats["commands_merged"] == 2
+
+    def test_disabled_by_default(self):
+        """Without a window each command is sent immediately."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        assert self.pydreo_manager.command_coalesce_window == 0
+
+        with patch(PATCH_SEND_COMMAND_NOW, side_effect=_sent_future) as mock_send_command:
+            self.pydreo_manager.send_command(fan, {WINDLEVEL_KEY: 2})
+            self.pydreo_manager.send_command(fan, {WINDLEVEL_KEY: 3})
+        assert mock_send_command.call_count == 2
+        assert self.pydreo_manager.command_coalescing_stats is None
@@ -0,0 +1,106 @@
+"""Tests for command acknowledgement tracking."""
+# pylint: disable=used-before-assignment
+import logging
+import threading
+from concurrent.futures import Future
+from unittest.mock import patch
+import pytest
+from custom_components.dreo.pydreo.commandtracker import CommandTracker, CommandTimeoutError
+from custom_components.dreo.pydreo.scheduler import Scheduler
+from  .imports import * # pylint: disable=W0401,W0614
+from .testbase import TestBase, PATCH_BASE_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+PATCH_SEND_COMMAND_NOW = f'{PATCH_BASE_PATH}.PyDreo._send_command_now'
+
+def _sent_future(*_args) -> Future:
+    future = Future()
+    future.set_result(None)
+    return future
+
+class TestCommandTracker(TestBase):
+    """Test matching of commands with device reports."""
+
+    def test_report_acknowledges_command(self):
+        """A report containing every key sent completes the command and records its latency."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        with patch(PATCH_SEND_COMMAND_NOW, side_effect=_sent_future):
+            ack = self.pydreo_manager.send_command(fan, {POWERON_KEY: True, WINDLEVEL_KEY: 3}, wait_for_ack=True)
+
+        self.pydreo_manager._transport_consume_message( # pylint: disable=protected-access
+            {"devicesn": fan.serial_number, "method": "report", "reported": {WINDLEVEL_KEY: 3}})
+        assert not ack.done()
+
+        self.pydreo_manager._transport_consume_message( # pylint: disable=protected-access
+            {"devicesn": fan.serial_number, "method": "report", "reported": {POWERON_KEY: True}})
+        assert ack.result(timeout=1) == {POWERON_KEY: True, WINDLEVEL_KEY: 3}
+
+        stats = self.pydreo_manager.command_ack_stats
+        assert stats["commands_acknowledged"] == 1
+        assert stats["commands_pending"] == 0
+        assert stats["latency"]["Tower Fan"]["count"] == 1
+        assert sum(stats["latency"]["Tower Fan"]["buckets"].values()) == 1
+        assert self.pydreo_manager.command_latency_histograms()["Tower Fan"].samples[0] >= 0
+
+    def test_failed_send_stops_tracking(self):
+        """A command that could not be sent is not left pending."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        def _failed_future(*_args) -> Future:
+            future = Future()
+            future.set_exception(ConnectionError())
+            return future
+
+        with patch(PATCH_SEND_COMMAND_NOW, side_effect=_failed_future):
+            ack = self.pydreo_manager.send_command(fan, {WINDLEVEL_KEY: 3}, wait_for_ack=True)
+
+        with pytest.raises(ConnectionError):
+            ack.result(timeout=1)
+        assert self.pydreo_manager.command_ack_stats["commands_pending"] == 0
+
+        # Sending can also raise, e.g. when the transport has not been started.
+        with patch(PATCH_SEND_COMMAND_NOW, side_effect=RuntimeError("Transport disabled")):
+            with pytest.raises(RuntimeError):
+                self.pydreo_manager.send_command(fan, {WINDLEVEL_KEY: 3}, wait_for_ack=True)
+        assert self.pydreo_manager.command_ack_stats["commands_pending"] == 0
+
+    def test_timeout(self):
+        """A command the device never reports fails with CommandTimeoutError."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        tracker = CommandTracker(timeout=0.05)
+        ack = tracker.track(fan, {WINDLEVEL_KEY: 3})
+        with pytest.raises(CommandTimeoutError):
+            ack.result(timeout=2)
+        assert tracker.stats["commands_timed_out"] == 1
+        assert tracker.stats["commands_pending"] == 0
+
+        # A late report is ignored.
+        tracker.resolve(fan.serial_number, {WINDLEVEL_KEY: 3})
+        assert tracker.stats["commands_acknowledged"] == 0
+
+    def test_timeouts_share_one_thread(self):
+        """Pending commands wait for their timeouts on one scheduler thread, not a thread each."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        scheduler = Scheduler()
+        tracker = CommandTracker(timeout=60, scheduler=scheduler)
+        threads_before = threading.active_count()
+        for speed in range(50):
+            tracker.track(fan, {WINDLEVEL_KEY: speed})
+        assert threading.active_count() - threads_before <= 1
+        assert scheduler.pending_count == 50
+
+        tracker.cancel_all()
+        assert tracker.stats["commands_pending"] == 0
@@ -0,0 +1,236 @@
+"""Tests for the WebSocket command transport."""
+# pylint: disable=W0201
+import asyncio
+import itertools
+import json
+import threading
+import time
+from unittest.mock import patch
+import pytest
+from http import HTTPStatus
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.server import serve
+from custom_components.dreo.pydreo.commandtransport import CommandTransport
+from custom_components.dreo.pydreo.reconnectpolicy import ExponentialBackoffPolicy
+
+PATCH_WSS_URL_FORMAT = 'custom_components.dreo.pydreo.commandtransport.DREO_WSS_URL_FORMAT'
+PATCH_API_TIMESTAMP = 'custom_components.dreo.pydreo.commandtransport.Helpers.api_timestamp'
+TEST_WSS_URL_FORMAT = "ws://{0}/websocket?accessToken={1}&timestamp={2}"
+
+class FakeDreoServer:
+    """Local WebSocket server standing in for the Dreo cloud."""
+
+    def __init__(self):
+        self.received : list[str] = []
+        self.connections = []
+        self.paths : list[str] = []
+        self.rejected_tokens : set[str] = set()
+        self.connected = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def _process_request(self, connection, request):
+        self.paths.append(request.path)
+        for token in self.rejected_tokens:
+            if f"accessToken={token}&" in request.path:
+                return connection.respond(HTTPStatus.UNAUTHORIZED, "Invalid token\n")
+        return None
+
+    async def _handler(self, ws):
+        self.connections.append(ws)
+        self.connected.set()
+        async for message in ws:
+            self.received.append(message)
+
+    def start(self) -> str:
+        """Start the server and return its host:port."""
+        async def start_server():
+            return await serve(self._handler, "127.0.0.1", 0, process_request=self._process_request)
+
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(start_server(), self._loop).result()
+        return f"127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    def push(self, message: dict) -> None:
+        """Push a message from the server to the last connected client."""
+        asyncio.run_coroutine_threadsafe(
+            self.connections[-1].send(json.dumps(message)), self._loop).result()
+
+    def drop_connection(self) -> None:
+        """Close the last connection from the server side."""
+        asyncio.run_coroutine_threadsafe(self.connections[-1].close(), self._loop).result()
+
+    def commands(self) -> list[str]:
+        """Return the received messages, without pings."""
+        return [message for message in self.received if message != '2']
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.close()
+        asyncio.run_coroutine_threadsafe(self._server.wait_closed(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    """Wait until condition() is true."""
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+class TestCommandTransport:
+    """Test CommandTransport class."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Start a fake server and a transport connected to it."""
+        self.server = FakeDreoServer()
+        self.address = self.server.start()
+        self.received_messages = []
+        self.token_refreshes = []
+        self.reconnected = threading.Event()
+        self.transport = CommandTransport(self.received_messages.append,
+                                          token_refresh_callback=self._refresh_token,
+                                          reconnect_policy=ExponentialBackoffPolicy(initial_delay=0.01),
+                                          reconnect_callback=self.reconnected.set)
+        timestamps = itertools.count()
+        with patch(PATCH_WSS_URL_FORMAT, TEST_WSS_URL_FORMAT), \
+             patch(PATCH_API_TIMESTAMP, side_effect=lambda: str(next(timestamps))):
+            yield
+        self.transport.stop_transport()
+        self.server.stop()
+
+    def _refresh_token(self) -> str:
+        self.token_refreshes.append(True)
+        return "NEWTOKEN"
+
+    def test_send_before_start(self):
+        """Sending without a started transport raises."""
+        with pytest.raises(RuntimeError):
+            self.transport.send_message("{}")
+
+    def test_send_from_many_threads(self):
+        """Commands from many threads are all sent, in order per thread."""
+        self.transport.start_transport(self.address, "TOKEN")
+
+        futures = {}
+        def send(thread_id: int):
+            futures[thread_id] = [self.transport.send_message(json.dumps({"t": thread_id, "n": n}))
+                                  for n in range(10)]
+
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for thread_futures in futures.values():
+            for future in thread_futures:
+                future.result(timeout=5)
+
+        assert wait_for(lambda: len(self.server.commands()) == 40)
+        commands = [json.loads(command) for command in self.server.commands()]
+        for thread_id in range(4):
+            assert [c["n"] for c in commands if c["t"] == thread_id] == list(range(10))
+
+    def test_async_send_and_receive(self):
+        """Messages can be awaited from another loop and server pushes reach the callback."""
+        self.transport.start_transport(self.address, "TOKEN")
+        asyncio.run(self.transport.async_send_message('{"cmd": 1}'))
+        assert wait_for(lambda: self.server.commands() == ['{"cmd": 1}'])
+
+        self.server.push({"devicesn": "SN", "method": "report", "reported": {"poweron": True}})
+        assert wait_for(lambda: len(self.received_messages) == 1)
+        assert self.received_messages[0]["reported"] == {"poweron": True}
+
+    def test_stop_is_immediate(self):
+        """Stopping closes the socket and joins the thread without waiting for the ping interval."""
+        self.transport.start_transport(self.address, "TOKEN")
+        assert self.server.connected.wait(5)
+
+        start = time.monotonic()
+        assert self.transport.stop_transport(timeout=5) is True
+        assert time.monotonic() - start < 2
+        assert not self.transport._event_thread.is_alive() # pylint: disable=protected-access
+        with pytest.raises(RuntimeError):
+            self.transport.send_message("{}")
+
+    def test_stop_while_sending(self):
+        """Stopping fails the command being sent as well as the queued ones."""
+        sending = threading.Event()
+
+        async def blocked_send(ws, message, *args, **kwargs): # pylint: disable=unused-argument
+            if message == '2':
+                return
+            sending.set()
+            await asyncio.Event().wait()
+
+        self.transport.start_transport(self.address, "TOKEN")
+        assert self.server.connected.wait(5)
+        with patch.object(ClientConnection, "send", blocked_send):
+            in_flight = self.transport.send_message('{"cmd": 1}')
+            assert sending.wait(5)
+            queued = self.transport.send_message('{"cmd": 2}')
+            assert self.transport.stop_transport(timeout=5) is True
+
+        for future in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="stopped"):
+                future.result(timeout=5)
+
+    def test_async_stop_while_connecting(self):
+        """Stopping while the transport cannot connect cancels the connection attempts."""
+        self.transport.start_transport("127.0.0.1:1", "TOKEN")
+        time.sleep(0.1)
+        start = time.monotonic()
+        assert asyncio.run(self.transport.async_stop_transport(timeout=5)) is True
+        assert time.monotonic() - start < 2
+
+    def test_reconnect_uses_fresh_url(self):
+        """After the server drops the connection the transport reconnects with a new timestamp."""
+        self.transport.start_transport(self.address, "TOKEN")
+        assert self.server.connected.wait(5)
+        self.server.drop_connection()
+
+        assert wait_for(lambda: len(self.server.connections) == 2)
+        assert self.server.paths[0] != self.server.paths[1]
+        assert self.reconnected.wait(5)
+        assert wait_for(lambda: self.transport.stats.reconnects == 1)
+        stats = self.transport.stats.as_dict()
+        assert stats["connects"] == 2
+        assert stats["current_downtime"] == 0
+        assert stats["total_downtime"] > 0
+
+    def test_backoff_after_dropped_connections(self):
+        """Connections dropped before they are stable keep backing off instead of reconnecting at once."""
+        self.transport.start_transport(self.address, "TOKEN")
+        for connections in range(1, 4):
+            assert wait_for(lambda count=connections: len(self.server.connections) == count)
+            self.server.drop_connection()
+        assert wait_for(lambda: len(self.server.connections) == 4)
+        assert self.transport.reconnect_policy.attempts == 3
+
+    def test_token_refreshed_on_auth_failure(self):
+        """A rejected token triggers the refresh callback and the next attempt uses the new token."""
+        self.server.rejected_tokens.add("OLDTOKEN")
+        self.transport.start_transport(self.address, "OLDTOKEN")
+
+        assert self.server.connected.wait(5)
+        assert self.token_refreshes == [True]
+        assert "accessToken=NEWTOKEN&" in self.server.paths[-1]
+        stats = self.transport.stats.as_dict()
+        assert stats["auth_failures"] == 1
+        assert stats["token_refreshes"] == 1
+        assert stats["reconnects"] == 0
+        assert not self.reconnected.is_set()
+
+def test_exponential_backoff_policy():
+    """Delays grow by the factor up to the maximum and stop after max_attempts."""
+    policy = ExponentialBackoffPolicy(initial_delay=1, max_delay=5, factor=2, jitter=0, max_attempts=5)
+    assert [policy.next_delay() for _ in range(5)] == [1, 2, 4, 5, 5]
+    assert policy.next_delay() is None
+    policy.reset()
+    assert policy.next_delay() == 1
+
+    jittered = ExponentialBackoffPolicy(initial_delay=10, jitter=0.5)
+    assert 5 <= jittered.next_delay() <= 10
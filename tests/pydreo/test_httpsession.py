@@ -0,0 +1,72 @@
+"""Tests for the pooled HTTP session."""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import aiohttp
+import pytest
+from custom_components.dreo.pydreo.helpers import Helpers
+from custom_components.dreo.pydreo.httpsession import HttpSession
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return a successful Dreo-style response."""
+        body = json.dumps({"code": 0, "data": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+class TestHttpSession:
+    """Test HttpSession class."""
+
+    @pytest.fixture
+    def server_url(self):
+        """Run a local keep-alive HTTP server."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    def test_connection_reuse(self, server_url):
+        """Sequential calls through the session reuse one connection."""
+        session = HttpSession(pool_size=2)
+        for _ in range(5):
+            response, status_code = Helpers.call_api(server_url, "/api/test", "get", {}, {}, session)
+            assert status_code == 200
+            assert Helpers.code_check(response)
+
+        assert session.stats.as_dict() == {
+            "requests": 5,
+            "connections_opened": 1,
+            "connections_reused": 4,
+        }
+        session.close()
+
+    def test_session_usable_after_close(self, server_url):
+        """Closing the session drops pooled connections but keeps it usable."""
+        session = HttpSession()
+        Helpers.call_api(server_url, "/api/test", "get", {}, {}, session)
+        session.close()
+        _, status_code = Helpers.call_api(server_url, "/api/test", "get", {}, {}, session)
+        assert status_code == 200
+        assert session.stats.connections_opened == 2
+
+    def test_async_call_api(self, server_url):
+        """The aiohttp based call returns the same tuple as call_api()."""
+        async def run():
+            async with aiohttp.ClientSession() as session:
+                return await Helpers.async_call_api(server_url, "/api/test", "get", {}, {}, session)
+
+        response, status_code = asyncio.run(run())
+        assert status_code == 200
+        assert Helpers.code_check(response)
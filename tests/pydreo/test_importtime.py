@@ -0,0 +1,34 @@
+"""Tests for what importing pydreo loads."""
+import os
+import subprocess
+import sys
+
+PYDREO_PARENT = os.path.join(os.path.dirname(__file__), "..", "..", "custom_components", "dreo")
+
+def _imported_modules(code: str) -> set[str]:
+    """Run code in a new interpreter and return the modules it imported."""
+    result = subprocess.run([sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+                            cwd=PYDREO_PARENT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+class TestImportTime:
+    """Test that transports and device classes are imported when first used."""
+
+    def test_import_is_lazy(self):
+        """Importing pydreo does not import the HTTP or WebSocket libraries or device modules."""
+        modules = _imported_modules("import pydreo")
+        assert "pydreo" in modules
+        for module in ("requests", "urllib3", "websockets", "pydreo.pydreotowerfan", "pydreo.pydreoairconditioner"):
+            assert module not in modules
+
+    def test_device_class_is_imported_on_access(self):
+        """A device class is imported by its module when accessed on the package."""
+        modules = _imported_modules("import pydreo\nassert pydreo.PyDreoTowerFan.__name__ == 'PyDreoTowerFan'")
+        assert "pydreo.pydreotowerfan" in modules
+        assert "pydreo.pydreoairconditioner" not in modules
+
+    def test_star_import_is_lazy(self):
+        """A star import of pydreo does not import the device modules."""
+        modules = _imported_modules("from pydreo import *")
+        assert "pydreo.pydreotowerfan" not in modules
+        assert "pydreo.pydreoairconditioner" not in modules
@@ -0,0 +1,138 @@
+"""Tests for dispatching WebSocket messages off the socket thread."""
+# pylint: disable=used-before-assignment
+import logging
+import threading
+from custom_components.dreo.pydreo.messagedispatcher import MessageDispatcher
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+def _report(serial_number: str, **reported) -> dict:
+    return {"devicesn": serial_number, "method": "report", "reported": reported}
+
+class TestMessageDispatcher:
+    """Test MessageDispatcher ordering, merging and backpressure."""
+
+    def test_burst_is_merged_in_order(self):
+        """Waiting reports for a device collapse into one; order per device is kept."""
+        handled = []
+        done = threading.Event()
+
+        def handler(message):
+            handled.append(message)
+            if len(handled) == 4:
+                done.set()
+
+        dispatcher = MessageDispatcher(handler)
+        first = _report("A", windlevel=1)
+        dispatcher.submit(first)
+        dispatcher.submit(_report("A", windlevel=2, poweron=True))
+        dispatcher.submit(_report("B", windlevel=5))
+        dispatcher.submit({"devicesn": "A", "method": "control-reply"})
+        dispatcher.submit(_report("A", windlevel=3))
+        dispatcher.submit(_report("B", poweron=False))
+        assert dispatcher.queue_depth == 4
+        assert first["reported"] == {"windlevel": 1}
+
+        dispatcher.start()
+        assert done.wait(2)
+        assert dispatcher.stop()
+
+        assert handled == [
+            _report("A", windlevel=2, poweron=True),
+            _report("B", windlevel=5, poweron=False),
+            {"devicesn": "A", "method": "control-reply"},
+            _report("A", windlevel=3),
+        ]
+        stats = dispatcher.stats
+        assert stats["messages_received"] == 6
+        assert stats["messages_merged"] == 2
+        assert stats["messages_dispatched"] == 4
+        assert stats["messages_dropped"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 4
+
+    def test_slow_handler_does_not_block_submit(self):
+        """Messages are queued while the handler is busy and dropped when the queue is full."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def handler(_message):
+            started.set()
+            release.wait(2)
+
+        dispatcher = MessageDispatcher(handler, max_pending=2)
+        dispatcher.start()
+        dispatcher.submit(_report("A", windlevel=1))
+        assert started.wait(2)
+
+        dispatcher.submit({"devicesn": "A", "method": "other"})
+        dispatcher.submit(_report("B", windlevel=1))
+        dispatcher.submit({"devicesn": "C", "method": "other"})
+        # A report for a device with a report waiting is merged even when the queue is full.
+        dispatcher.submit(_report("B", windlevel=2))
+        assert dispatcher.stats["messages_dropped"] == 1
+        assert dispatcher.stats["messages_merged"] == 1
+
+        release.set()
+        assert dispatcher.stop()
+
+    def test_restart_waits_for_previous_worker(self):
+        """Starting again while the stopped worker is still in a handler does not start a second worker."""
+        release = threading.Event()
+        started = threading.Event()
+        handled = []
+
+        def handler(message):
+            started.set()
+            release.wait(2)
+            handled.append(message)
+
+        dispatcher = MessageDispatcher(handler)
+        dispatcher.start()
+        dispatcher.submit(_report("A", windlevel=1))
+        assert started.wait(2)
+        assert not dispatcher.stop(timeout=0.05)
+
+        dispatcher.start()
+        assert [t.name for t in threading.enumerate()].count("DreoMessageDispatcher") == 1
+
+        release.set()
+        assert dispatcher.stop()
+        assert handled == [_report("A", windlevel=1)]
+
+        # Once the old worker has exited, a new one can start.
+        dispatcher.start()
+        assert [t.name for t in threading.enumerate()].count("DreoMessageDispatcher") == 1
+        assert dispatcher.stop()
+
+    def test_merging_keeps_timestamps(self):
+        """Reports are merged only if the merged timestamp is right for every value, so the
+        device can still drop stale values."""
+        handled = []
+        done = threading.Event()
+
+        def handler(message):
+            handled.append(message)
+            if len(handled) == 3:
+                done.set()
+
+        dispatcher = MessageDispatcher(handler)
+        dispatcher.submit(dict(_report("A", windlevel=1), timestamp=2000))
+        # Older than the waiting report.
+        dispatcher.submit(dict(_report("A", windlevel=2), timestamp=1000))
+        # Newer, but merging would date windlevel=2 to 3000.
+        dispatcher.submit(dict(_report("A", poweron=True), timestamp=3000))
+        # Newer and replaces every waiting value.
+        dispatcher.submit(dict(_report("A", windlevel=3, poweron=False), timestamp=4000))
+        assert dispatcher.queue_depth == 3
+        assert dispatcher.stats["messages_merged"] == 1
+
+        dispatcher.start()
+        assert done.wait(2)
+        assert dispatcher.stop()
+        assert handled == [
+            dict(_report("A", windlevel=1), timestamp=2000),
+            dict(_report("A", windlevel=2), timestamp=1000),
+            dict(_report("A", windlevel=3, poweron=False), timestamp=4000),
+        ]
@@ -6,7 +6,8 @@ import pytest
 from  .imports import * # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND
 
-from custom_components.dreo.pydreo import PyDreoAC
+from custom_components.dreo.pydreo.pydreoairconditioner import PyDreoAC
+from custom_components.dreo.pydreo.pydreoairconditioner import DREO_AC_MODE_COOL, DREO_AC_MODE_ECO
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -45,4 +46,38 @@ class TestPyDreoAirConditioner(TestBase):
 
         # TODO: Fix this in the AC class
         # with pytest.raises(ValueError):
-        #    ac.preset_mode = 'not_a_mode'
\ No newline at end of file
+        #    ac.preset_mode = 'not_a_mode'
+
+
+    def test_HAC006S_state_snapshot(self): # pylint: disable=invalid-name
+        """Test that decoding publishes a consistent, versioned state snapshot."""
+        self.get_devices_file_name = "get_devices_HAC006S.json"
+        self.pydreo_manager.load_devices()
+        ac : PyDreoAC = self.pydreo_manager.devices[0]
+
+        snapshot = ac.state_snapshot
+        assert snapshot.version >= 1
+        assert snapshot["mode"] == ac.mode
+        assert snapshot["preset_mode"] == PRESET_NONE
+        # Only declared state is copied, not bookkeeping such as the raw REST response.
+        assert "raw_state" not in snapshot.values
+        assert not any(name.startswith("_") for name in snapshot.values)
+
+        # Eco is reported as a mode, and sets both the mode and the preset.
+        ac.handle_server_update_base({REPORTED_KEY: {MODE_KEY: DREO_AC_MODE_ECO}})
+        eco_snapshot = ac.state_snapshot
+        assert eco_snapshot.version == snapshot.version + 1
+        assert (eco_snapshot["mode"], eco_snapshot["preset_mode"]) == (DREO_AC_MODE_COOL, PRESET_ECO)
+        assert eco_snapshot.changed_since(snapshot) == {"preset_mode"}
+        # Earlier snapshots are not modified.
+        assert snapshot["preset_mode"] == PRESET_NONE
+
+        # Reports that change nothing keep the version, so consumers can skip them.
+        ac.handle_server_update_base({REPORTED_KEY: {MODE_KEY: DREO_AC_MODE_ECO}})
+        assert ac.state_snapshot is eco_snapshot
+        assert not ac.state_snapshot.changed_since(eco_snapshot)
+
+        with patch(PATCH_SEND_COMMAND):
+            ac.preset_mode = PRESET_SLEEP
+        assert ac.state_snapshot.version == eco_snapshot.version + 1
+        assert ac.state_snapshot["preset_mode"] == PRESET_SLEEP
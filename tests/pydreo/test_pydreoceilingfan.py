@@ -3,6 +3,7 @@
 import logging
 from unittest.mock import patch
 import pytest
+from custom_components.dreo.pydreo.pydreoceilingfan import PyDreoCeilingFan
 from  .imports import * # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND
 
@@ -25,6 +26,7 @@ class TestPyDreoCeilingFan(TestBase):
         assert fan.is_feature_supported('light_on') is True
         assert fan.is_feature_supported('brightness') is True
         assert fan.is_feature_supported('color_temperature') is True
+        assert fan.capabilities.platforms == {"fan", "light", "sensor", "switch", "number"}
         assert fan.brightness == 64
         assert fan.color_temperature == 25
 
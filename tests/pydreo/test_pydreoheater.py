@@ -1,8 +1,9 @@
 """Tests for Dreo Fans"""
 # pylint: disable=used-before-assignment
 import logging
-from unittest.mock import patch, call
+from unittest.mock import patch
 import pytest
+from custom_components.dreo.pydreo.pydreoheater import PyDreoHeater
 from  .imports import * # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND
 
@@ -28,7 +29,22 @@ class TestPyDreoHeater(TestBase):
 
         with (patch(PATCH_SEND_COMMAND) as mock_send_command):
             heater.preset_mode = 'H1'
-            mock_send_command.assert_has_calls([call(heater, {HTALEVEL_KEY: 1})], True)
+            mock_send_command.assert_called_once_with(heater, {MODE_KEY: HEATER_MODE_HOTAIR, HTALEVEL_KEY: 1})
 
         with pytest.raises(ValueError):
             heater.preset_mode = 'not_a_mode'
+
+    def test_HSH009S_server_update(self): # pylint: disable=invalid-name
+        """Test decoding WebSocket reports."""
+
+        self.get_devices_file_name = "get_devices_HSH009S.json"
+        self.pydreo_manager.load_devices()
+        heater : PyDreoHeater = self.pydreo_manager.devices[0]
+
+        heater.handle_server_update({REPORTED_KEY: {TIMERON_KEY: {"du": 30, "sw": True}, MODE_KEY: ""}})
+        assert heater._timer_on == 30 # pylint: disable=protected-access
+        assert heater.mode == HEATER_MODE_OFF
+
+        heater.handle_server_update({REPORTED_KEY: {MODE_KEY: HEATER_MODE_HOTAIR, POWERON_KEY: False}})
+        assert heater.poweron is False
+        assert heater.mode == HEATER_MODE_OFF
@@ -2,6 +2,7 @@
 # pylint: disable=used-before-assignment
 import logging
 from unittest.mock import patch
+from custom_components.dreo.pydreo.pydreohumidifier import PyDreoHumidifier
 from  .imports import * # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND
 
@@ -1,8 +1,10 @@
 """Tests for Dreo Fans"""
 # pylint: disable=used-before-assignment
+import json
 import logging
 from unittest.mock import patch
 import pytest
+from custom_components.dreo.pydreo.pydreotowerfan import PyDreoTowerFan
 from  .imports import * # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND
 
@@ -43,6 +45,196 @@ class TestPyDreoTowerFan(TestBase):
         with pytest.raises(ValueError):
             fan.fan_speed = 13
 
+        with patch(PATCH_SEND_COMMAND) as mock_send_command:
+            with fan.command_batch():
+                fan.is_on = True
+                with fan.command_batch():
+                    fan.preset_mode = 'normal'
+                fan.fan_speed = 3
+            mock_send_command.assert_called_once_with(fan, {POWERON_KEY: True, WINDTYPE_KEY: 1, WINDLEVEL_KEY: 3})
+
+        with patch(PATCH_SEND_COMMAND) as mock_send_command:
+            with pytest.raises(ValueError):
+                with fan.command_batch():
+                    fan.is_on = True
+                    fan.fan_speed = 13
+            mock_send_command.assert_not_called()
+
+        with patch(PATCH_SEND_COMMAND) as mock_send_command:
+            fan.send_commands({POWERON_KEY: True, WINDLEVEL_KEY: 2})
+            mock_send_command.assert_called_once_with(fan, {POWERON_KEY: True, WINDLEVEL_KEY: 2})
+
+    def test_HTF005S_capabilities(self):  # pylint: disable=invalid-name
+        """Capabilities are worked out once per state load."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        capabilities = fan.capabilities
+        assert capabilities.device_type == DreoDeviceType.TOWER_FAN
+        assert {"oscillating", "temperature_offset", "preset_modes"} <= capabilities.features
+        assert "name" not in capabilities.features
+        assert capabilities.ranges["speed_range"] == (1, 12)
+        assert fan.is_feature_supported("oscillating") is True
+        assert fan.is_feature_supported("not_a_feature") is False
+        assert capabilities.platforms == {"fan", "sensor", "switch", "number"}
+        assert fan.capabilities is capabilities
+
+        with patch.object(fan, "_compute_capabilities", wraps=fan._compute_capabilities) as compute: # pylint: disable=protected-access
+            fan.load_state(fan.raw_state[DATA_KEY][MIXED_KEY])
+            compute.assert_called_once()
+            assert fan.capabilities is not capabilities
+            assert fan.capabilities.features == capabilities.features
+            compute.assert_called_once()
+
+    def test_HTF005S_settings_cache(self):  # pylint: disable=invalid-name
+        """Test that settings are read once after the devices are created, then from the cache."""
+
+        def setting_api_calls():
+            return [call for call in self.mock_api.call_args_list if call.args[0].startswith("setting")]
+
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        assert fan.required_settings == {DreoDeviceSetting.FAN_TEMP_OFFSET: 0}
+        assert fan.temperature_offset == -2
+        assert len(setting_api_calls()) == 1
+
+        # Fresh settings are not read again.
+        assert int(self.pydreo_manager.get_device_setting(fan, DreoDeviceSetting.FAN_TEMP_OFFSET)) == -2
+        assert not self.pydreo_manager.prefetch_settings(self.pydreo_manager.devices)
+        assert len(setting_api_calls()) == 1
+        assert self.pydreo_manager.settings_cache_stats["hits"] == 1
+
+        # Setting a value writes it through to the cache and the device.
+        call_dreo_api = self.mock_api.side_effect
+        self.mock_api.side_effect = lambda api, json_object=None: (
+            ({"code": 0, "data": {}}, 200) if api == "setting_put" else call_dreo_api(api, json_object))
+        changes = []
+        fan.add_attr_callback(changes.append, with_changes=True)
+        fan.temperature_offset = 3
+        assert fan.temperature_offset == 3
+        assert changes == [{"temperature_offset"}]
+        assert int(self.pydreo_manager.get_device_setting(fan, DreoDeviceSetting.FAN_TEMP_OFFSET)) == 3
+        assert len(setting_api_calls()) == 2
+
+        # Expired settings are read again.
+        self.pydreo_manager._settings_cache.ttl = 0 # pylint: disable=protected-access
+        assert self.pydreo_manager.prefetch_settings(self.pydreo_manager.devices) == [fan]
+        assert fan.temperature_offset == -2
+        assert len(setting_api_calls()) == 3
+
+    def test_HTF010S_server_update(self):  # pylint: disable=invalid-name
+        """Test that WebSocket reports update only the keys they contain."""
+
+        self.get_devices_file_name = "get_devices_HTF010S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        assert fan.oscillating is True
+        assert fan.fan_speed != 7
+
+        fan.handle_server_update({REPORTED_KEY: {OSCILLATION_KEY: False, WINDLEVEL_KEY: 7}})
+        assert fan.oscillating is False
+        assert fan.fan_speed == 7
+        assert fan.is_on is not None
+
+        # Values of the wrong type and unknown keys are ignored.
+        fan.handle_server_update({REPORTED_KEY: {WINDLEVEL_KEY: "fast", "unknownkey": 1}})
+        assert fan.fan_speed == 7
+
+        callbacks = []
+        changes = []
+        fan.add_attr_callback(lambda: callbacks.append(fan))
+        fan.add_attr_callback(changes.append, with_changes=True)
+
+        # Reports that change nothing do not run callbacks.
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 7, OSCILLATION_KEY: False}})
+        assert not callbacks
+        assert not changes
+
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 8, OSCILLATION_KEY: False}})
+        assert callbacks == [fan]
+        assert changes == [{"fan_speed"}]
+
+        oscillating_changes = []
+        unsubscribe = fan.subscribe(["oscillating"], lambda: oscillating_changes.append(fan.oscillating))
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 9}})
+        assert not oscillating_changes
+        fan.handle_server_update_base({REPORTED_KEY: {OSCILLATION_KEY: True}})
+        assert oscillating_changes == [True]
+
+        unsubscribe()
+        fan.handle_server_update_base({REPORTED_KEY: {OSCILLATION_KEY: False}})
+        assert oscillating_changes == [True]
+
+    def test_HTF010S_stale_reports(self):  # pylint: disable=invalid-name
+        """Test that reports older than the applied state, or applied already, are dropped."""
+
+        self.get_devices_file_name = "get_devices_HTF010S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        # The REST state was reported at 1743285953 (seconds); reports carry milliseconds.
+        rest_time = 1743285953000
+        assert fan.fan_speed == 6
+
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 2}, "timestamp": rest_time - 5000})
+        assert fan.fan_speed == 6
+        assert fan.stale_values_dropped == 1
+
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 7, OSCILLATION_KEY: False},
+                                       "timestamp": rest_time + 1000})
+        assert fan.fan_speed == 7
+        assert fan.oscillating is False
+
+        # The same report delivered again, and an older one, change nothing.
+        changes = []
+        fan.add_attr_callback(changes.append, with_changes=True)
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 7, OSCILLATION_KEY: False},
+                                       "timestamp": rest_time + 1000})
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 3}, "timestamp": rest_time + 500})
+        assert fan.fan_speed == 7
+        assert fan.duplicate_values_dropped == 2
+        assert fan.stale_values_dropped == 2
+        assert not changes
+
+        # Only the stale key of a report is dropped; reports without a timestamp are applied.
+        assert fan.is_on is False
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 4, POWERON_KEY: True},
+                                       "timestamp": str(rest_time + 800)})
+        assert fan.fan_speed == 7
+        assert fan.is_on is True
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 5}})
+        assert fan.fan_speed == 5
+
+    def test_HTF010S_startup_cache(self):  # pylint: disable=invalid-name
+        """Test that devices start from the cached device list and state without calling the cloud."""
+
+        self.get_devices_file_name = "get_devices_HTF010S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        fan.handle_server_update_base({REPORTED_KEY: {WINDLEVEL_KEY: 9}, "timestamp": 1743285960000})
+        cache = json.loads(json.dumps(self.pydreo_manager.export_cache()))
+
+        cached_manager = PyDreo('EMAIL', 'PASSWORD', redact=True)
+        cached_manager.enabled = True
+        self.mock_api.reset_mock()
+        assert cached_manager.load_devices_from_cache(cache)
+        self.mock_api.assert_not_called()
+        assert cached_manager.loaded_from_cache
+        cached_fan = cached_manager.devices[0]
+        assert cached_fan.serial_number == fan.serial_number
+        assert cached_fan.fan_speed == 9
+        assert cached_fan.oscillating == fan.oscillating
+
+        # Refreshing loads the current state from the cloud and runs callbacks for the change.
+        changes = []
+        cached_fan.add_attr_callback(changes.append, with_changes=True)
+        assert cached_manager.refresh_devices() == [cached_fan]
+        assert cached_fan.fan_speed == 6
+        assert changes == [{"fan_speed"}]
+
+        assert not cached_manager.load_devices_from_cache({**cache, "version": 0})
+
     def test_HTF010S(self):  # pylint: disable=invalid-name
         """Load fan and test sending commands."""
 
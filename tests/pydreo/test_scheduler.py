@@ -0,0 +1,57 @@
+"""Tests for the shared timer thread."""
+import threading
+import time
+from custom_components.dreo.pydreo.scheduler import Scheduler
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    """Wait until condition() is true."""
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+class TestScheduler:
+    """Test Scheduler class."""
+
+    def test_calls_run_in_deadline_order_on_one_thread(self):
+        """Calls run when due, in deadline order, all on the same thread."""
+        scheduler = Scheduler()
+        calls = []
+        threads = set()
+
+        def record(name):
+            calls.append(name)
+            threads.add(threading.current_thread())
+
+        for name, delay in (("c", 0.15), ("a", 0.05), ("b", 0.1)):
+            scheduler.call_later(delay, record, name)
+
+        assert wait_for(lambda: len(calls) == 3)
+        assert calls == ["a", "b", "c"]
+        assert len(threads) == 1
+        assert threading.current_thread() not in threads
+
+    def test_cancelled_call_does_not_run(self):
+        """A cancelled call is discarded and the thread exits once nothing is left."""
+        scheduler = Scheduler()
+        calls = []
+        scheduler.call_later(0.05, calls.append, "cancelled").cancel()
+        scheduler.call_later(0.1, calls.append, "run")
+
+        assert wait_for(lambda: calls == ["run"])
+        assert wait_for(lambda: scheduler._thread is None) # pylint: disable=protected-access
+        assert scheduler.pending_count == 0
+
+        scheduler.call_later(0, calls.append, "restarted")
+        assert wait_for(lambda: calls == ["run", "restarted"])
+
+    def test_error_in_call_does_not_stop_others(self):
+        """An exception in one callback is logged and later calls still run."""
+        scheduler = Scheduler()
+        calls = []
+        scheduler.call_later(0, lambda: 1 / 0)
+        scheduler.call_later(0.05, calls.append, "after")
+
+        assert wait_for(lambda: calls == ["after"])
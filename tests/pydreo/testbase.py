@@ -16,6 +16,7 @@ API_REPONSE_BASE_PATH = 'tests/pydreo/api_responses/'
 PATCH_BASE_PATH = 'custom_components.dreo.pydreo'
 PATCH_SEND_COMMAND = f'{PATCH_BASE_PATH}.PyDreo.send_command'
 PATCH_CALL_DREO_API = f'{PATCH_BASE_PATH}.PyDreo.call_dreo_api'
+PATCH_ASYNC_CALL_DREO_API = f'{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api'
 
 Defaults = defaults.Defaults
 